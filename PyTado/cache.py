@@ -0,0 +1,251 @@
+"""
+Response cache and request coalescing for the API clients.
+
+`Http` and `AsyncHttp` accept a `ResponseCache` which keeps the parsed responses of
+GET requests for a time to live (TTL) depending on the kind of data. Writes (PUT, POST,
+PATCH, DELETE) drop the cached responses they may have changed.
+
+Independent of the cache, concurrent identical GET requests of one client share a
+single request and its parsed response (`SingleFlight`/`AsyncSingleFlight`).
+
+Example usage: http = Http(cache=ResponseCache())
+               tado = Tado.from_http(http)
+"""
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from PyTado.http import TadoRequest  # pragma: no cover
+
+T = TypeVar("T")
+
+CacheKey = tuple[Hashable, ...]
+
+# (command pattern, ttl in seconds), the first pattern matching the whole command wins
+DEFAULT_TTLS: tuple[tuple[str, float], ...] = (
+    # zone/room and device metadata, changes when the installation changes
+    (r"zones|roomsAndDevices|devices|heatingCircuits|zones/\d+/capabilities", 6 * 3600),
+    (r"zones/\d+/defaultOverlay|zones/\d+/control", 3600),
+    # state, changes with every schedule block, overlay or sensor reading
+    (r"zoneStates|rooms|zones/\d+/state|rooms/\d+|state|airComfort|weather", 10),
+)
+
+_ZONE_COMMAND = re.compile(r"(?:zones|rooms)/(\d+)(?:/|$)")
+
+
+def request_key(request: "TadoRequest", home_id: int | None = None) -> CacheKey:
+    """Cache key of a request: home, endpoint, domain, device, command and params"""
+    params = tuple(sorted((request.params or {}).items()))
+    return (
+        home_id,
+        str(request.endpoint),
+        str(request.domain),
+        request.device,
+        request.command or "",
+        params,
+    )
+
+
+def zone_of(request: "TadoRequest") -> int | None:
+    """Id of the zone/room a request refers to, None for home or device requests"""
+    match = _ZONE_COMMAND.match(request.command or "")
+    return int(match.group(1)) if match else None
+
+
+class ResponseCache:
+    """Bounded LRU cache of parsed GET responses with a TTL per kind of request.
+
+    Cached responses are shared between callers and must not be modified.
+
+    Subclasses can override `ttl_for` to plug in their own caching policy.
+    """
+
+    def __init__(
+        self,
+        ttls: Sequence[tuple[str, float]] = DEFAULT_TTLS,
+        default_ttl: float | None = None,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ttls: (command pattern, ttl in seconds) pairs, see `DEFAULT_TTLS`.
+            default_ttl: TTL of requests matching no pattern, None to not cache them.
+            max_entries: Maximum number of cached responses, the least recently used
+                response is evicted first.
+            clock: Monotonic clock in seconds, can be replaced in tests.
+        """
+        self._ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+
+        # key -> (expires at, zone id, response)
+        self._entries: OrderedDict[CacheKey, tuple[float, int | None, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, request: "TadoRequest") -> float | None:
+        """TTL in seconds for the response of a GET request, None to not cache it"""
+        command = request.command or ""
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(command):
+                return ttl
+        return self._default_ttl
+
+    def get(self, request: "TadoRequest", home_id: int | None = None) -> Any | None:
+        """Returns the cached response of a GET request, None if there is none"""
+        key = request_key(request, home_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(
+        self, request: "TadoRequest", response: Any, home_id: int | None = None
+    ) -> None:
+        """Caches the response of a GET request, if its kind of request is cached"""
+        ttl = self.ttl_for(request)
+        if ttl is None or ttl <= 0:
+            return
+
+        key = request_key(request, home_id)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, zone_of(request), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, request: "TadoRequest", home_id: int | None = None) -> None:
+        """
+        Drops the cached responses a write request may have changed.
+
+        A write to a zone/room drops the responses of that zone and the home wide
+        responses (e.g. zoneStates) of the home, any other write drops all responses
+        of the home.
+        """
+        zone = zone_of(request)
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] != home_id:
+                    continue
+                entry_zone = self._entries[key][1]
+                if zone is None or entry_zone is None or entry_zone == zone:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Call:
+    """An in-flight call of `SingleFlight`"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Lets concurrent threads calling with the same key share one call and its result.
+
+    The result is shared between the callers and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[CacheKey, _Call] = {}
+
+        self.shared = 0
+
+    def do(self, key: CacheKey, fn: Callable[[], T]) -> T:
+        """Calls `fn`, unless a call with the same key is in flight, then waits for it"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+        return call.result  # type: ignore[no-any-return]
+
+    def forget(self) -> None:
+        """
+        Lets later callers start new calls instead of joining the calls in flight,
+        e.g. after a write changed the data they read.
+        """
+        with self._lock:
+            self._calls.clear()
+
+
+class AsyncSingleFlight:
+    """Lets concurrent tasks calling with the same key share one call and its result.
+
+    See `SingleFlight`. A waiting task being cancelled does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[CacheKey, asyncio.Future[Any]] = {}
+
+        self.shared = 0
+
+    async def do(self, key: CacheKey, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `fn`, unless a call with the same key is in flight, then waits for it"""
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(call)
+
+    def _done(self, key: CacheKey, call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def forget(self) -> None:
+        """See `SingleFlight.forget`"""
+        self._calls.clear()
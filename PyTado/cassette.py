@@ -0,0 +1,238 @@
+"""
+Record and replay the HTTP traffic of `Http`.
+
+A cassette is a JSON lines file with one request/response pair per line. Tokens and
+device codes are redacted from URLs, request bodies and response bodies before they are
+written, the `Authorization` header and other request headers are not written at all.
+
+Requests are matched by method, (redacted) URL and a hash of the (redacted) body. Replay
+indexes the file offsets of the entries by key once, on the first replayed request, and
+reads an entry only when it is replayed, so a lookup stays O(1) for large cassettes. Requests
+recorded several times (e.g. polling) are replayed in the recorded order, the last
+response is repeated once they are used up.
+
+Example usage: with Cassette("traffic.jsonl") as cassette:
+                   tado = Tado(transport=cassette.recorder())  # record
+               with Cassette("traffic.jsonl") as cassette:
+                   tado = Tado(saved_refresh_token="any", transport=cassette.player())
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable
+from typing import IO, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+import requests.adapters
+from requests.structures import CaseInsensitiveDict
+
+from PyTado.exceptions import TadoException
+from PyTado.http import default_retry
+
+REDACTED = "REDACTED"
+REDACTED_FIELDS = frozenset(
+    {"access_token", "refresh_token", "id_token", "device_code", "user_code", "authKey"}
+)
+# response headers worth replaying, all others are dropped
+RECORDED_HEADERS = ("Content-Type", "RateLimit-Policy", "RateLimit", "Retry-After")
+
+
+@functools.lru_cache(maxsize=8)
+def _json_fields(fields: frozenset[str]) -> re.Pattern[str]:
+    names = "|".join(map(re.escape, sorted(fields)))
+    return re.compile(rf'"({names})"\s*:\s*"[^"]*"')
+
+
+def _redact_pairs(pairs: Iterable[tuple[str, str]], fields: frozenset[str]) -> str:
+    return urlencode([(k, REDACTED if k in fields else v) for k, v in pairs])
+
+
+def redact_url(url: str, fields: frozenset[str] = REDACTED_FIELDS) -> str:
+    """URL with the values of the redacted query parameters replaced"""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = _redact_pairs(parse_qsl(parts.query, keep_blank_values=True), fields)
+    return urlunsplit(parts._replace(query=query))
+
+
+def redact_body(body: str, fields: frozenset[str] = REDACTED_FIELDS) -> str:
+    """JSON or form encoded body with the values of the redacted fields replaced"""
+    if not body:
+        return body
+    if body.lstrip()[:1] in ("{", "["):
+        return _json_fields(fields).sub(lambda m: f'"{m.group(1)}": "{REDACTED}"', body)
+    if "=" in body:
+        return _redact_pairs(parse_qsl(body, keep_blank_values=True), fields)
+    return body
+
+
+def request_key(method: str, url: str, body: str) -> str:
+    """Key of a (redacted) request: method, URL and hash of the body"""
+    digest = hashlib.sha256(body.encode()).hexdigest()[:16] if body else "-"
+    return f"{method.upper()} {url} {digest}"
+
+
+def _body_text(body: bytes | str | None) -> str:
+    if body is None:
+        return ""
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="replace")
+    return str(body)
+
+
+class Cassette:
+    """Request/response pairs of `Http` in a JSON lines file.
+
+    Thread safe, a cassette can be shared by the threads using one client.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], redact: Iterable[str] = REDACTED_FIELDS
+    ) -> None:
+        """
+        Args:
+            path: The cassette file, created when recording.
+            redact: Names of the JSON fields and query/form parameters to redact.
+        """
+        self.path = os.fspath(path)
+        self._redact = frozenset(redact)
+        self._lock = threading.Lock()
+        self._writer: IO[str] | None = None
+        self._reader: IO[bytes] | None = None
+        # key -> file offsets of the entries, and the number replayed per key
+        self._index: dict[str, list[int]] | None = None
+        self._played: dict[str, int] = {}
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for stream in (self._writer, self._reader):
+                if stream is not None:
+                    stream.close()
+            self._writer = self._reader = None
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._load_index().values())
+
+    def recorder(self, **kwargs: Any) -> "RecordingTransport":
+        """Transport for `Http` sending the requests and recording them"""
+        return RecordingTransport(self, **kwargs)
+
+    def player(self) -> "ReplayTransport":
+        """Transport for `Http` answering from the cassette, without any sockets"""
+        return ReplayTransport(self)
+
+    def key(self, request: requests.PreparedRequest) -> str:
+        """Replay key of a request"""
+        return request_key(
+            request.method or "GET",
+            redact_url(request.url or "", self._redact),
+            redact_body(_body_text(request.body), self._redact),
+        )
+
+    def record(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> None:
+        """Append a request/response pair to the cassette"""
+        entry = {
+            "key": self.key(request),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+            "body": redact_body(response.text, self._redact),
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            if self._writer is None:
+                self._writer = open(self.path, "a", encoding="utf-8")
+            self._writer.write(line)
+            self._writer.flush()
+            # a replay of the same cassette indexes the file again
+            self._index = None
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        """Answer a request with its recorded response"""
+        key = self.key(request)
+        with self._lock:
+            offsets = self._load_index().get(key)
+            if not offsets:
+                raise TadoException(f"No recorded response for {key} in {self.path}")
+
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+            offset = offsets[min(played, len(offsets) - 1)]
+
+            if self._reader is None:
+                self._reader = open(self.path, "rb")
+            self._reader.seek(offset)
+            entry = json.loads(self._reader.readline())
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.reason = "Replayed"
+        return response
+
+    def _load_index(self) -> dict[str, list[int]]:
+        if self._index is None:
+            index: dict[str, list[int]] = {}
+            if os.path.exists(self.path):
+                with open(self.path, "rb") as stream:
+                    offset = 0
+                    for line in stream:
+                        if line.strip():
+                            key = json.loads(line)["key"]
+                            index.setdefault(key, []).append(offset)
+                        offset += len(line)
+            self._index = index
+        return self._index
+
+
+class RecordingTransport(requests.adapters.HTTPAdapter):
+    """Adapter recording the requests it sends to a `Cassette`."""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        """Keyword arguments are passed on to HTTPAdapter, max_retries defaults to the
+        retry policy of `Http`"""
+        kwargs.setdefault("max_retries", default_retry())
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        response = super().send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+
+class ReplayTransport(requests.adapters.HTTPAdapter):
+    """Adapter answering the requests from a `Cassette`, without opening connections."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        super().__init__()
+        self.cassette = cassette
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        return self.cassette.play(request)
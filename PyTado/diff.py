@@ -0,0 +1,300 @@
+"""
+Typed change events between two states of a zone/room.
+
+`diff()` compares two consecutive `pre_line_x.ZoneState` or `line_x.RoomState` of a
+zone and returns what changed as events, e.g. `TargetTemperatureChanged` or
+`WindowOpened`. Only the few attributes behind the events are read from both states,
+the models are neither dumped nor compared as a whole, so diffing many zones on every
+poll stays cheap.
+
+Example usage: for event in diff(1, old_state, new_state):
+                   if isinstance(event, WindowOpened):
+                       ...
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.types import ConnectionState, LinkState
+
+State = ZoneState | RoomState
+
+
+@dataclass(frozen=True)
+class StateEvent:
+    """Base class of the change events of a zone/room."""
+
+    zone_id: int
+
+
+@dataclass(frozen=True)
+class ZoneAdded(StateEvent):
+    """The zone appeared, e.g. in the first poll."""
+
+    state: State
+
+
+@dataclass(frozen=True)
+class ZoneRemoved(StateEvent):
+    """The zone disappeared."""
+
+
+@dataclass(frozen=True)
+class ValueChanged(StateEvent):
+    """Base class of the events of a value changing from old to new."""
+
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class TargetTemperatureChanged(ValueChanged):
+    """The target temperature (Celsius) changed, None while the zone is off."""
+
+    old: float | None
+    new: float | None
+
+
+@dataclass(frozen=True)
+class CurrentTemperatureChanged(ValueChanged):
+    """The measured inside temperature (Celsius) changed."""
+
+    old: float | None
+    new: float | None
+
+
+@dataclass(frozen=True)
+class HumidityChanged(ValueChanged):
+    """The measured humidity (percent) changed."""
+
+    old: float | None
+    new: float | None
+
+
+@dataclass(frozen=True)
+class PowerChanged(ValueChanged):
+    """The zone was switched on or off."""
+
+    old: str | None
+    new: str | None
+
+
+@dataclass(frozen=True)
+class HeatingPowerChanged(ValueChanged):
+    """The heating power (percent) changed."""
+
+    old: float | None
+    new: float | None
+
+
+@dataclass(frozen=True)
+class ModeChanged(ValueChanged):
+    """The HVAC mode of an AC zone changed."""
+
+    old: str | None
+    new: str | None
+
+
+@dataclass(frozen=True)
+class PresenceChanged(ValueChanged):
+    """The presence (tado mode) of the home changed, Tado X rooms do not have one."""
+
+    old: str | None
+    new: str | None
+
+
+@dataclass(frozen=True)
+class ConnectionChanged(ValueChanged):
+    """The zone went online (True) or offline (False)."""
+
+    old: bool
+    new: bool
+
+
+@dataclass(frozen=True)
+class OverlayStarted(StateEvent):
+    """A manual overlay (or boost) started."""
+
+
+@dataclass(frozen=True)
+class OverlayEnded(StateEvent):
+    """The manual overlay (or boost) expired or was removed."""
+
+
+@dataclass(frozen=True)
+class WindowOpened(StateEvent):
+    """An open window was detected."""
+
+
+@dataclass(frozen=True)
+class WindowClosed(StateEvent):
+    """The open window mode ended."""
+
+
+def _zone_target(state: ZoneState) -> float | None:
+    temperature = state.setting.temperature
+    return temperature.celsius if temperature is not None else None
+
+
+def _zone_current(state: ZoneState) -> float | None:
+    temperature = state.sensor_data_points.inside_temperature
+    return temperature.celsius if temperature is not None else None
+
+
+def _zone_humidity(state: ZoneState) -> float | None:
+    humidity = state.sensor_data_points.humidity
+    return humidity.percentage if humidity is not None else None
+
+
+def _zone_heating_power(state: ZoneState) -> float | None:
+    power = state.activity_data_points.heating_power
+    return power.percentage if power is not None else None
+
+
+def _room_target(state: RoomState) -> float | None:
+    temperature = state.setting.temperature
+    return temperature.value if temperature is not None else None
+
+
+# value name: (event, value of a state), the event is emitted when the values differ
+_ZONE_VALUES: dict[str, tuple[type[ValueChanged], Callable[[Any], Any]]] = {
+    "target_temperature": (TargetTemperatureChanged, _zone_target),
+    "current_temperature": (CurrentTemperatureChanged, _zone_current),
+    "humidity": (HumidityChanged, _zone_humidity),
+    "power": (PowerChanged, lambda state: state.setting.power),
+    "heating_power": (HeatingPowerChanged, _zone_heating_power),
+    "mode": (ModeChanged, lambda state: state.setting.mode),
+    "presence": (PresenceChanged, lambda state: state.tado_mode),
+    "connected": (
+        ConnectionChanged,
+        lambda state: state.link.state == LinkState.ONLINE,
+    ),
+}
+_ROOM_VALUES: dict[str, tuple[type[ValueChanged], Callable[[Any], Any]]] = {
+    "target_temperature": (TargetTemperatureChanged, _room_target),
+    "current_temperature": (
+        CurrentTemperatureChanged,
+        lambda state: state.sensor_data_points.inside_temperature.value,
+    ),
+    "humidity": (
+        HumidityChanged,
+        lambda state: state.sensor_data_points.humidity.percentage,
+    ),
+    "power": (PowerChanged, lambda state: state.setting.power),
+    "heating_power": (
+        HeatingPowerChanged,
+        lambda state: state.heating_power.percentage,
+    ),
+    "connected": (
+        ConnectionChanged,
+        lambda state: state.connection.state == ConnectionState.CONNECTED,
+    ),
+}
+
+# flag name: (started, ended, whether a state has it)
+_Flag = tuple[type[StateEvent], type[StateEvent], Callable[[Any], bool]]
+
+_ZONE_FLAGS: dict[str, _Flag] = {
+    "overlay": (OverlayStarted, OverlayEnded, lambda state: state.overlay is not None),
+    "open_window": (
+        WindowOpened,
+        WindowClosed,
+        lambda state: state.open_window is not None,
+    ),
+}
+_ROOM_FLAGS: dict[str, _Flag] = {
+    "overlay": (
+        OverlayStarted,
+        OverlayEnded,
+        lambda state: state.manual_control_termination is not None
+        or state.boost_mode is not None,
+    ),
+    "open_window": (
+        WindowOpened,
+        WindowClosed,
+        lambda state: state.open_window is not None and state.open_window.activated,
+    ),
+}
+
+_VALUE_EVENTS = {name: event for name, (event, _) in _ZONE_VALUES.items()}
+_FLAG_EVENTS = {name: flag[:2] for name, flag in _ZONE_FLAGS.items()}
+
+
+def diff(zone_id: int, old: State | None, new: State | None) -> list[StateEvent]:
+    """
+    The events of a zone from one state to the next.
+
+    Args:
+        zone_id: The id of the zone/room.
+        old: The previous state, None if the zone is new.
+        new: The current state, None if the zone was removed.
+    """
+    if new is None:
+        return [] if old is None else [ZoneRemoved(zone_id)]
+    if old is None:
+        return [ZoneAdded(zone_id, new)]
+    if old is new:
+        return []
+    if type(old) is not type(new):
+        # e.g. a home migrated to Tado X
+        return [ZoneRemoved(zone_id), ZoneAdded(zone_id, new)]
+
+    room = isinstance(new, RoomState)
+    events: list[StateEvent] = []
+    for event, value in (_ROOM_VALUES if room else _ZONE_VALUES).values():
+        old_value, new_value = value(old), value(new)
+        if old_value != new_value:
+            events.append(event(zone_id, old_value, new_value))
+    for started, ended, flag in (_ROOM_FLAGS if room else _ZONE_FLAGS).values():
+        old_flag, new_flag = flag(old), flag(new)
+        if old_flag != new_flag:
+            events.append((started if new_flag else ended)(zone_id))
+    return events
+
+
+def diff_home(old: Mapping[int, State], new: Mapping[int, State]) -> list[StateEvent]:
+    """The events of all zones of a home from one poll to the next"""
+    events = []
+    for zone_id, state in new.items():
+        events += diff(zone_id, old.get(zone_id), state)
+    for zone_id in old.keys() - new.keys():
+        events.append(ZoneRemoved(zone_id))
+    return events
+
+
+def summary(state: State) -> dict[str, Any]:
+    """
+    The values behind the events of a state by name, e.g. "target_temperature" or
+    "open_window".
+
+    A summary holds only plain values (numbers, strings, booleans), it is small and cheap
+    to pickle, e.g. to send the state of many zones between processes.
+    """
+    room = isinstance(state, RoomState)
+    values = {
+        name: value(state)
+        for name, (_, value) in (_ROOM_VALUES if room else _ZONE_VALUES).items()
+    }
+    for name, (_, _, flag) in (_ROOM_FLAGS if room else _ZONE_FLAGS).items():
+        values[name] = flag(state)
+    return values
+
+
+def diff_summaries(
+    zone_id: int, old: Mapping[str, Any], new: Mapping[str, Any]
+) -> list[StateEvent]:
+    """The events between two summaries of a zone, see `diff()` and `summary()`"""
+    events: list[StateEvent] = []
+    for name, new_value in new.items():
+        old_value = old.get(name)
+        if old_value == new_value:
+            continue
+        if name in _VALUE_EVENTS:
+            events.append(_VALUE_EVENTS[name](zone_id, old_value, new_value))
+        elif name in _FLAG_EVENTS:
+            started, ended = _FLAG_EVENTS[name]
+            events.append((started if new_value else ended)(zone_id))
+    return events
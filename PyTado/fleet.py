@@ -0,0 +1,258 @@
+"""
+All homes of an account behind a single login.
+
+A `Tado` client talks to the first home of its account. `Fleet` discovers every home
+from /me and creates a `Tado`/`TadoX` per home on top of the client it was given (see
+`Http.for_home`): all homes share one OAuth token, its refreshes, the session with its
+connection pool, the cache and the rate limit budget. Bulk operations run concurrently
+across the homes, in a thread pool for `Fleet` and as tasks for `AsyncFleet`.
+
+Example usage: fleet = Fleet(Http(token_file_path="/var/tado/token"))
+               for home_id, states in fleet.get_zone_states().items():
+                   ...
+               fleet.home(5678).set_away()
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, TypeVar, overload
+
+from PyTado.exceptions import TadoException
+from PyTado.http import AsyncHttp, Http, TadoRequest
+from PyTado.interface.api import (
+    AsyncTado,
+    AsyncTadoBase,
+    AsyncTadoX,
+    Tado,
+    TadoBase,
+    TadoX,
+)
+from PyTado.models.home import HomeState
+from PyTado.models.line_x import RoomState
+from PyTado.models.pre_line_x import ZoneState
+
+T = TypeVar("T")
+
+# the default pool of requests keeps 10 connections per host
+DEFAULT_WORKERS = 8
+
+
+class Fleet:
+    """The homes of an account, sharing the login of one `Http` client."""
+
+    def __init__(self, http: Http, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Args:
+            http: A logged in client of the account.
+            workers: Homes handled concurrently by bulk operations.
+        """
+        self._http = http
+        self._workers = workers
+        self._homes: dict[int, TadoBase] | None = None
+
+    @property
+    def homes(self) -> dict[int, TadoBase]:
+        """The API instances of the homes by id, discovered on first use"""
+        if self._homes is None:
+            self.discover()
+        assert self._homes is not None
+        return dict(self._homes)
+
+    def discover(self) -> list[int]:
+        """(Re-)load the homes of the account, returns their ids"""
+        home_ids = self._http.home_ids()
+        https = self._map(self._http.for_home, home_ids)
+        self._homes = {
+            home_id: (TadoX if http.is_x_line else Tado).from_http(http)
+            for home_id, http in zip(home_ids, https)
+        }
+        return home_ids
+
+    def home(self, home_id: int) -> TadoBase:
+        """The API instance of a home of the account"""
+        try:
+            return self.homes[home_id]
+        except KeyError:
+            raise TadoException(
+                f"Home {home_id} is not a home of the account"
+            ) from None
+
+    def request(
+        self, home_id: int, request: TadoRequest
+    ) -> dict[str, Any] | list[Any] | str:
+        """Send a request to the API of a home of the account"""
+        return self.home(home_id)._http.request(request)
+
+    @overload
+    def map(
+        self,
+        func: Callable[[TadoBase], T],
+        home_ids: Iterable[int] | None = None,
+        return_exceptions: Literal[False] = False,
+    ) -> dict[int, T]: ...
+
+    @overload
+    def map(
+        self,
+        func: Callable[[TadoBase], T],
+        home_ids: Iterable[int] | None = None,
+        *,
+        return_exceptions: Literal[True],
+    ) -> dict[int, T | Exception]: ...
+
+    def map(
+        self,
+        func: Callable[[TadoBase], T],
+        home_ids: Iterable[int] | None = None,
+        return_exceptions: bool = False,
+    ) -> dict[int, T] | dict[int, T | Exception]:
+        """
+        Call func with the API instance of each home concurrently.
+
+        Args:
+            func: Called with the `Tado`/`TadoX` of a home.
+            home_ids: The homes, None for all.
+            return_exceptions: Return the exception of a failed home as its result
+                instead of raising it, like `asyncio.gather`.
+
+        Returns:
+            dict[int, T | Exception]: The results by home id.
+        """
+        ids = list(self.homes if home_ids is None else home_ids)
+        homes = [self.home(home_id) for home_id in ids]
+
+        def call(home: TadoBase) -> T | Exception:
+            try:
+                return func(home)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return dict(zip(ids, self._map(call, homes)))
+
+    def get_zone_states(
+        self, home_ids: Iterable[int] | None = None
+    ) -> dict[int, dict[int, ZoneState] | dict[int, RoomState]]:
+        """The states of all zones/rooms of the homes by id, one request per home"""
+        return self.map(lambda home: home._get_zone_states_by_id(), home_ids)
+
+    def get_home_states(
+        self, home_ids: Iterable[int] | None = None
+    ) -> dict[int, HomeState]:
+        """The presence of the homes by id"""
+        return self.map(lambda home: home.get_home_state(), home_ids)
+
+    def _map(self, func: Callable[[Any], T], items: list[Any]) -> list[T]:
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self._workers, len(items)),
+            thread_name_prefix="PyTado fleet",
+        ) as pool:
+            return list(pool.map(func, items))
+
+
+class AsyncFleet:
+    """See `Fleet`, for the homes of an `AsyncHttp` client."""
+
+    def __init__(self, http: AsyncHttp, workers: int = DEFAULT_WORKERS) -> None:
+        """See `Fleet`"""
+        self._http = http
+        self._semaphore = asyncio.Semaphore(workers)
+        self._homes: dict[int, AsyncTadoBase] | None = None
+
+    @property
+    def homes(self) -> dict[int, AsyncTadoBase]:
+        """The API instances of the homes by id, see `discover()`"""
+        if self._homes is None:
+            raise TadoException("The homes have not been discovered yet")
+        return dict(self._homes)
+
+    async def discover(self) -> list[int]:
+        """See `Fleet.discover`"""
+        home_ids = await self._http.home_ids()
+        https = await self._gather(self._http.for_home, home_ids)
+        self._homes = {
+            home_id: (AsyncTadoX if http.is_x_line else AsyncTado).from_http(http)
+            for home_id, http in zip(home_ids, https)
+        }
+        return home_ids
+
+    async def home(self, home_id: int) -> AsyncTadoBase:
+        """See `Fleet.home`, discovers the homes on first use"""
+        if self._homes is None:
+            await self.discover()
+        try:
+            return self.homes[home_id]
+        except KeyError:
+            raise TadoException(
+                f"Home {home_id} is not a home of the account"
+            ) from None
+
+    async def request(
+        self, home_id: int, request: TadoRequest
+    ) -> dict[str, Any] | list[Any] | str:
+        """See `Fleet.request`"""
+        return await (await self.home(home_id))._http.request(request)
+
+    @overload
+    async def map(
+        self,
+        func: Callable[[AsyncTadoBase], Awaitable[T]],
+        home_ids: Iterable[int] | None = None,
+        return_exceptions: Literal[False] = False,
+    ) -> dict[int, T]: ...
+
+    @overload
+    async def map(
+        self,
+        func: Callable[[AsyncTadoBase], Awaitable[T]],
+        home_ids: Iterable[int] | None = None,
+        *,
+        return_exceptions: Literal[True],
+    ) -> dict[int, T | Exception]: ...
+
+    async def map(
+        self,
+        func: Callable[[AsyncTadoBase], Awaitable[T]],
+        home_ids: Iterable[int] | None = None,
+        return_exceptions: bool = False,
+    ) -> dict[int, T] | dict[int, T | Exception]:
+        """See `Fleet.map`, at most `workers` homes are awaited concurrently"""
+        if self._homes is None:
+            await self.discover()
+        ids = list(self.homes if home_ids is None else home_ids)
+        homes = [await self.home(home_id) for home_id in ids]
+
+        async def call(home: AsyncTadoBase) -> T | Exception:
+            try:
+                return await func(home)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        return dict(zip(ids, await self._gather(call, homes)))
+
+    async def get_zone_states(
+        self, home_ids: Iterable[int] | None = None
+    ) -> dict[int, dict[int, ZoneState] | dict[int, RoomState]]:
+        """See `Fleet.get_zone_states`"""
+        return await self.map(lambda home: home._get_zone_states_by_id(), home_ids)
+
+    async def get_home_states(
+        self, home_ids: Iterable[int] | None = None
+    ) -> dict[int, HomeState]:
+        """See `Fleet.get_home_states`"""
+        return await self.map(lambda home: home.get_home_state(), home_ids)
+
+    async def _gather(
+        self, func: Callable[[Any], Awaitable[T]], items: list[Any]
+    ) -> list[T]:
+        async def limited(item: Any) -> T:
+            async with self._semaphore:
+                return await func(item)
+
+        return list(await asyncio.gather(*(limited(item) for item in items)))
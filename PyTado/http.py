@@ -2,18 +2,20 @@
 Do all the API HTTP heavy lifting in this file
 """
 
+import asyncio
 import enum
 import json
 import logging
 import os
 import pprint
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from json import dump as json_dump
 from json import load as json_load
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Mapping, Self
 from urllib.parse import urlencode
 
 import requests
@@ -22,13 +24,21 @@ from urllib3 import Retry
 from urllib3.exceptions import MaxRetryError
 
 from PyTado import __version__
+from PyTado.cache import AsyncSingleFlight, ResponseCache, SingleFlight, request_key
 from PyTado.const import CLIENT_ID_DEVICE, HTTP_CODES_OK
 from PyTado.exceptions import (
     TadoException,
+    TadoNoCredentialsException,
     TadoRateLimitException,
     TadoWrongCredentialsException,
 )
 from PyTado.logger import Logger
+from PyTado.metrics import STATUS_ERROR, MetricsRegistry
+from PyTado.ratelimit import RateLimitBudget
+from PyTado.refresher import AsyncTokenRefresher, TokenRefresher
+
+if TYPE_CHECKING:
+    import aiohttp
 
 _LOGGER = Logger(__name__)
 
@@ -112,7 +122,7 @@ class TadoXRequest(TadoRequest):
         return self._action
 
     @action.setter
-    def action(self, value: Action | str) -> None:  # type: ignore
+    def action(self, value: Action | str) -> None:
         """Set request action"""
         self._action = value
 
@@ -124,19 +134,57 @@ class TadoResponse:
     pass
 
 
+@dataclass(frozen=True)
+class ConnectionStats:
+    """Counters of the connection pools of an `Http` client
+
+    connections: number of connections (TCP + TLS handshakes) opened
+    requests: number of requests sent over those connections
+    """
+
+    connections: int = 0
+    requests: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Number of requests sent over an already established connection"""
+        return self.requests - self.connections
+
+
 _DEFAULT_TIMEOUT = 10
 _DEFAULT_RETRIES = 5
+_DEFAULT_BACKOFF_FACTOR = 0.1
+_DEFAULT_BACKOFF_MAX = 120
+_RETRY_STATUS_CODES = [502, 503, 504]
+
+
+def default_retry() -> Retry:
+    """Retry policy of the requests to the API"""
+    return Retry(
+        total=_DEFAULT_RETRIES,
+        backoff_factor=_DEFAULT_BACKOFF_FACTOR,
+        backoff_jitter=0.5,
+        backoff_max=_DEFAULT_BACKOFF_MAX,
+        status_forcelist=_RETRY_STATUS_CODES,
+    )
 
 
-class Http:
-    """API Request Class"""
+_TOKEN_URL = "https://login.tado.com/oauth2/token"
+_DEVICE_AUTHORIZE_URL = "https://login.tado.com/oauth2/device_authorize"
+_FORM_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Referer": "https://app.tado.com/",
+}
+
+
+class BaseHttp:
+    """Shared state and helpers of the blocking and the asyncio API clients"""
 
     _refresh_at: datetime
-    _session: requests.Session
     _headers: dict[str, str]
     _username: str
     _password: str
-    _id: int
+    _id: int | None
     _token_refresh: str | None = None
     _x_api: bool | None = None
     _user_code: str | None = None
@@ -149,52 +197,19 @@ class Http:
     def __init__(
         self,
         token_file_path: str | None = None,
-        saved_refresh_token: str | None = None,
-        http_session: requests.Session | None = None,
         debug: bool = False,
         user_agent: str | None = None,
         client_id: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitBudget | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
-        """
-        Initialize the HTTP client for interacting with the Tado API.
-
-        Args:
-            token_file_path (str | None): Path to the file where the token is stored.
-                If None, the token will not be saved to a file.
-            saved_refresh_token (str | None): A previously saved refresh token to use for
-                authentication. If None, a new token will be requested.
-            http_session (requests.Session | None): An optional pre-configured HTTP session.
-                If None, a new session will be created.
-            debug (bool): If True, enables debug logging. Defaults to False.
-            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
-                If None, a default user-agent PyTado/<PyTado-version> will be used.
-            client_id (str | None): OAuth2 client_id to use for authentication.
-                If None, defaults to CLIENT_ID_DEVICE from PyTado.const.
-
-        Returns:
-            None
-        """
-
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
         else:
             _LOGGER.setLevel(logging.WARNING)
 
-        self._retries = Retry(
-            total=_DEFAULT_RETRIES,
-            backoff_factor=0.1,
-            backoff_jitter=0.5,
-            backoff_max=120,
-            status_forcelist=[502, 503, 504],
-        )
-
-        self._http_adapter = requests.adapters.HTTPAdapter(
-            max_retries=self._retries,
-        )
-
         self._refresh_at = datetime.now(timezone.utc) + timedelta(minutes=10)
-        self._session = http_session or self._create_session()
-        self._session.hooks["response"].append(self._log_response)
         self._headers = {
             "Referer": "https://app.tado.com/",
             "user-agent": user_agent or f"PyTado/{__version__}",
@@ -205,38 +220,14 @@ class Http:
         self._device_activation_status = DeviceActivationStatus.NOT_STARTED
         self._expires_at: datetime | None = None
 
-        self._id: int | None = None
+        self._id = None
         self._token_refresh: str | None = None
         self._x_api: bool | None = None
         self._token_file_path = token_file_path
         self._client_id = client_id or CLIENT_ID_DEVICE
-
-        self._session.mount("https://", self._http_adapter)
-        self._session.mount("http://", self._http_adapter)
-
-        if saved_refresh_token or self._load_token():
-            if self._refresh_token(
-                refresh_token=saved_refresh_token, force_refresh=True
-            ):
-                try:
-                    self._device_ready()
-                except Exception as exc:
-                    # Token refresh succeeded but /me failed (e.g. rate-limited empty
-                    # response). Wipe the token and fall back to device flow.
-                    _LOGGER.warning(
-                        "Token refresh succeeded but home ID fetch failed (%s). "
-                        "Starting device flow.",
-                        exc,
-                    )
-                    if self._token_file_path and os.path.exists(self._token_file_path):
-                        os.remove(self._token_file_path)
-                    self._token_refresh = None
-                    self._headers.pop("Authorization", None)
-                    self._device_activation_status = self._login_device_flow()
-            else:
-                self._device_activation_status = self._login_device_flow()
-        else:
-            self._device_activation_status = self._login_device_flow()
+        self._cache = cache
+        self._rate_limit = rate_limit or RateLimitBudget()
+        self._metrics = metrics
 
     @property
     def is_x_line(self) -> bool | None:
@@ -290,101 +281,33 @@ class Http:
         """
         return self._token_refresh
 
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-        session.hooks["response"].append(self._log_response)
-        session.mount("https://", self._http_adapter)
-        session.mount("http://", self._http_adapter)
-        return session
-
-    def _log_response(
-        self, response: requests.Response, *args: Any, **kwargs: Any
-    ) -> None:
-        og_request_method = response.request.method
-        og_request_url = response.request.url
-        og_request_headers = response.request.headers
-        response_status = response.status_code
-
-        if response.text is None or response.text == "":
-            response_data = {}
-        else:
-            response_data = response.json()
-
-        _LOGGER.debug(
-            f"\nRequest:\n\tMethod:{og_request_method}"
-            f"\n\tURL: {og_request_url}"
-            f"\n\tHeaders: {pprint.pformat(og_request_headers)}"
-            f"\nResponse:\n\tStatusCode: {response_status}"
-            f"\n\tData: {response_data}"
-        )
-
-    def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
-        """Request something from the API with a TadoRequest"""
-        self._refresh_token()
-
-        headers = self._headers
-        data = self._configure_payload(headers, request)
-        url = self._configure_url(request)
-
-        http_request = requests.Request(
-            method=request.action, url=url, headers=headers, data=data
-        )
-        prepped = http_request.prepare()
-        prepped.hooks["response"].append(self._log_response)
-
-        try:
-            response = self._session.send(prepped)
-        except TadoWrongCredentialsException as e:
-            _LOGGER.error("Credentials Exception: %s", e)
-            raise e
-        except MaxRetryError as e:
-            _LOGGER.error("Max retries exceeded: %s", e)
-            raise TadoException(e) from e
-
-        if response.status_code == 429:
-            details = []
-            rate_limit_policy = response.headers.get("RateLimit-Policy")
-            rate_limit = response.headers.get("RateLimit")
-            retry_after = response.headers.get("Retry-After")
-
-            if rate_limit_policy:
-                details.append(f"policy={rate_limit_policy}")
-            if rate_limit:
-                details.append(f"limit={rate_limit}")
-            if retry_after:
-                details.append(f"retry_after={retry_after}")
-
-            message = "Request failed with status code 429"
-            if details:
-                message += f" ({', '.join(details)})"
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache of this client, None if responses are not cached."""
+        return self._cache
 
-            raise TadoRateLimitException(message)
+    @property
+    def rate_limit(self) -> RateLimitBudget:
+        """The rate limit budget of this client, see PyTado.ratelimit."""
+        return self._rate_limit
 
-        if response.text == "":
-            if response.status_code == 204:
-                # Tado changed some (all?) APIs from HTTP 200 to HTTP 204.
-                # Make sure that PyTado returns {"success": True} if Tado returns HTTP 204
-                # to ensure that the interface of this library is not changed. Can be removed
-                # on the next breaking release.
-                return {"success": True}
-            return {}
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """The request metrics of this client, None if requests are not measured."""
+        return self._metrics
 
-        if response.status_code not in HTTP_CODES_OK:
-            _LOGGER.error(
-                "Request %s failed with status code %d: %s",
-                url,
-                response.status_code,
-                response.json(),
-            )
-            raise TadoException(
-                f"Request failed with status code {response.status_code}"
-            )
+    @property
+    def remaining_quota(self) -> int | None:
+        """Estimated number of API requests left for the home, None if unknown."""
+        return self._rate_limit.remaining(self._id)
 
-        response_json = response.json()
-        if isinstance(response_json, (dict, list, str)):
-            return response_json
+    @staticmethod
+    def _is_read(request: TadoRequest) -> bool:
+        return str(request.action) == Action.GET
 
-        raise TadoException("Unexpected response type")
+    def _invalidate(self, request: TadoRequest) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(request, self._id)
 
     def _configure_url(self, request: TadoRequest) -> str:
         if request.endpoint == Endpoint.MOBILE:
@@ -419,6 +342,38 @@ class Http:
         headers["Mime-Type"] = "application/json;charset=UTF-8"
         return json.dumps(request.payload).encode("utf8")
 
+    @staticmethod
+    def _rate_limit_exception(headers: Mapping[str, str]) -> TadoRateLimitException:
+        """Build the exception raised for a HTTP 429 response"""
+        details = []
+        rate_limit_policy = headers.get("RateLimit-Policy")
+        rate_limit = headers.get("RateLimit")
+        retry_after = headers.get("Retry-After")
+
+        if rate_limit_policy:
+            details.append(f"policy={rate_limit_policy}")
+        if rate_limit:
+            details.append(f"limit={rate_limit}")
+        if retry_after:
+            details.append(f"retry_after={retry_after}")
+
+        message = "Request failed with status code 429"
+        if details:
+            message += f" ({', '.join(details)})"
+
+        return TadoRateLimitException(message)
+
+    def _token_valid(self, force_refresh: bool = False) -> bool:
+        """Check whether the current access token can still be used"""
+        return self._refresh_at >= datetime.now(timezone.utc) and not force_refresh
+
+    def _refresh_token_data(self, refresh_token: str | None = None) -> dict[str, Any]:
+        return {
+            "client_id": self._client_id,
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token or self._token_refresh,
+        }
+
     def _set_oauth_header(self, data: dict[str, Any]) -> str:
         """Set the OAuth header and return the refresh token"""
 
@@ -426,14 +381,20 @@ class Http:
         expires_in = float(data["expires_in"])
         refresh_token = data["refresh_token"]
 
-        self._token_refresh = refresh_token
-        self._refresh_at = datetime.now(timezone.utc)
-        self._refresh_at = self._refresh_at + timedelta(seconds=expires_in)
         # We subtract 30 seconds from the correct refresh time.
         # Then we have a 30 seconds timespan to get a new refresh_token
-        self._refresh_at = self._refresh_at - timedelta(seconds=30)
+        refresh_at = (
+            datetime.now(timezone.utc)
+            + timedelta(seconds=expires_in)
+            - timedelta(seconds=30)
+        )
 
-        self._headers["Authorization"] = f"Bearer {access_token}"
+        # replace instead of update the headers, so concurrent requests (and the
+        # background refresher) never see a partially updated header dict, and only
+        # mark the token valid once the new header is in place
+        self._token_refresh = refresh_token
+        self._headers = {**self._headers, "Authorization": f"Bearer {access_token}"}
+        self._refresh_at = refresh_at
 
         self._save_token()
 
@@ -457,73 +418,6 @@ class Http:
             _LOGGER.error("Failed to load refresh token: %s", e)
             raise TadoException(e) from e
 
-    def _refresh_token(
-        self, refresh_token: str | None = None, force_refresh: bool = False
-    ) -> bool:
-        """
-        Refresh the OAuth token if it is about to expire or if forced.
-
-        Args:
-            refresh_token (str | None, optional): The refresh token to use for obtaining a new
-                access token.
-            force_refresh (bool, optional): If True, forces a token refresh regardless of
-                expiration. Defaults to False.
-
-        Returns:
-            bool: True if the token was successfully refreshed, False if the refresh failed due
-                  to invalid credentials.
-
-        Raises:
-            TadoException: If a connection error occurs during the token refresh process.
-            TadoWrongCredentialsException: If the token refresh fails due to invalid credentials
-                and force_refresh is False.
-        """
-
-        if self._refresh_at >= datetime.now(timezone.utc) and not force_refresh:
-            return True
-
-        url = "https://login.tado.com/oauth2/token"
-        data = {
-            "client_id": self._client_id,
-            "grant_type": "refresh_token",
-            "refresh_token": refresh_token or self._token_refresh,
-        }
-        self._session.close()
-        self._session = self._create_session()
-
-        try:
-            response = self._session.request(
-                "post",
-                url,
-                timeout=_DEFAULT_TIMEOUT,
-                data=urlencode(data),
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Referer": "https://app.tado.com/",
-                },
-            )
-
-        except requests.exceptions.ConnectionError as e:
-            _LOGGER.error("Connection error: %s", e)
-            raise TadoException(e) from e
-
-        if response.status_code != 200:
-            if force_refresh:
-                _LOGGER.error(
-                    "Failed to refresh token, probably wrong credentials. Status code: %s",
-                    response.status_code,
-                )
-                return False
-
-            raise TadoWrongCredentialsException(
-                "Failed to refresh token, probably wrong credentials. "
-                f"Status code: {response.status_code}"
-            )
-
-        self._set_oauth_header(response.json())
-
-        return True
-
     def _save_token(self) -> None:
         """Save the refresh token to a file."""
         if not self._token_file_path or not self._token_refresh:
@@ -545,38 +439,19 @@ class Http:
             _LOGGER.error("Failed to save refresh token: %s", e)
             raise TadoException(e) from e
 
-    def _login_device_flow(self) -> DeviceActivationStatus:
-        """Start the login to the API using the device flow"""
-
-        if self._device_activation_status != DeviceActivationStatus.NOT_STARTED:
-            raise TadoException("The device has been started already")
-
-        url = "https://login.tado.com/oauth2/device_authorize"
-        data = {
-            "client_id": self._client_id,
-            "scope": "offline_access",
+    def _discard_token(self) -> None:
+        """Forget the stored token, e.g. before falling back to the device flow"""
+        if self._token_file_path and os.path.exists(self._token_file_path):
+            os.remove(self._token_file_path)
+        self._token_refresh = None
+        # replaced instead of updated, see _set_oauth_header
+        self._headers = {
+            key: value for key, value in self._headers.items() if key != "Authorization"
         }
 
-        try:
-            response = self._session.request(
-                method="post",
-                url=url,
-                timeout=_DEFAULT_TIMEOUT,
-                data=urlencode(data),
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Referer": "https://app.tado.com/",
-                },
-            )
-        except requests.exceptions.ConnectionError as e:
-            raise TadoException(e) from e
-
-        if response.status_code != 200:
-            raise TadoException(
-                f"Login failed. Status code: {response.status_code} and reason: {response.reason}"
-            )
-
-        self._device_flow_data = response.json()
+    def _start_device_flow(self, device_flow_data: dict[str, Any]) -> None:
+        """Store the device flow response of the device_authorize endpoint"""
+        self._device_flow_data = device_flow_data
         _LOGGER.debug("Device flow response: %s", self._device_flow_data)
 
         self._user_code = self._device_flow_data["user_code"]
@@ -599,101 +474,993 @@ class Http:
             self._expires_at.strftime("%Y-%m-%d %H:%M:%S"),
         )
 
-        return DeviceActivationStatus.PENDING
-
-    def _check_device_activation(self) -> bool:
-        if self._expires_at is not None and datetime.timestamp(
+    def _device_flow_expired(self) -> bool:
+        return self._expires_at is not None and datetime.timestamp(
             datetime.now(timezone.utc)
-        ) > datetime.timestamp(self._expires_at):
-            raise TadoException("User took too long to enter key")
-
-        # Await the desired interval, before polling the API again
-        time.sleep(self._device_flow_data.get("interval", 0))
-
-        try:
-            token_response = self._session.request(
-                method="post",
-                url="https://login.tado.com/oauth2/token",
-                params={
-                    "client_id": self._client_id,
-                    "device_code": self._device_flow_data["device_code"],
-                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                },
-            )
-        except requests.exceptions.ConnectionError as e:
-            raise TadoException(e) from e
-
-        if token_response.status_code == 200:
-            self._set_oauth_header(token_response.json())
-            return True
-
-        # The user has not yet authorized the device, let's continue
-        if (
-            token_response.status_code == 400
-            and token_response.json()["error"] == "authorization_pending"
-        ):
-            _LOGGER.info(
-                "Authorization pending, waiting for user to authorize. Continue polling."
-            )
-            return False
-
-        raise TadoException(f"Login failed. Reason: {token_response.reason}")
-
-    def device_activation(self) -> None:
-        """Activate the device and get the refresh token"""
-
-        if self._device_activation_status == DeviceActivationStatus.NOT_STARTED:
-            raise TadoException("The device flow has not yet started")
-
-        while True:
-            if self._check_device_activation():
-                break
+        ) > datetime.timestamp(self._expires_at)
 
-        self._device_ready()
+    def _device_token_params(self) -> dict[str, Any]:
+        return {
+            "client_id": self._client_id,
+            "device_code": self._device_flow_data["device_code"],
+            "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+        }
 
-    def _device_ready(self) -> None:
-        """after device refresh code has been obtained"""
-        self._id = self._get_id()
-        self._x_api = self._check_x_line_generation()
+    def _set_device_ready(self, home_id: int, x_api: bool) -> None:
+        """Mark the device flow as completed for the given home"""
+        self._id = home_id
+        self._x_api = x_api
         self._user_code = None
         self._device_verification_url = None
         self._device_activation_status = DeviceActivationStatus.COMPLETED
 
-    def _get_id(self) -> int:
+    @staticmethod
+    def _me_request() -> TadoRequest:
         request = TadoRequest()
         request.action = Action.GET
         request.domain = Domain.ME
+        return request
 
-        response = self.request(request)
+    @staticmethod
+    def _home_request() -> TadoRequest:
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+        request.command = ""
+        return request
 
+    @staticmethod
+    def _home_ids_from_me(response: dict[str, Any] | list[Any] | str) -> list[int]:
+        """Extract the ids of all homes of the account from a /me response"""
         if not isinstance(response, dict):
             raise TadoException("Unexpected response type")
 
         homes_ = response.get("homes")
         if isinstance(homes_, list) and homes_:
-            return int(homes_[0]["id"])
+            return [int(home_["id"]) for home_ in homes_]
 
         if home_id := response.get("homeId"):
-            return int(home_id)
+            return [int(home_id)]
 
         if isinstance(response.get("home"), dict):
-            return int(response["home"]["id"])
+            return [int(response["home"]["id"])]
 
         if home_ids := response.get("homeIds"):
-            return int(home_ids[0])
+            return [int(home_id) for home_id in home_ids]
 
         raise TadoException(f"No home id found in /me response: {response}")
 
-    def _check_x_line_generation(self) -> bool:
-        # get home info
-        request = TadoRequest()
-        request.action = Action.GET
-        request.domain = Domain.HOME
-        request.command = ""
-
-        home_ = self.request(request)
+    @classmethod
+    def _home_id_from_me(cls, response: dict[str, Any] | list[Any] | str) -> int:
+        """Extract the (first) home id from a /me response"""
+        return cls._home_ids_from_me(response)[0]
 
+    @staticmethod
+    def _is_x_line_home(home_: dict[str, Any] | list[Any] | str) -> bool:
+        """Check the generation of a home response"""
         if not isinstance(home_, dict):
             raise TadoException("Unexpected response type")
 
         return "generation" in home_ and home_["generation"] == "LINE_X"
+
+
+class Http(BaseHttp):
+    """API Request Class"""
+
+    _session: requests.Session
+
+    def __init__(
+        self,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: requests.Session | None = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        client_id: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitBudget | None = None,
+        refresh_in_background: bool = False,
+        metrics: MetricsRegistry | None = None,
+        transport: requests.adapters.HTTPAdapter | None = None,
+        device_flow: bool = True,
+    ) -> None:
+        """
+        Initialize the HTTP client for interacting with the Tado API.
+
+        Args:
+            token_file_path (str | None): Path to the file where the token is stored.
+                If None, the token will not be saved to a file.
+            saved_refresh_token (str | None): A previously saved refresh token to use for
+                authentication. If None, a new token will be requested.
+            http_session (requests.Session | None): An optional pre-configured HTTP session.
+                If None, a new session will be created.
+            debug (bool): If True, enables debug logging. Defaults to False.
+            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
+                If None, a default user-agent PyTado/<PyTado-version> will be used.
+            client_id (str | None): OAuth2 client_id to use for authentication.
+                If None, defaults to CLIENT_ID_DEVICE from PyTado.const.
+            cache (ResponseCache | None): Optional cache for the responses of GET requests.
+                If None, every request is sent to the API.
+            rate_limit (RateLimitBudget | None): Optional budget tracking the API rate limit,
+                e.g. shared with other clients or throttling GET requests. If None, a budget
+                which only keeps track is used.
+            refresh_in_background (bool): If True, the access token is renewed before it
+                expires by a TokenRefresher instead of on the request path.
+            metrics (MetricsRegistry | None): Optional registry recording latency, status
+                codes, retries and sizes of the requests, see PyTado.metrics.
+            transport (requests.adapters.HTTPAdapter | None): Optional adapter sending the
+                requests, e.g. of PyTado.testing.FakeTadoServer. If None, a HTTPAdapter with
+                the retry policy of `default_retry()` is used.
+            device_flow (bool): If False, a missing or rejected refresh token or a failed
+                /me request raise a TadoException instead of starting the device flow, and
+                the token file is never deleted, e.g. in unattended workers.
+
+        Returns:
+            None
+        """
+        super().__init__(
+            token_file_path=token_file_path,
+            debug=debug,
+            user_agent=user_agent,
+            client_id=client_id,
+            cache=cache,
+            rate_limit=rate_limit,
+            metrics=metrics,
+        )
+
+        self._retries = default_retry()
+
+        self._http_adapter = transport or requests.adapters.HTTPAdapter(
+            max_retries=self._retries,
+        )
+
+        self._flights = SingleFlight()
+        self._refresh_lock = threading.Lock()
+        # number of writes sent, data read before a write may be outdated
+        self._writes = 0
+
+        self._session = http_session or requests.Session()
+        self._setup_session(self._session)
+
+        if saved_refresh_token or self._load_token():
+            if self._refresh_token(
+                refresh_token=saved_refresh_token, force_refresh=True
+            ):
+                try:
+                    self._device_ready()
+                except Exception as exc:
+                    if not device_flow:
+                        raise TadoException(f"Loading the home failed: {exc}") from exc
+                    # Token refresh succeeded but /me failed (e.g. rate-limited empty
+                    # response). Wipe the token and fall back to device flow.
+                    _LOGGER.warning(
+                        "Token refresh succeeded but home ID fetch failed (%s). "
+                        "Starting device flow.",
+                        exc,
+                    )
+                    self._discard_token()
+                    self._device_activation_status = self._login_device_flow()
+            elif not device_flow:
+                raise TadoWrongCredentialsException("The refresh token was rejected")
+            else:
+                self._device_activation_status = self._login_device_flow()
+        elif not device_flow:
+            raise TadoNoCredentialsException("No refresh token found")
+        else:
+            self._device_activation_status = self._login_device_flow()
+
+        self._token_refresher: TokenRefresher | None = None
+        if refresh_in_background:
+            self._token_refresher = TokenRefresher(self).start()
+
+    @property
+    def token_refresher(self) -> TokenRefresher | None:
+        """The background token refresher, None if the token is refreshed on demand."""
+        return self._token_refresher
+
+    def _setup_session(self, session: requests.Session) -> None:
+        """Mount the retrying adapter and register the logging hook (once) on a session"""
+        session.mount("https://", self._http_adapter)
+        session.mount("http://", self._http_adapter)
+        if self._log_response not in session.hooks["response"]:
+            session.hooks["response"].append(self._log_response)
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """
+        Connection reuse counters of the pools of this client.
+
+        Between token refreshes steady-state polling should only increase `requests`,
+        `connections` grows when a keep-alive connection had to be (re-)established.
+        """
+        connections = requests_sent = 0
+        pools = self._http_adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+
+        return ConnectionStats(connections=connections, requests=requests_sent)
+
+    def _log_response(
+        self, response: requests.Response, *args: Any, **kwargs: Any
+    ) -> None:
+        # Runs for every response, so bail out before touching headers or body unless
+        # the output is actually wanted. The body is logged as received, decoding it
+        # is left to request() which needs it anyway.
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
+        _LOGGER.debug(
+            "\nRequest:\n\tMethod:%s\n\tURL: %s\n\tHeaders: %s"
+            "\nResponse:\n\tStatusCode: %s\n\tData: %s",
+            response.request.method,
+            response.request.url,
+            pprint.pformat(response.request.headers),
+            response.status_code,
+            response.text,
+        )
+
+    def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        """Request something from the API with a TadoRequest
+
+        Concurrent identical GET requests share one request and its parsed response.
+        """
+        if not self._is_read(request):
+            try:
+                return self._request(request)
+            finally:
+                # counted before invalidating, see _fetch
+                self._writes += 1
+                self._invalidate(request)
+                self._flights.forget()
+
+        if self._cache is not None:
+            response: dict[str, Any] | list[Any] | str | None = self._cache.get(
+                request, self._id
+            )
+            if response is not None:
+                return response
+
+        return self._flights.do(
+            request_key(request, self._id), lambda: self._fetch(request)
+        )
+
+    def _fetch(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        writes = self._writes
+        response = self._request(request)
+        # a write during the request invalidated the cache, the response may predate it
+        if self._cache is not None and self._writes == writes:
+            self._cache.put(request, response, self._id)
+        return response
+
+    def _request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        self._refresh_token()
+
+        headers = dict(self._headers)
+        data = self._configure_payload(headers, request)
+        url = self._configure_url(request)
+
+        http_request = requests.Request(
+            method=request.action, url=url, headers=headers, data=data
+        )
+        prepped = http_request.prepare()
+
+        delay = self._rate_limit.acquire(self._id, write=not self._is_read(request))
+        if delay > 0:
+            time.sleep(delay)
+
+        started = time.perf_counter()
+        response: requests.Response | None = None
+        try:
+            response = self._session.send(prepped)
+        except TadoWrongCredentialsException as e:
+            _LOGGER.error("Credentials Exception: %s", e)
+            raise e
+        except MaxRetryError as e:
+            _LOGGER.error("Max retries exceeded: %s", e)
+            raise TadoException(e) from e
+        finally:
+            if self._metrics is not None:
+                self._observe(request, prepped, response, time.perf_counter() - started)
+
+        self._rate_limit.update(self._id, response.headers, response.status_code)
+
+        if response.status_code == 429:
+            raise self._rate_limit_exception(response.headers)
+
+        if response.status_code == 401:
+            raise TadoWrongCredentialsException("Request failed with status code 401")
+
+        if response.text == "":
+            if response.status_code == 204:
+                # Tado changed some (all?) APIs from HTTP 200 to HTTP 204.
+                # Make sure that PyTado returns {"success": True} if Tado returns HTTP 204
+                # to ensure that the interface of this library is not changed. Can be removed
+                # on the next breaking release.
+                return {"success": True}
+            return {}
+
+        if response.status_code not in HTTP_CODES_OK:
+            _LOGGER.error(
+                "Request %s failed with status code %d: %s",
+                url,
+                response.status_code,
+                response.text,
+            )
+            raise TadoException(
+                f"Request failed with status code {response.status_code}"
+            )
+
+        response_json = response.json()
+        if isinstance(response_json, (dict, list, str)):
+            return response_json
+
+        raise TadoException("Unexpected response type")
+
+    def _observe(
+        self,
+        request: TadoRequest,
+        prepped: requests.PreparedRequest,
+        response: requests.Response | None,
+        latency: float,
+    ) -> None:
+        """Record a request in the metrics registry"""
+        assert self._metrics is not None
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        self._metrics.observe(
+            request,
+            method=prepped.method or str(request.action),
+            status=response.status_code if response is not None else STATUS_ERROR,
+            latency=latency,
+            retries=len(retries.history) if isinstance(retries, Retry) else 0,
+            bytes_out=len(prepped.body or b""),
+            bytes_in=len(response.content or b"") if response is not None else 0,
+        )
+
+    def _refresh_token(
+        self, refresh_token: str | None = None, force_refresh: bool = False
+    ) -> bool:
+        """
+        Refresh the OAuth token if it is about to expire or if forced.
+
+        Concurrent callers wait for a single refresh instead of each refreshing the token.
+
+        Args:
+            refresh_token (str | None, optional): The refresh token to use for obtaining a new
+                access token.
+            force_refresh (bool, optional): If True, forces a token refresh regardless of
+                expiration. Defaults to False.
+
+        Returns:
+            bool: True if the token was successfully refreshed, False if the refresh failed due
+                  to invalid credentials.
+
+        Raises:
+            TadoException: If a connection error occurs during the token refresh process.
+            TadoWrongCredentialsException: If the token refresh fails due to invalid credentials
+                and force_refresh is False.
+        """
+
+        if self._token_valid(force_refresh):
+            return True
+
+        with self._refresh_lock:
+            # another thread may have refreshed the token while we were waiting
+            if self._token_valid(force_refresh):
+                return True
+
+            # Keep the session: closing it would drop the keep-alive connections of the
+            # API hosts (and a session passed in by the caller) with every refresh.
+            data = self._refresh_token_data(refresh_token)
+
+            try:
+                response = self._session.request(
+                    "post",
+                    _TOKEN_URL,
+                    timeout=_DEFAULT_TIMEOUT,
+                    data=urlencode(data),
+                    headers=_FORM_HEADERS,
+                )
+
+            except requests.exceptions.ConnectionError as e:
+                _LOGGER.error("Connection error: %s", e)
+                raise TadoException(e) from e
+
+            if response.status_code != 200:
+                if force_refresh:
+                    _LOGGER.error(
+                        "Failed to refresh token, probably wrong credentials. Status code: %s",
+                        response.status_code,
+                    )
+                    return False
+
+                raise TadoWrongCredentialsException(
+                    "Failed to refresh token, probably wrong credentials. "
+                    f"Status code: {response.status_code}"
+                )
+
+            self._set_oauth_header(response.json())
+
+            return True
+
+    def _login_device_flow(self) -> DeviceActivationStatus:
+        """Start the login to the API using the device flow"""
+
+        if self._device_activation_status != DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device has been started already")
+
+        data = {
+            "client_id": self._client_id,
+            "scope": "offline_access",
+        }
+
+        try:
+            response = self._session.request(
+                method="post",
+                url=_DEVICE_AUTHORIZE_URL,
+                timeout=_DEFAULT_TIMEOUT,
+                data=urlencode(data),
+                headers=_FORM_HEADERS,
+            )
+        except requests.exceptions.ConnectionError as e:
+            raise TadoException(e) from e
+
+        if response.status_code != 200:
+            raise TadoException(
+                f"Login failed. Status code: {response.status_code} and reason: {response.reason}"
+            )
+
+        self._start_device_flow(response.json())
+
+        return DeviceActivationStatus.PENDING
+
+    def _check_device_activation(self) -> bool:
+        if self._device_flow_expired():
+            raise TadoException("User took too long to enter key")
+
+        # Await the desired interval, before polling the API again
+        time.sleep(self._device_flow_data.get("interval", 0))
+
+        try:
+            token_response = self._session.request(
+                method="post",
+                url=_TOKEN_URL,
+                params=self._device_token_params(),
+            )
+        except requests.exceptions.ConnectionError as e:
+            raise TadoException(e) from e
+
+        if token_response.status_code == 200:
+            self._set_oauth_header(token_response.json())
+            return True
+
+        # The user has not yet authorized the device, let's continue
+        if (
+            token_response.status_code == 400
+            and token_response.json()["error"] == "authorization_pending"
+        ):
+            _LOGGER.info(
+                "Authorization pending, waiting for user to authorize. Continue polling."
+            )
+            return False
+
+        raise TadoException(f"Login failed. Reason: {token_response.reason}")
+
+    def device_activation(self) -> None:
+        """Activate the device and get the refresh token"""
+
+        if self._device_activation_status == DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device flow has not yet started")
+
+        while True:
+            if self._check_device_activation():
+                break
+
+        self._device_ready()
+
+    def _device_ready(self) -> None:
+        """after device refresh code has been obtained"""
+        self._id = self._get_id()
+        self._set_device_ready(self._id, self._check_x_line_generation())
+
+    def _get_id(self) -> int:
+        return self._home_id_from_me(self.request(self._me_request()))
+
+    def _check_x_line_generation(self) -> bool:
+        # get home info
+        return self._is_x_line_home(self.request(self._home_request()))
+
+    def home_ids(self) -> list[int]:
+        """The ids of all homes of the account, from /me"""
+        return self._home_ids_from_me(self.request(self._me_request()))
+
+    def for_home(self, home_id: int, x_api: bool | None = None) -> "HomeHttp":
+        """
+        A client for another home of the account, see `HomeHttp`.
+
+        Args:
+            home_id (int): The id of the home.
+            x_api (bool | None): Whether it is a Tado X home, loaded from the API if None.
+        """
+        http = HomeHttp(self, home_id, bool(x_api))
+        if x_api is None:
+            http._x_api = http._check_x_line_generation()
+        return http
+
+
+class HomeHttp(Http):
+    """`Http` of one home of an account, created by `Http.for_home()`.
+
+    Sends the requests of its home with the token, session (and so the connection pool),
+    cache, rate limit budget and metrics of the client it was created from: any number of
+    homes need a single login and token refresh.
+    """
+
+    _account: Http
+
+    def __init__(self, account: Http, home_id: int, x_api: bool) -> None:
+        # no login, the state of the account client is shared instead
+        account = account._account if isinstance(account, HomeHttp) else account
+        self.__dict__.update(vars(account))
+        self._account = account
+        self._token_refresher = None
+        self._set_device_ready(home_id, x_api)
+
+    @property
+    def _headers(self) -> dict[str, str]:
+        return self._account._headers
+
+    @_headers.setter
+    def _headers(self, value: dict[str, str]) -> None:
+        self._account._headers = value
+
+    @property
+    def refresh_token(self) -> str | None:
+        """The refresh token of the account client"""
+        return self._account.refresh_token
+
+    def _refresh_token(
+        self, refresh_token: str | None = None, force_refresh: bool = False
+    ) -> bool:
+        return self._account._refresh_token(refresh_token, force_refresh)
+
+
+class AsyncHttp(BaseHttp):
+    """asyncio based API Request Class
+
+    Mirrors `Http`, but performs all I/O with an aiohttp ClientSession, so many homes
+    can be polled concurrently from one event loop. aiohttp is an optional dependency
+    (`pip install python-tado[async]`).
+
+    Example usage: async with AsyncHttp(token_file_path="/var/tado/token") as http:
+                       if http.device_activation_status == DeviceActivationStatus.PENDING:
+                           print(http.device_verification_url)
+                           await http.device_activation()
+                       tado = AsyncTado.from_http(http)
+    """
+
+    _session: "aiohttp.ClientSession | None"
+
+    def __init__(
+        self,
+        token_file_path: str | None = None,
+        saved_refresh_token: str | None = None,
+        http_session: "aiohttp.ClientSession | None" = None,
+        debug: bool = False,
+        user_agent: str | None = None,
+        client_id: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitBudget | None = None,
+        refresh_in_background: bool = False,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """
+        Initialize the asyncio HTTP client for interacting with the Tado API.
+
+        No I/O happens here, call `login()` (or use the client as async context manager)
+        before sending requests.
+
+        Args:
+            token_file_path (str | None): Path to the file where the token is stored.
+                If None, the token will not be saved to a file.
+            saved_refresh_token (str | None): A previously saved refresh token to use for
+                authentication. If None, a new token will be requested.
+            http_session (aiohttp.ClientSession | None): An optional pre-configured session.
+                If None, a new session will be created and closed by `close()`.
+            debug (bool): If True, enables debug logging. Defaults to False.
+            user_agent (str | None): Optional user-agent header to use for the HTTP requests.
+                If None, a default user-agent PyTado/<PyTado-version> will be used.
+            client_id (str | None): OAuth2 client_id to use for authentication.
+                If None, defaults to CLIENT_ID_DEVICE from PyTado.const.
+            cache (ResponseCache | None): Optional cache for the responses of GET requests.
+                If None, every request is sent to the API.
+            rate_limit (RateLimitBudget | None): Optional budget tracking the API rate limit,
+                e.g. shared with other clients or throttling GET requests. If None, a budget
+                which only keeps track is used.
+            refresh_in_background (bool): If True, the access token is renewed before it
+                expires by a TokenRefresher instead of on the request path.
+            metrics (MetricsRegistry | None): Optional registry recording latency, status
+                codes, retries and sizes of the requests, see PyTado.metrics.
+        """
+        super().__init__(
+            token_file_path=token_file_path,
+            debug=debug,
+            user_agent=user_agent,
+            client_id=client_id,
+            cache=cache,
+            rate_limit=rate_limit,
+            metrics=metrics,
+        )
+
+        self._saved_refresh_token = saved_refresh_token
+        self._session = http_session
+        self._owns_session = http_session is None
+        self._refresh_lock = asyncio.Lock()
+        self._flights = AsyncSingleFlight()
+        # number of writes sent, see Http
+        self._writes = 0
+        self._token_refresher = (
+            AsyncTokenRefresher(self) if refresh_in_background else None
+        )
+
+    async def __aenter__(self) -> Self:
+        await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise TadoException(
+                    "AsyncHttp requires aiohttp, install python-tado[async]"
+                ) from e
+
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=_DEFAULT_TIMEOUT)
+            )
+            self._owns_session = True
+
+        return self._session
+
+    @property
+    def token_refresher(self) -> AsyncTokenRefresher | None:
+        """The background token refresher, None if the token is refreshed on demand."""
+        return self._token_refresher
+
+    async def close(self) -> None:
+        """
+        Stop the background token refresher and close the underlying session, unless it
+        was provided by the caller
+        """
+        if self._token_refresher is not None:
+            await self._token_refresher.stop()
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def login(self) -> DeviceActivationStatus:
+        """Authenticate with the saved refresh token or start the device flow"""
+
+        if self._saved_refresh_token or self._load_token():
+            if await self._refresh_token(
+                refresh_token=self._saved_refresh_token, force_refresh=True
+            ):
+                try:
+                    await self._device_ready()
+                except Exception as exc:
+                    _LOGGER.warning(
+                        "Token refresh succeeded but home ID fetch failed (%s). "
+                        "Starting device flow.",
+                        exc,
+                    )
+                    self._discard_token()
+                    self._device_activation_status = await self._login_device_flow()
+            else:
+                self._device_activation_status = await self._login_device_flow()
+        else:
+            self._device_activation_status = await self._login_device_flow()
+
+        if self._token_refresher is not None:
+            self._token_refresher.start()
+
+        return self._device_activation_status
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: bytes | str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[int, Mapping[str, str], str]:
+        """Send a single HTTP request and return status code, headers and body"""
+        import aiohttp
+
+        try:
+            async with self._get_session().request(
+                method, url, headers=headers, data=data, params=params
+            ) as response:
+                text = await response.text()
+                _LOGGER.debug(
+                    "\nRequest:\n\tMethod:%s\n\tURL: %s\nResponse:\n\tStatusCode: %s"
+                    "\n\tData: %s",
+                    method,
+                    url,
+                    response.status,
+                    text,
+                )
+                return response.status, response.headers, text
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.error("Connection error: %s", e)
+            raise TadoException(e) from e
+
+    async def request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        """Request something from the API with a TadoRequest
+
+        Concurrent identical GET requests share one request and its parsed response.
+        """
+        if not self._is_read(request):
+            try:
+                return await self._request(request)
+            finally:
+                # counted before invalidating, see Http._fetch
+                self._writes += 1
+                self._invalidate(request)
+                self._flights.forget()
+
+        if self._cache is not None:
+            response: dict[str, Any] | list[Any] | str | None = self._cache.get(
+                request, self._id
+            )
+            if response is not None:
+                return response
+
+        return await self._flights.do(
+            request_key(request, self._id), lambda: self._fetch(request)
+        )
+
+    async def _fetch(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        writes = self._writes
+        response = await self._request(request)
+        # see Http._fetch
+        if self._cache is not None and self._writes == writes:
+            self._cache.put(request, response, self._id)
+        return response
+
+    async def _request(self, request: TadoRequest) -> dict[str, Any] | list[Any] | str:
+        await self._refresh_token()
+
+        headers = dict(self._headers)
+        data = self._configure_payload(headers, request)
+        url = self._configure_url(request)
+
+        delay = self._rate_limit.acquire(self._id, write=not self._is_read(request))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # same policy as the urllib3 Retry of the blocking client
+        started = time.perf_counter()
+        attempt = 0
+        status: int | None = None
+        text = ""
+        try:
+            for attempt in range(_DEFAULT_RETRIES + 1):
+                status, response_headers, text = await self._send(
+                    str(request.action), url, headers, data
+                )
+                # each response, also a retried one, syncs the budget, an error has none
+                self._rate_limit.update(self._id, response_headers, status)
+                if status not in _RETRY_STATUS_CODES or attempt == _DEFAULT_RETRIES:
+                    break
+                await asyncio.sleep(
+                    min(_DEFAULT_BACKOFF_FACTOR * (2**attempt), _DEFAULT_BACKOFF_MAX)
+                )
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe(
+                    request,
+                    method=str(request.action),
+                    status=STATUS_ERROR if status is None else status,
+                    latency=time.perf_counter() - started,
+                    retries=attempt,
+                    bytes_out=len(data),
+                    bytes_in=len(text.encode()),
+                )
+
+        if status == 429:
+            raise self._rate_limit_exception(response_headers)
+
+        if status == 401:
+            raise TadoWrongCredentialsException("Request failed with status code 401")
+
+        if text == "":
+            if status == 204:
+                # see Http.request
+                return {"success": True}
+            return {}
+
+        if status not in HTTP_CODES_OK:
+            _LOGGER.error(
+                "Request %s failed with status code %d: %s", url, status, text
+            )
+            raise TadoException(f"Request failed with status code {status}")
+
+        response_json = json.loads(text)
+        if isinstance(response_json, (dict, list, str)):
+            return response_json
+
+        raise TadoException("Unexpected response type")
+
+    async def _refresh_token(
+        self, refresh_token: str | None = None, force_refresh: bool = False
+    ) -> bool:
+        """
+        Refresh the OAuth token if it is about to expire or if forced.
+
+        Concurrent callers wait for a single refresh instead of each refreshing the token.
+
+        Returns:
+            bool: True if the token was successfully refreshed, False if the refresh failed due
+                  to invalid credentials.
+
+        Raises:
+            TadoException: If a connection error occurs during the token refresh process.
+            TadoWrongCredentialsException: If the token refresh fails due to invalid credentials
+                and force_refresh is False.
+        """
+
+        if self._token_valid(force_refresh):
+            return True
+
+        async with self._refresh_lock:
+            # another task may have refreshed the token while we were waiting
+            if self._token_valid(force_refresh):
+                return True
+
+            status, _, text = await self._send(
+                "POST",
+                _TOKEN_URL,
+                headers=_FORM_HEADERS,
+                data=urlencode(self._refresh_token_data(refresh_token)),
+            )
+
+            if status != 200:
+                if force_refresh:
+                    _LOGGER.error(
+                        "Failed to refresh token, probably wrong credentials. "
+                        "Status code: %s",
+                        status,
+                    )
+                    return False
+
+                raise TadoWrongCredentialsException(
+                    "Failed to refresh token, probably wrong credentials. "
+                    f"Status code: {status}"
+                )
+
+            self._set_oauth_header(json.loads(text))
+
+        return True
+
+    async def _login_device_flow(self) -> DeviceActivationStatus:
+        """Start the login to the API using the device flow"""
+
+        if self._device_activation_status != DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device has been started already")
+
+        data = {
+            "client_id": self._client_id,
+            "scope": "offline_access",
+        }
+
+        status, _, text = await self._send(
+            "POST", _DEVICE_AUTHORIZE_URL, headers=_FORM_HEADERS, data=urlencode(data)
+        )
+
+        if status != 200:
+            raise TadoException(f"Login failed. Status code: {status}")
+
+        self._start_device_flow(json.loads(text))
+
+        return DeviceActivationStatus.PENDING
+
+    async def _check_device_activation(self) -> bool:
+        if self._device_flow_expired():
+            raise TadoException("User took too long to enter key")
+
+        # Await the desired interval, before polling the API again
+        await asyncio.sleep(self._device_flow_data.get("interval", 0))
+
+        status, _, text = await self._send(
+            "POST", _TOKEN_URL, headers={}, params=self._device_token_params()
+        )
+
+        if status == 200:
+            self._set_oauth_header(json.loads(text))
+            return True
+
+        # The user has not yet authorized the device, let's continue
+        if status == 400 and json.loads(text).get("error") == "authorization_pending":
+            _LOGGER.info(
+                "Authorization pending, waiting for user to authorize. Continue polling."
+            )
+            return False
+
+        raise TadoException(f"Login failed. Status code: {status}")
+
+    async def device_activation(self) -> None:
+        """Activate the device and get the refresh token"""
+
+        if self._device_activation_status == DeviceActivationStatus.NOT_STARTED:
+            raise TadoException("The device flow has not yet started")
+
+        while True:
+            if await self._check_device_activation():
+                break
+
+        await self._device_ready()
+
+    async def _device_ready(self) -> None:
+        """after device refresh code has been obtained"""
+        self._id = self._home_id_from_me(await self.request(self._me_request()))
+        self._set_device_ready(
+            self._id, self._is_x_line_home(await self.request(self._home_request()))
+        )
+
+    async def home_ids(self) -> list[int]:
+        """See `Http.home_ids`"""
+        return self._home_ids_from_me(await self.request(self._me_request()))
+
+    async def for_home(
+        self, home_id: int, x_api: bool | None = None
+    ) -> "AsyncHomeHttp":
+        """See `Http.for_home`"""
+        http = AsyncHomeHttp(self, home_id, bool(x_api))
+        if x_api is None:
+            http._x_api = self._is_x_line_home(await http.request(self._home_request()))
+        return http
+
+
+class AsyncHomeHttp(AsyncHttp):
+    """`AsyncHttp` of one home of an account, see `HomeHttp`.
+
+    Closing it does nothing, the session belongs to the client it was created from.
+    """
+
+    _account: AsyncHttp
+
+    def __init__(self, account: AsyncHttp, home_id: int, x_api: bool) -> None:
+        # no login, the state of the account client is shared instead
+        account = account._account if isinstance(account, AsyncHomeHttp) else account
+        self.__dict__.update(vars(account))
+        self._account = account
+        self._owns_session = False
+        self._token_refresher = None
+        self._set_device_ready(home_id, x_api)
+
+    @property
+    def _headers(self) -> dict[str, str]:
+        return self._account._headers
+
+    @_headers.setter
+    def _headers(self, value: dict[str, str]) -> None:
+        self._account._headers = value
+
+    @property
+    def refresh_token(self) -> str | None:
+        """The refresh token of the account client"""
+        return self._account.refresh_token
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        return self._account._get_session()
+
+    async def _refresh_token(
+        self, refresh_token: str | None = None, force_refresh: bool = False
+    ) -> bool:
+        return await self._account._refresh_token(refresh_token, force_refresh)
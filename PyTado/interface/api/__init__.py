@@ -1,7 +1,10 @@
 """Module for all API interfaces."""
 
+from .async_base_tado import AsyncTadoBase
+from .async_hops_tado import AsyncTadoX
+from .async_my_tado import AsyncTado
 from .base_tado import TadoBase
 from .hops_tado import TadoX
 from .my_tado import Tado
 
-__all__ = ["Tado", "TadoX", "TadoBase"]
+__all__ = ["Tado", "TadoX", "TadoBase", "AsyncTado", "AsyncTadoX", "AsyncTadoBase"]
@@ -0,0 +1,358 @@
+"""
+asyncio PyTado interface implementation for hops.tado.com (Tado X).
+"""
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from typing import final
+
+from PyTado.exceptions import TadoNotSupportedException
+from PyTado.http import Action, Domain, Endpoint, TadoXRequest
+from PyTado.interface.api.async_base_tado import AsyncTadoBase
+from PyTado.interface.api.hops_tado import (
+    manual_control_request,
+    manual_control_result,
+)
+from PyTado.models.home import AirComfort
+from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
+from PyTado.models.line_x.installation import Installation
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.pre_line_x.flow_temperature_optimization import (
+    FlowTemperatureOptimization,
+)
+from PyTado.models.return_models import SuccessResult
+from PyTado.zone.async_hops_zone import AsyncTadoRoom
+from PyTado.zone.base_zone import ZoneOverlay
+
+
+@final
+class AsyncTadoX(AsyncTadoBase):
+    """Interacts with a Tado thermostat via hops.tado.com (Tado X) API using asyncio.
+
+    Example usage: tado = await AsyncTadoX.create(token_file_path="/var/tado/token")
+                   await tado.device_activation() # Activate the device, if pending
+                   await tado.get_climate(1) # Get climate, room 1.
+    """
+
+    def _check_generation(self) -> None:
+        if self._http.is_x_line is False:
+            raise TadoNotSupportedException(
+                "AsyncTadoX is only usable with LINE_X Generation"
+            )
+
+    # ------------------- Home methods -------------------
+
+    async def _get_rooms_and_devices(self) -> DevicesResponse:
+        request = TadoXRequest()
+        request.command = "roomsAndDevices"
+
+        return DevicesResponse.model_validate(await self._http.request(request))
+
+    async def get_devices(self) -> list[Device]:
+        """
+        Gets device information.
+        """
+
+        rooms_and_devices = await self._get_rooms_and_devices()
+
+        devices = [
+            device for room in rooms_and_devices.rooms for device in room.devices
+        ]
+        devices.extend(rooms_and_devices.other_devices)
+
+        return devices
+
+    async def get_zones(self) -> list[AsyncTadoRoom]:
+        """
+        Gets zones (or rooms in Tado X API) information.
+        """
+
+        zone_index = await self._load_zone_index()
+        self._zone_index = zone_index
+
+        rooms = []
+        for room_id, room in zone_index.items():
+            tado_room = AsyncTadoRoom(self, room_id)
+            tado_room._raw_room = room
+            rooms.append(tado_room)
+
+        return rooms
+
+    async def _load_zone_index(self) -> dict[int, DevicesRooms]:
+        rooms_and_devices = await self._get_rooms_and_devices()
+
+        return {room.room_id: room for room in rooms_and_devices.rooms}
+
+    async def get_zone_states(self) -> dict[str, RoomState]:
+        """
+        Gets current states of all zones/rooms.
+        """
+
+        rooms = (await self._get_zone_states_by_id()).values()
+
+        return {room.name: room for room in rooms}
+
+    async def _get_zone_states_by_id(self) -> dict[int, RoomState]:
+        request = TadoXRequest()
+        request.command = "rooms"
+
+        rooms = [
+            RoomState.model_validate(room) for room in await self._http.request(request)
+        ]
+
+        return {room.id: room for room in rooms}
+
+    async def get_air_comfort(self) -> AirComfort:
+        request = TadoXRequest()
+        request.command = "airComfort"
+
+        return AirComfort.model_validate(await self._http.request(request))
+
+    # ------------------- Zone methods -------------------
+
+    def get_zone(self, zone: int) -> AsyncTadoRoom:
+        """
+        Gets zone/room.
+        """
+        return AsyncTadoRoom(self, zone)
+
+    async def _set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay]) -> None:
+        await asyncio.gather(
+            *(
+                self.get_zone(room).set_zone_overlay(**vars(overlay))
+                for room, overlay in overlays.items()
+            )
+        )
+
+    async def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """See `TadoX.reset_zone_overlays`"""
+        await asyncio.gather(
+            *(self.get_zone(room).reset_zone_overlay() for room in zones)
+        )
+
+    async def get_state(self, zone: int) -> RoomState:
+        """
+        Gets current state of zone/room.
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{zone:d}"
+
+        return RoomState.model_validate(await self._http.request(request))
+
+    async def get_open_window_detected(self, zone: int) -> dict[str, bool]:
+        """
+        Returns whether an open window is detected.
+        """
+
+        room = self.get_zone(zone)
+        await room.update_state()
+
+        return {"openWindowDetected": room.open_window}
+
+    async def set_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to open
+        Note: This can only be set if an open window was detected in this zone
+        """
+        request = TadoXRequest()
+        request.command = f"rooms/{zone}/openWindow"
+        request.action = Action.SET
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def reset_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to closed
+        """
+        request = TadoXRequest()
+        request.command = f"rooms/{zone}/openWindow"
+        request.action = Action.RESET
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    # ------------------- Device methods -------------------
+
+    async def get_device_info(self, device_id: str, cmd: str = "") -> Device:
+        """
+        Gets information about devices
+        """
+
+        request = TadoXRequest()
+        request.command = f"devices/{device_id}"
+        return Device.model_validate(await self._http.request(request))
+
+    async def set_temp_offset(
+        self, device_id: str, offset: float = 0, measure: str = ""
+    ) -> SuccessResult:
+        """
+        Set the Temperature offset on the device.
+        """
+
+        request = TadoXRequest()
+        request.command = f"roomsAndDevices/devices/{device_id}"
+        request.action = Action.CHANGE
+        request.payload = {"temperatureOffset": offset}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_child_lock(self, device_id: str, child_lock: bool) -> SuccessResult:
+        """
+        Set and toggle the child lock on the device.
+        """
+
+        request = TadoXRequest()
+        request.command = f"roomsAndDevices/devices/{device_id}"
+        request.action = Action.CHANGE
+        request.payload = {"childLockEnabled": child_lock}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_flow_temperature_optimization(
+        self, max_flow_temperature: float
+    ) -> SuccessResult:
+        """
+        Set the flow temperature optimization.
+
+        max_flow_temperature: float, the maximum flow temperature in Celsius
+        """
+
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.command = "settings/flowTemperatureOptimization"
+        request.payload = {"maxFlowTemperature": max_flow_temperature}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_flow_temperature_optimization(self) -> FlowTemperatureOptimization:
+        """
+        Get the current flow temperature optimization
+        """
+
+        request = TadoXRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+        request.command = "settings/flowTemperatureOptimization"
+
+        return FlowTemperatureOptimization.model_validate(
+            await self._http.request(request)
+        )
+
+    async def boost_all_heating(self) -> SuccessResult:
+        """
+        Boost mode, expires after 30 minutes.
+        """
+        request = TadoXRequest()
+        request.action = Action.SET
+        request.domain = Domain.HOME
+        request.command = "quickActions/boost"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def disable_all_heating(self) -> SuccessResult:
+        """
+        Sets all rooms off, frost protection.
+        """
+        request = TadoXRequest()
+        request.action = Action.SET
+        request.domain = Domain.HOME
+        request.command = "quickActions/allOff"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def resume_all_schedules(self) -> SuccessResult:
+        """
+        Resumes regular schedule for all rooms, undo boost,
+        disable heating and manual settings.
+        """
+        request = TadoXRequest()
+        request.action = Action.SET
+        request.domain = Domain.HOME
+        request.command = "quickActions/resumeSchedule"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def delete_eiq_tariff(self, reader_id: int) -> SuccessResult:
+        """
+        Delete an earlier provided reading-id,
+        like "8c46366f-f3a8-4aed-be08-ebe1de3ff260"
+        """
+        request = TadoXRequest()
+        request.action = Action.RESET
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.EIQ
+        request.command = f"meterReadings/{reader_id}"
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_incident_detection(self, b_present: bool = True) -> SuccessResult:
+        """Enable or disable incident detection setting for this home.
+        {'supported': True, 'enabled': True}
+        """
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.MY_API
+        request.command = "incidentDetection"
+        request.payload = {"enabled": f"{b_present}"}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_boiler_presence(self, b_present: bool = True) -> SuccessResult:
+        """Sets boiler present or not, see `TadoX.set_boiler_presence`."""
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.MY_API
+        request.command = "heatingSystem/boiler"
+        request.payload = {"present": f"{b_present}"}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_underfloor_heating_presence(
+        self, b_present: bool = True
+    ) -> SuccessResult:
+        """
+        Inform about the presence of underfloor heating in this home
+        """
+        request = TadoXRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.endpoint = Endpoint.MY_API
+        request.command = "heatingSystem/underfloorHeating"
+        request.payload = {"present": f"{b_present}"}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def set_manual_control(
+        self,
+        room_id: int = 0,
+        power: str = "ON",
+        termination_type: str = "MANUAL",
+        m_temp: int = 18,
+        m_sec: int = 600,
+        m_boost: bool = False,
+    ) -> int:
+        """
+        Sets manual control for a specific room, see `TadoX.set_manual_control`.
+        """
+
+        request = manual_control_request(
+            room_id, power, termination_type, m_temp, m_sec, m_boost
+        )
+        if isinstance(request, int):
+            return request
+
+        return manual_control_result(await self._http.request(request))
+
+    async def get_installation(self) -> Installation:
+        """
+        Gets home installation details.
+        """
+
+        request = TadoXRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+
+        return Installation.model_validate(await self._http.request(request))
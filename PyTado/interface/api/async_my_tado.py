@@ -0,0 +1,375 @@
+"""
+asyncio PyTado interface implementation for app.tado.com.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import final
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Domain, Mode, TadoRequest
+from PyTado.interface.api.async_base_tado import AsyncTadoBase
+from PyTado.models import pre_line_x
+from PyTado.models.home import AirComfort
+from PyTado.models.pre_line_x.boiler import MaxOutputTemp, WiringInstallationState
+from PyTado.models.pre_line_x.device import Device
+from PyTado.models.pre_line_x.flow_temperature_optimization import (
+    FlowTemperatureOptimization,
+)
+from PyTado.models.pre_line_x.home import HeatingCircuit
+from PyTado.models.pre_line_x.zone import (
+    ZoneControl,
+    ZoneOverlayDefault,
+    ZoneState,
+)
+from PyTado.models.return_models import SuccessResult, TemperatureOffset
+from PyTado.types import Timetable
+from PyTado.zone.async_my_zone import AsyncTadoZone
+from PyTado.zone.base_zone import ZoneOverlay
+from PyTado.zone.my_zone import overlays_request, reset_overlays_request
+
+
+@final
+class AsyncTado(AsyncTadoBase):
+    """Interacts with a Tado thermostat via public my.tado.com API using asyncio.
+
+    Example usage: tado = await AsyncTado.create(token_file_path="/var/tado/token")
+                   await tado.device_activation() # Activate the device, if pending
+                   await tado.get_climate(1) # Get climate, zone 1.
+    """
+
+    def _check_generation(self) -> None:
+        if self._http.is_x_line:
+            raise TadoException("AsyncTado is only usable with V3/V2 Generation")
+
+    # ----------------- Home methods -----------------
+
+    async def get_devices(self) -> list[Device]:
+        """
+        Gets device information.
+        """
+
+        request = TadoRequest()
+        request.command = "devices"
+        return [
+            Device.model_validate(device)
+            for device in await self._http.request(request)
+        ]
+
+    async def get_zones(self) -> list[AsyncTadoZone]:
+        """
+        Gets zones information.
+        """
+
+        zone_index = await self._load_zone_index()
+        self._zone_index = zone_index
+
+        zones = []
+        for zone_id, zone in zone_index.items():
+            tado_zone = AsyncTadoZone(self, zone_id)
+            tado_zone._raw_room = zone
+            zones.append(tado_zone)
+
+        return zones
+
+    async def _load_zone_index(self) -> dict[int, pre_line_x.Zone]:
+        request = TadoRequest()
+        request.command = "zones"
+
+        zones = [
+            pre_line_x.Zone.model_validate(zone)
+            for zone in await self._http.request(request)
+        ]
+
+        return {zone.id: zone for zone in zones}
+
+    async def get_zone_states(self) -> dict[str, ZoneState]:
+        """
+        Gets current states of all zones.
+        """
+
+        return {
+            str(zone_id): state
+            for zone_id, state in (await self._get_zone_states_by_id()).items()
+        }
+
+    async def _get_zone_states_by_id(self) -> dict[int, ZoneState]:
+        request = TadoRequest()
+        request.command = "zoneStates"
+
+        response = await self._http.request(request)
+
+        if not isinstance(response, dict):
+            raise TadoException("Invalid response from Tado API")
+
+        return {
+            int(key): ZoneState.model_validate(value)
+            for key, value in response["zoneStates"].items()
+        }
+
+    async def get_air_comfort(self) -> AirComfort:
+        request = TadoRequest()
+        request.command = "airComfort"
+
+        return AirComfort.model_validate(await self._http.request(request))
+
+    async def get_heating_circuits(self) -> list[HeatingCircuit]:
+        """
+        Gets available heating circuits
+        """
+
+        request = TadoRequest()
+        request.command = "heatingCircuits"
+
+        return [
+            HeatingCircuit.model_validate(d) for d in await self._http.request(request)
+        ]
+
+    # ----------------- Zone methods -----------------
+
+    def get_zone(self, zone: int) -> AsyncTadoZone:
+        return AsyncTadoZone(self, zone)
+
+    async def _set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay]) -> None:
+        types = {}
+        for zone, overlay in overlays.items():
+            if overlay.device_type is None:
+                zone_data = await self._get_zone_data(zone)
+                if not isinstance(zone_data, pre_line_x.Zone):
+                    raise TadoException(f"Zone with id {zone} not found")
+                types[zone] = zone_data.type
+
+        await self._http.request(overlays_request(overlays, types))
+
+    async def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """See `Tado.reset_zone_overlays`"""
+        zones = list(zones)
+        if zones:
+            await self._http.request(reset_overlays_request(zones))
+
+    async def get_state(self, zone: int) -> ZoneState:
+        """
+        Gets current state of Zone.
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{zone}/state"
+
+        return ZoneState.model_validate(await self._http.request(request))
+
+    async def get_timetable(self, zone: int) -> Timetable:
+        """
+        Get the Timetable type currently active
+        """
+
+        return await self.get_zone(zone).get_timetable()
+
+    async def set_timetable(self, zone: int, timetable: Timetable) -> Timetable:
+        """
+        Set the Timetable type currently active
+        id = 0 : ONE_DAY (MONDAY_TO_SUNDAY)
+        id = 1 : THREE_DAY (MONDAY_TO_FRIDAY, SATURDAY, SUNDAY)
+        id = 3 : SEVEN_DAY (MONDAY, TUESDAY, WEDNESDAY ...)
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{zone:d}/schedule/activeTimetable"
+        request.action = Action.CHANGE
+        request.payload = {"id": timetable}
+        request.mode = Mode.PLAIN
+
+        response = await self._http.request(request)
+
+        if not isinstance(response, dict):
+            raise TadoException("Invalid response from Tado API")
+
+        return Timetable(int(response.get("id", -1)))
+
+    async def get_zone_overlay_default(self, zone: int) -> ZoneOverlayDefault:
+        """
+        Get current overlay default settings for zone.
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{zone:d}/defaultOverlay"
+
+        return ZoneOverlayDefault.model_validate(await self._http.request(request))
+
+    async def get_open_window_detected(self, zone: int) -> dict[str, bool]:
+        """
+        Returns whether an open window is detected.
+        """
+
+        data = await self.get_state(zone)
+
+        return {"openWindowDetected": data.open_window is not None}
+
+    async def set_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to open
+        Note: This can only be set if an open window was detected in this zone
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{zone:d}/state/openWindow/activate"
+        request.action = Action.SET
+        request.mode = Mode.PLAIN
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def reset_open_window(self, zone: int) -> SuccessResult:
+        """
+        Sets the window in zone to closed
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{zone:d}/state/openWindow"
+        request.action = Action.RESET
+        request.mode = Mode.PLAIN
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_zone_control(self, zone: int) -> ZoneControl:
+        """
+        Get zone control information
+        """
+
+        return await self.get_zone(zone).get_zone_control()
+
+    async def set_zone_heating_circuit(
+        self, zone: int, heating_circuit: int
+    ) -> ZoneControl:
+        """
+        Sets the heating circuit for a zone
+        """
+
+        return await self.get_zone(zone).set_zone_heating_circuit(heating_circuit)
+
+    # ----------------- Device methods -----------------
+
+    async def set_child_lock(self, device_id: str, child_lock: bool) -> SuccessResult:
+        """
+        Sets the child lock on a device
+        """
+
+        request = TadoRequest()
+        request.command = "childLock"
+        request.action = Action.CHANGE
+        request.device = device_id
+        request.domain = Domain.DEVICES
+        request.payload = {"childLockEnabled": child_lock}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_temp_offset(self, device_id: str) -> TemperatureOffset:
+        """
+        Get the Temperature offset on the device.
+        """
+        request = TadoRequest()
+        request.command = "temperatureOffset"
+        request.action = Action.GET
+        request.domain = Domain.DEVICES
+        request.device = device_id
+
+        return TemperatureOffset.model_validate(await self._http.request(request))
+
+    async def set_temp_offset(
+        self, device_id: str, offset: float = 0, measure: str = "celsius"
+    ) -> TemperatureOffset:
+        """
+        Set the Temperature offset on the device.
+        """
+
+        request = TadoRequest()
+        request.command = "temperatureOffset"
+        request.action = Action.CHANGE
+        request.domain = Domain.DEVICES
+        request.device = device_id
+        request.payload = {measure: offset}
+
+        return TemperatureOffset.model_validate(await self._http.request(request))
+
+    # ----------------- Boiler methods -----------------
+
+    async def get_boiler_install_state(
+        self, bridge_id: str, auth_key: str
+    ) -> WiringInstallationState:
+        """
+        Get the boiler wiring installation state from home by bridge endpoint
+        """
+
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME_BY_BRIDGE
+        request.device = bridge_id
+        request.command = "boilerWiringInstallationState"
+        request.params = {"authKey": auth_key}
+
+        return WiringInstallationState.model_validate(await self._http.request(request))
+
+    async def get_boiler_max_output_temperature(
+        self, bridge_id: str, auth_key: str
+    ) -> MaxOutputTemp:
+        """
+        Get the boiler max output temperature from home by bridge endpoint
+        """
+
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME_BY_BRIDGE
+        request.device = bridge_id
+        request.command = "boilerMaxOutputTemperature"
+        request.params = {"authKey": auth_key}
+
+        return MaxOutputTemp.model_validate(await self._http.request(request))
+
+    async def set_boiler_max_output_temperature(
+        self, bridge_id: str, auth_key: str, temperature_in_celcius: float
+    ) -> SuccessResult:
+        """
+        Set the boiler max output temperature with home by bridge endpoint
+        """
+
+        request = TadoRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME_BY_BRIDGE
+        request.device = bridge_id
+        request.command = "boilerMaxOutputTemperature"
+        request.params = {"authKey": auth_key}
+        request.payload = {
+            "boilerMaxOutputTemperatureInCelsius": temperature_in_celcius
+        }
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    # ----------------- Flow temperature methods -----------------
+
+    async def set_flow_temperature_optimization(
+        self, max_flow_temperature: float
+    ) -> SuccessResult:
+        """
+        Set the flow temperature optimization.
+
+        max_flow_temperature: float, the maximum flow temperature in Celsius
+        """
+
+        request = TadoRequest()
+        request.action = Action.CHANGE
+        request.domain = Domain.HOME
+        request.command = "flowTemperatureOptimization"
+        request.payload = {"maxFlowTemperature": max_flow_temperature}
+
+        return SuccessResult.model_validate(await self._http.request(request))
+
+    async def get_flow_temperature_optimization(self) -> FlowTemperatureOptimization:
+        """
+        Get the current flow temperature optimization
+        """
+
+        request = TadoRequest()
+        request.action = Action.GET
+        request.domain = Domain.HOME
+        request.command = "flowTemperatureOptimization"
+
+        return FlowTemperatureOptimization.model_validate(
+            await self._http.request(request)
+        )
@@ -3,10 +3,13 @@ Base class for Tado API classes.
 """
 
 import logging
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import date, timedelta
 from functools import cached_property
-from typing import Any, Self, overload
+from typing import Any, Literal, Self, TypeVar, overload
 
 import requests
 
@@ -19,8 +22,14 @@ from PyTado.http import (
     Http,
     TadoRequest,
 )
+from PyTado.interface.api.historic_range import (
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_WORKERS,
+    fetch_range,
+)
 from PyTado.logger import Logger
-from PyTado.models import Climate, Historic, line_x, pre_line_x
+from PyTado.models import Climate, Historic, HistoricColumns, line_x, pre_line_x
 from PyTado.models.home import (
     AirComfort,
     EIQMeterReading,
@@ -38,6 +47,7 @@ from PyTado.models.line_x.schedule import SetSchedule
 from PyTado.models.pre_line_x import Device, Schedule, ZoneState
 from PyTado.models.pre_line_x.zone import Capabilities, OpenWindow
 from PyTado.models.return_models import SuccessResult, TemperatureOffset
+from PyTado.poller import Poller, StateChange, Subscription
 from PyTado.types import (
     DayType,
     FanLevel,
@@ -51,17 +61,32 @@ from PyTado.types import (
     VerticalSwing,
     ZoneType,
 )
+from PyTado.zone.base_zone import ZoneOverlay
 from PyTado.zone.hops_zone import TadoRoom
 from PyTado.zone.my_zone import TadoZone
+from PyTado.zone.snapshot import HomeSnapshot
 
 _LOGGER = Logger(__name__)
 
+ZoneT = TypeVar("ZoneT", TadoZone, TadoRoom)
+
+# seconds get_zone() reuses a zone object with its loaded data, like the response cache
+# keeps zone states
+DEFAULT_ZONE_TTL = 10.0
+
 
 class TadoBase(metaclass=ABCMeta):
     """Base class for Tado API classes.
     Provides all common functionality for pre line X and line X systems."""
 
     _http: Http
+    _clock: Callable[[], float] = staticmethod(time.monotonic)
+
+    zone_ttl: float = DEFAULT_ZONE_TTL
+    """
+    Seconds `get_zone()` returns the zone object with the data it already loaded, 0 loads
+    the data again on every call. Any write of the client loads it again as well.
+    """
 
     def __init__(
         self,
@@ -89,6 +114,7 @@ class TadoBase(metaclass=ABCMeta):
             http_session=http_session,
             debug=debug,
         )
+        self._zones_lock = threading.Lock()
 
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
@@ -104,6 +130,7 @@ class TadoBase(metaclass=ABCMeta):
         """Creates an instance of Tado/TadoX from an existing Http object."""
         instance = cls.__new__(cls)
         instance._http = http
+        instance._zones_lock = threading.Lock()
 
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
@@ -172,6 +199,49 @@ class TadoBase(metaclass=ABCMeta):
     def get_zone_states(self) -> dict[str, ZoneState] | dict[str, RoomState]:
         """Gets current state of Zone as a TadoZone object."""
 
+    @abstractmethod
+    def _get_zone_states_by_id(self) -> dict[int, ZoneState] | dict[int, RoomState]:
+        """Gets current state of all zones/rooms by id, with a single request."""
+
+    def get_snapshot(self) -> HomeSnapshot:
+        """
+        Gets the state of all zones/rooms with a single request.
+
+        The returned snapshot maps zone ids to zone objects backed by the loaded state,
+        `HomeSnapshot.refresh()` reloads all of them with one request again.
+        """
+
+        return HomeSnapshot(self, self._get_zone_states_by_id())
+
+    @cached_property
+    def poller(self) -> Poller:
+        """The poller shared by the subscriptions of the home, see `subscribe()`."""
+        return Poller(self)
+
+    def subscribe(
+        self,
+        callback: Callable[[list[StateChange]], None],
+        *,
+        zone: int | Iterable[int] | None = None,
+        fields: str | Iterable[str] | None = None,
+    ) -> Subscription:
+        """
+        Calls the callback with the changes of the zone/room states from the next poll on.
+
+        All subscriptions of the home share one `poller`, it polls while there are any.
+        The presence of the home is the `tado_mode` field of the zone states.
+
+        Args:
+            callback: Called from the poller thread with the selected changes.
+            zone: The id(s) of the zone(s)/room(s), None for all.
+            fields: The names of the top level fields of the states which must have
+                changed (e.g. "setting", "overlay"), None for any.
+
+        Returns:
+            Subscription: Cancel it to stop receiving changes.
+        """
+        return self.poller.subscribe(callback, zone=zone, fields=fields)
+
     def get_home_state(self) -> HomeState:
         """
         Gets current state of Home.
@@ -310,9 +380,99 @@ class TadoBase(metaclass=ABCMeta):
 
     # ------------- Zone methods -------------
 
+    @abstractmethod
+    def _load_zone_index(
+        self,
+    ) -> dict[int, pre_line_x.Zone] | dict[int, line_x.DevicesRooms]:
+        """Loads the metadata (name, type, devices) of all zones/rooms by id."""
+
+    @cached_property
+    def _zone_index(
+        self,
+    ) -> dict[int, pre_line_x.Zone] | dict[int, line_x.DevicesRooms]:
+        return self._load_zone_index()
+
+    def refresh_zone_index(self) -> None:
+        """
+        Reloads the zone/room metadata shared by all zone objects of this home.
+
+        The metadata (name, type, devices) is loaded once per home, call this after zones
+        were added, renamed or devices were moved.
+        """
+        self.__dict__["_zone_index"] = self._load_zone_index()
+        with self._zones_lock:
+            entries = list(self._zones.values())
+        for _, _, tado_zone in entries:
+            tado_zone.__dict__.pop("_raw_room", None)
+
+    def invalidate_zone_index(self) -> None:
+        """
+        Drops the zone/room metadata, the zone capabilities and the zone objects known to
+        this home.
+
+        They are loaded again on their next use, e.g. after a device was replaced by one
+        with other capabilities.
+        """
+        self.__dict__.pop("_zone_index", None)
+        self._zone_capabilities.clear()
+        with self._zones_lock:
+            self._zones.clear()
+
+    @cached_property
+    def _zone_capabilities(self) -> dict[int, Capabilities]:
+        """The capabilities of the zones by id, loaded once per zone."""
+        return {}
+
+    def _get_zone_data(self, zone: int) -> pre_line_x.Zone | line_x.DevicesRooms | None:
+        """Gets the metadata of a zone/room from the shared index."""
+        zone_data = self._zone_index.get(zone)
+        if zone_data is None:
+            # the zone may have been added after the index was loaded
+            self.refresh_zone_index()
+            zone_data = self._zone_index.get(zone)
+
+        return zone_data
+
+    @cached_property
+    def _zones(self) -> dict[int, tuple[float, int, Any]]:
+        """
+        The zone objects by id, with the time and write count they were loaded at.
+        Only accessed while holding `_zones_lock`.
+        """
+        return {}
+
+    @abstractmethod
+    def _create_zone(self, zone: int) -> TadoZone | TadoRoom:
+        """Creates a new zone object, which is not shared with `get_zone()`."""
+
+    def _reuse_zone(self, zone: int, create: Callable[[int], ZoneT]) -> ZoneT:
+        """
+        Gets the zone object of this home, so the data it loaded is shared by repeated
+        calls. A stale object is kept, but its data is loaded again on the next access.
+        """
+        now = self._clock()
+        writes = self._http._writes
+        tado_zone: ZoneT
+        with self._zones_lock:
+            entry = self._zones.get(zone)
+            if entry is None:
+                tado_zone = create(zone)
+            else:
+                loaded_at, loaded_writes, tado_zone = entry
+                if now - loaded_at < self.zone_ttl and loaded_writes == writes:
+                    return tado_zone
+                tado_zone.update()
+
+            self._zones[zone] = (now, writes, tado_zone)
+            return tado_zone
+
     @abstractmethod
     def get_zone(self, zone: int) -> TadoZone | TadoRoom:
-        """Gets the specified zone as a TadoZone or TadoRoom object."""
+        """
+        Gets the specified zone as a TadoZone or TadoRoom object.
+
+        Repeated calls return the same object within `zone_ttl`, see `_reuse_zone()`.
+        """
 
     @abstractmethod
     def get_zone_state(self, zone: int) -> ZoneState | RoomState:
@@ -336,6 +496,67 @@ class TadoBase(metaclass=ABCMeta):
         """
         return self.get_zone(zone).get_historic(day_report_date)
 
+    def get_historic_columns(self, zone: int, day_report_date: date) -> HistoricColumns:
+        """
+        Gets historic information on given date for zone as columns, see HistoricColumns
+        """
+        return self.get_zone(zone).get_historic_columns(day_report_date)
+
+    @overload
+    def get_historic_range(
+        self,
+        zones: Iterable[int],
+        start: date,
+        end: date,
+        columns: Literal[False] = False,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> Iterator[tuple[int, date, Historic]]: ...
+
+    @overload
+    def get_historic_range(
+        self,
+        zones: Iterable[int],
+        start: date,
+        end: date,
+        columns: Literal[True],
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> Iterator[tuple[int, date, HistoricColumns]]: ...
+
+    def get_historic_range(
+        self,
+        zones: Iterable[int],
+        start: date,
+        end: date,
+        columns: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> Iterator[tuple[int, date, Historic | HistoricColumns]]:
+        """
+        Gets the day reports of the zones for every day from start to end (included).
+
+        The reports are fetched by a pool of workers and yielded as they finish, in date
+        order and then in the order of the zones, see PyTado.interface.api.historic_range.
+
+        Args:
+            zones: The zone (or room) ids.
+            start: The first day.
+            end: The last day.
+            columns: Yield HistoricColumns instead of Historic models.
+            workers: Maximum number of concurrent requests.
+            retries: Retries of a failed day before its error is raised.
+            retry_delay: Seconds before the first retry, doubled for every further one.
+
+        Yields:
+            (zone, day, report) tuples.
+        """
+        fetch = self.get_historic_columns if columns else self.get_historic
+        return fetch_range(fetch, zones, start, end, workers, retries, retry_delay)
+
     @overload
     def get_schedule(
         self, zone: int, timetable: Timetable, day: DayType
@@ -392,6 +613,30 @@ class TadoBase(metaclass=ABCMeta):
         """Resets the zone overlay for the specified zone."""
         self.get_zone(zone).reset_zone_overlay()
 
+    def set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay | None]) -> None:
+        """
+        Sets the overlays of several zones at once, None resets the overlay of a zone.
+
+        The zone types come from the shared zone index. Pre line X homes set (and reset)
+        all overlays with one request, Tado X rooms are written concurrently.
+
+        Example usage: tado.set_zone_overlays(
+                           {zone: ZoneOverlay(OverlayMode.MANUAL, 22.0) for zone in (1, 2)}
+                       )
+        """
+        updates = {zone: o for zone, o in overlays.items() if o is not None}
+        if updates:
+            self._set_zone_overlays(updates)
+        self.reset_zone_overlays(zone for zone, o in overlays.items() if o is None)
+
+    @abstractmethod
+    def _set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay]) -> None:
+        """Sets the overlays of several zones."""
+
+    @abstractmethod
+    def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """Resets the overlays of several zones at once, see `set_zone_overlays()`."""
+
     @overload
     def set_zone_overlay(
         self,
@@ -458,7 +703,7 @@ class TadoBase(metaclass=ABCMeta):
         Returns the state of the window for zone
         """
 
-        return self.get_state(zone).open_window
+        return self.get_zone(zone).open_window_state
 
     @abstractmethod
     def get_open_window_detected(self, zone: int) -> dict[str, Any]:
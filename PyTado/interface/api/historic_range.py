@@ -0,0 +1,133 @@
+"""
+Fetch the day reports of several zones over a date range.
+
+The reports are fetched by a bounded number of workers (threads for `Tado`, tasks for
+`AsyncTado`) and yielded in date order, then in the order of the zones, as soon as they
+and all reports before them are done. At most `2 * workers` reports are fetched ahead
+of the consumer, so memory stays bounded however long the range is.
+
+Every request goes through the rate limit budget of the client, see PyTado.ratelimit.
+Failed days are retried with an exponential backoff, a `TadoRateLimitException` (the
+budget is exhausted) is raised right away.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import TypeVar
+
+from PyTado.exceptions import TadoException, TadoRateLimitException
+from PyTado.logger import Logger
+
+_LOGGER = Logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_DELAY = 1.0
+
+# connection errors of requests and aiohttp are OSErrors
+_RETRIED_ERRORS = (TadoException, OSError)
+
+
+def report_days(start: date, end: date) -> Iterator[date]:
+    """The days from start to end, both included"""
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+
+def _jobs(zones: Iterable[int], start: date, end: date) -> Iterator[tuple[int, date]]:
+    zones = list(zones)
+    for day in report_days(start, end):
+        for zone in zones:
+            yield zone, day
+
+
+def _check_retry(
+    zone: int, day: date, attempt: int, retries: int, e: Exception
+) -> None:
+    if isinstance(e, TadoRateLimitException) or attempt == retries:
+        raise e
+    _LOGGER.warning(
+        "Day report of zone %d for %s failed (%s), retrying", zone, day.isoformat(), e
+    )
+
+
+def fetch_range(
+    fetch: Callable[[int, date], T],
+    zones: Iterable[int],
+    start: date,
+    end: date,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+) -> Iterator[tuple[int, date, T]]:
+    """Yield (zone, day, fetch(zone, day)) in date order, fetched by a thread pool"""
+
+    def fetch_day(zone: int, day: date) -> T:
+        for attempt in range(retries + 1):
+            try:
+                return fetch(zone, day)
+            except _RETRIED_ERRORS as e:
+                _check_retry(zone, day, attempt, retries, e)
+            time.sleep(retry_delay * 2**attempt)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    pool = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="PyTado historic range"
+    )
+    pending: deque[tuple[int, date, Future[T]]] = deque()
+    try:
+        for zone, day in _jobs(zones, start, end):
+            pending.append((zone, day, pool.submit(fetch_day, zone, day)))
+            if len(pending) >= 2 * workers:
+                zone, day, future = pending.popleft()
+                yield zone, day, future.result()
+        while pending:
+            zone, day, future = pending.popleft()
+            yield zone, day, future.result()
+    finally:
+        # e.g. the consumer stopped early or a day failed: drop the queued days
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_fetch_range(
+    fetch: Callable[[int, date], Awaitable[T]],
+    zones: Iterable[int],
+    start: date,
+    end: date,
+    workers: int = DEFAULT_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+) -> AsyncIterator[tuple[int, date, T]]:
+    """See `fetch_range`, fetched by at most `workers` concurrent tasks"""
+    semaphore = asyncio.Semaphore(workers)
+
+    async def fetch_day(zone: int, day: date) -> T:
+        for attempt in range(retries + 1):
+            try:
+                async with semaphore:
+                    return await fetch(zone, day)
+            except _RETRIED_ERRORS as e:
+                _check_retry(zone, day, attempt, retries, e)
+            await asyncio.sleep(retry_delay * 2**attempt)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    pending: deque[tuple[int, date, asyncio.Task[T]]] = deque()
+    try:
+        for zone, day in _jobs(zones, start, end):
+            pending.append((zone, day, asyncio.create_task(fetch_day(zone, day))))
+            if len(pending) >= 2 * workers:
+                zone, day, task = pending.popleft()
+                yield zone, day, await task
+        while pending:
+            zone, day, task = pending.popleft()
+            yield zone, day, await task
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
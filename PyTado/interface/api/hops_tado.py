@@ -2,6 +2,8 @@
 PyTado interface implementation for hops.tado.com (Tado X).
 """
 
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, final
 
 import requests
@@ -9,20 +11,106 @@ import requests
 from PyTado.exceptions import TadoNotSupportedException
 from PyTado.http import Action, Domain, Endpoint, TadoXRequest
 from PyTado.interface.api.base_tado import TadoBase
+from PyTado.interface.api.historic_range import DEFAULT_WORKERS
 from PyTado.logger import Logger
 from PyTado.models.home import AirComfort
-from PyTado.models.line_x.device import Device, DevicesResponse
+from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
 from PyTado.models.line_x.installation import Installation
 from PyTado.models.line_x.room import RoomState
 from PyTado.models.pre_line_x.flow_temperature_optimization import (
     FlowTemperatureOptimization,
 )
 from PyTado.models.return_models import SuccessResult
+from PyTado.zone.base_zone import ZoneOverlay
 from PyTado.zone.hops_zone import TadoRoom
 
 _LOGGER = Logger(__name__)
 
 
+def manual_control_request(
+    room_id: int,
+    power: str,
+    termination_type: str,
+    m_temp: int,
+    m_sec: int,
+    m_boost: bool,
+) -> TadoXRequest | int:
+    """
+    The request setting manual control for a room, see `TadoX.set_manual_control`, or
+    the error code if the arguments are incomplete.
+    """
+
+    data1: dict[str, Any] = {}
+
+    if power == "OFF":
+
+        if termination_type == "TIMER":
+
+            if m_sec == 0:
+                return -2
+
+            data1 = {
+                "setting": {"power": "OFF"},
+                "termination": {
+                    "type": "TIMER",
+                    "durationInSeconds": f"{m_sec}",
+                },
+            }
+
+        else:
+            data1 = {
+                "setting": {"power": "OFF"},
+                "termination": {"type": f"{termination_type}"},
+            }
+
+    else:
+
+        if m_temp == 0:
+            return -1
+
+        if termination_type == "TIMER":
+
+            if m_sec == 0:
+                return -2
+
+            data1 = {
+                "setting": {
+                    "power": "ON",
+                    "isBoost": f"{m_boost}",
+                    "temperature": {"value": f"{m_temp}"},
+                },
+                "termination": {
+                    "type": "TIMER",
+                    "durationInSeconds": f"{m_sec}",
+                },
+            }
+
+        else:
+            data1 = {
+                "setting": {
+                    "power": "ON",
+                    "isBoost": f"{m_boost}",
+                    "temperature": {"value": f"{m_temp}"},
+                },
+                "termination": {"type": f"{termination_type}"},
+            }
+
+    request = TadoXRequest()
+    request.action = Action.SET
+    request.domain = Domain.HOME
+    request.command = f"rooms/{room_id}/manualControl"
+    request.payload = data1
+    return request
+
+
+def manual_control_result(result: Any) -> int:
+    """The result code of a manual control request."""
+    if isinstance(result, str) and result.isdigit():
+        return int(result)
+
+    raise TadoNotSupportedException("Unexpected response from set_manual_control")
+
+
 @final
 class TadoX(TadoBase):
     """Interacts with a Tado thermostat via hops.tado.com (Tado X) API.
@@ -71,23 +159,33 @@ class TadoX(TadoBase):
         Gets zones (or rooms in Tado X API) information.
         """
 
+        self.refresh_zone_index()
+
+        return [self.get_zone(room_id) for room_id in self._zone_index]
+
+    def _load_zone_index(self) -> dict[int, DevicesRooms]:
         request = TadoXRequest()
         request.command = "roomsAndDevices"
         rooms_and_devices = DevicesResponse.model_validate(self._http.request(request))
 
-        return [TadoRoom(self, room.room_id) for room in rooms_and_devices.rooms]
+        return {room.room_id: room for room in rooms_and_devices.rooms}
 
     def get_zone_states(self) -> dict[str, RoomState]:
         """
         Gets current states of all zones/rooms.
         """
 
+        rooms = self._get_zone_states_by_id().values()
+
+        return {room.name: room for room in rooms}
+
+    def _get_zone_states_by_id(self) -> dict[int, RoomState]:
         request = TadoXRequest()
         request.command = "rooms"
 
         rooms = [RoomState.model_validate(room) for room in self._http.request(request)]
 
-        return {room.name: room for room in rooms}
+        return {room.id: room for room in rooms}
 
     def get_zone_state(self, zone: int) -> RoomState:
         """
@@ -108,8 +206,38 @@ class TadoX(TadoBase):
         """
         Gets zone/room.
         """
+        return self._reuse_zone(zone, self._create_zone)
+
+    def _create_zone(self, zone: int) -> TadoRoom:
         return TadoRoom(self, zone)
 
+    def _set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay]) -> None:
+        self._concurrently(
+            lambda item: self.get_zone(item[0]).set_zone_overlay(**vars(item[1])),
+            list(overlays.items()),
+        )
+
+    def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """
+        Resets the overlays of several rooms, the requests are sent concurrently.
+        """
+        self._concurrently(
+            lambda room: self.get_zone(room).reset_zone_overlay(), list(zones)
+        )
+
+    @staticmethod
+    def _concurrently(func: Callable[[Any], Any], items: list[Any]) -> None:
+        """Call func with the items in a thread pool, raises the first failure"""
+        if len(items) <= 1:
+            for item in items:
+                func(item)
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), DEFAULT_WORKERS),
+            thread_name_prefix="PyTado overlays",
+        ) as pool:
+            list(pool.map(func, items))
+
     def get_state(self, zone: int) -> RoomState:
         """
         Gets current state of zone/room.
@@ -338,73 +466,13 @@ class TadoX(TadoBase):
         -2 missing seconds for timer
         """
 
-        data1: dict[str, Any] = {}
-
-        if power == "OFF":
-
-            if termination_type == "TIMER":
-
-                if m_sec == 0:
-                    return -2
-
-                data1 = {
-                    "setting": {"power": "OFF"},
-                    "termination": {
-                        "type": "TIMER",
-                        "durationInSeconds": f"{m_sec}",
-                    },
-                }
-
-            else:
-                data1 = {
-                    "setting": {"power": "OFF"},
-                    "termination": {"type": f"{termination_type}"},
-                }
-
-        else:
-
-            if m_temp == 0:
-                return -1
-
-            if termination_type == "TIMER":
-
-                if m_sec == 0:
-                    return -2
-
-                data1 = {
-                    "setting": {
-                        "power": "ON",
-                        "isBoost": f"{m_boost}",
-                        "temperature": {"value": f"{m_temp}"},
-                    },
-                    "termination": {
-                        "type": "TIMER",
-                        "durationInSeconds": f"{m_sec}",
-                    },
-                }
-
-            else:
-                data1 = {
-                    "setting": {
-                        "power": "ON",
-                        "isBoost": f"{m_boost}",
-                        "temperature": {"value": f"{m_temp}"},
-                    },
-                    "termination": {"type": f"{termination_type}"},
-                }
-
-        request = TadoXRequest()
-        request.action = Action.SET
-        request.domain = Domain.HOME
-        request.command = f"rooms/{room_id}/manualControl"
-        request.payload = data1
-
-        result = self._http.request(request)
-
-        if isinstance(result, str) and result.isdigit():
-            return int(result)
+        request = manual_control_request(
+            room_id, power, termination_type, m_temp, m_sec, m_boost
+        )
+        if isinstance(request, int):
+            return request
 
-        raise TadoNotSupportedException("Unexpected response from set_manual_control")
+        return manual_control_result(self._http.request(request))
 
     def get_installation(self) -> Installation:
         """
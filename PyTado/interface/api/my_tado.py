@@ -2,6 +2,7 @@
 PyTado interface implementation for app.tado.com.
 """
 
+from collections.abc import Iterable, Mapping
 from typing import Any, final
 
 from PyTado.exceptions import TadoException
@@ -21,7 +22,8 @@ from PyTado.models.pre_line_x.zone import (
     ZoneState,
 )
 from PyTado.models.return_models import SuccessResult, TemperatureOffset
-from PyTado.zone.my_zone import TadoZone
+from PyTado.zone.base_zone import ZoneOverlay
+from PyTado.zone.my_zone import TadoZone, overlays_request, reset_overlays_request
 
 
 @final
@@ -61,19 +63,31 @@ class Tado(TadoBase):
         Gets zones information.
         """
 
+        self.refresh_zone_index()
+
+        return [self.get_zone(zone_id) for zone_id in self._zone_index]
+
+    def _load_zone_index(self) -> dict[int, pre_line_x.Zone]:
         request = TadoRequest()
         request.command = "zones"
 
-        return [
-            TadoZone(self, pre_line_x.Zone.model_validate(zone).id)
-            for zone in self._http.request(request)
+        zones = [
+            pre_line_x.Zone.model_validate(zone) for zone in self._http.request(request)
         ]
 
+        return {zone.id: zone for zone in zones}
+
     def get_zone_states(self) -> dict[str, ZoneState]:
         """
         Gets current states of all zones.
         """
 
+        return {
+            str(zone_id): state
+            for zone_id, state in self._get_zone_states_by_id().items()
+        }
+
+    def _get_zone_states_by_id(self) -> dict[int, ZoneState]:
         request = TadoRequest()
         request.command = "zoneStates"
 
@@ -83,7 +97,7 @@ class Tado(TadoBase):
             raise TadoException("Invalid response from Tado API")
 
         return {
-            key: ZoneState.model_validate(value)
+            int(key): ZoneState.model_validate(value)
             for key, value in response["zoneStates"].items()
         }
 
@@ -106,8 +120,30 @@ class Tado(TadoBase):
     # ----------------- Zone methods -----------------
 
     def get_zone(self, zone: int) -> TadoZone:
+        return self._reuse_zone(zone, self._create_zone)
+
+    def _create_zone(self, zone: int) -> TadoZone:
         return TadoZone(self, zone)
 
+    def _set_zone_overlays(self, overlays: Mapping[int, ZoneOverlay]) -> None:
+        types = {}
+        for zone, overlay in overlays.items():
+            if overlay.device_type is None:
+                zone_data = self._get_zone_data(zone)
+                if not isinstance(zone_data, pre_line_x.Zone):
+                    raise TadoException(f"Zone with id {zone} not found")
+                types[zone] = zone_data.type
+
+        self._http.request(overlays_request(overlays, types))
+
+    def reset_zone_overlays(self, zones: Iterable[int]) -> None:
+        """
+        Resets the overlays of several zones with one request.
+        """
+        zones = list(zones)
+        if zones:
+            self._http.request(reset_overlays_request(zones))
+
     def get_zone_state(self, zone: int) -> ZoneState:
         """
         Gets current state of Zone as a TadoZone object.
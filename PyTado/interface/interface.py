@@ -9,8 +9,11 @@ from typing import Any, Callable, TypeVar, cast
 import requests
 
 import PyTado.interface.api as API
+from PyTado.cache import ResponseCache
 from PyTado.exceptions import TadoException
 from PyTado.http import DeviceActivationStatus, Http
+from PyTado.metrics import MetricsRegistry
+from PyTado.ratelimit import RateLimitBudget
 
 F = TypeVar("F", bound=Callable[..., Any])  # Type variable for function
 
@@ -59,6 +62,11 @@ class Tado:
         debug: bool = False,
         user_agent: str | None = None,
         client_id: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limit: RateLimitBudget | None = None,
+        refresh_in_background: bool = False,
+        transport: requests.adapters.HTTPAdapter | None = None,
+        metrics: MetricsRegistry | None = None,
     ):
         """
         Initializes the interface class.
@@ -75,6 +83,16 @@ class Tado:
                 If None, a default user-agent PyTado/<PyTado-version> will be used.
             client_id (str | None): OAuth2 client_id. If None, defaults to CLIENT_ID_DEVICE
                 from PyTado.const. Pass a custom value instead of patching the module global.
+            cache (ResponseCache | None): Optional cache for the responses of GET requests,
+                see PyTado.cache. Defaults to None (no caching).
+            rate_limit (RateLimitBudget | None): Optional budget of the API rate limit,
+                see PyTado.ratelimit. Defaults to None (only keep track of the rate limit).
+            refresh_in_background (bool, optional): Renew the access token in a background
+                thread before it expires, see PyTado.refresher. Defaults to False.
+            transport (requests.adapters.HTTPAdapter | None, optional): Adapter sending the
+                requests, e.g. of PyTado.testing.FakeTadoServer. Defaults to None.
+            metrics (MetricsRegistry | None, optional): Registry recording the requests,
+                see PyTado.metrics. Defaults to None (no metrics).
         """
 
         self._http = Http(
@@ -84,6 +102,11 @@ class Tado:
             debug=debug,
             user_agent=user_agent,
             client_id=client_id,
+            cache=cache,
+            rate_limit=rate_limit,
+            refresh_in_background=refresh_in_background,
+            transport=transport,
+            metrics=metrics,
         )
         self._api: API.Tado | API.TadoX | None = None
         self._debug = debug
@@ -142,6 +165,15 @@ class Tado:
         """
         return self._http.refresh_token
 
+    def get_remaining_quota(self) -> int | None:
+        """
+        Estimated number of API requests left for the home, from the RateLimit headers.
+
+        Returns:
+            int | None: The remaining requests, or None if no response announced them yet.
+        """
+        return self._http.remaining_quota
+
     def _ensure_api_initialized(self) -> None:
         """
         Ensures the API client is initialized.
@@ -0,0 +1,255 @@
+"""
+Request metrics of the API clients.
+
+`Http` and `AsyncHttp` accept a `MetricsRegistry` which records every request sent to
+the API per endpoint, templated command (e.g. `zones/{id}/state`) and method: a latency
+histogram, the counts per status code, the retries of the request, the bytes sent and
+received and the rate limited (429) responses.
+
+Example usage: metrics = MetricsRegistry()
+               tado = Tado(metrics=metrics)
+               ...
+               print(metrics.snapshot())
+               print(metrics.to_prometheus())
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from PyTado.http import TadoRequest  # pragma: no cover
+
+# upper bounds in seconds, as the default buckets of the Prometheus clients
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+# status label of requests which got no response, e.g. after a connection error
+STATUS_ERROR = "error"
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/|$)")
+_DATE_SEGMENT = re.compile(r"(?<=/)\d{4}-\d{2}-\d{2}(?=/|$)|^\d{4}-\d{2}-\d{2}(?=/|$)")
+
+SeriesKey = tuple[str, str, str]
+
+
+def template_command(command: str | None) -> str:
+    """
+    Command without its query string and with the numeric ids and dates replaced,
+    e.g. zones/1/state -> zones/{id}/state, so every label has a bounded number of
+    values.
+    """
+    path = (command or "").split("?", 1)[0]
+    return _ID_SEGMENT.sub("{id}", _DATE_SEGMENT.sub("{date}", path))
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Latency histogram, counts per bucket are not cumulative"""
+
+    buckets: tuple[float, ...]
+    """Upper bounds in seconds, the last bucket (counts[-1]) is +Inf"""
+    counts: tuple[int, ...]
+    sum: float
+    count: int
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, inf if above all buckets"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Metrics of the requests to one endpoint, templated command and method"""
+
+    endpoint: str
+    command: str
+    method: str
+    statuses: Mapping[str, int]
+    retries: int
+    bytes_out: int
+    bytes_in: int
+    rate_limited: int
+    latency: HistogramSnapshot
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+
+@dataclass
+class _Series:
+    counts: list[int]
+    sum: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    rate_limited: int = 0
+
+
+class MetricsRegistry:
+    """In-memory, thread safe registry of request metrics.
+
+    Can be shared by several `Http`/`AsyncHttp` clients.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Args:
+            buckets: Upper bounds of the latency histogram buckets in seconds.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._series: dict[SeriesKey, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        request: "TadoRequest",
+        method: str,
+        status: int | str,
+        latency: float,
+        retries: int = 0,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+    ) -> None:
+        """
+        Records a request.
+
+        Args:
+            request: The request.
+            method: The HTTP method it was sent with.
+            status: The status code of the response, `STATUS_ERROR` if there was none.
+            latency: Seconds from sending the request to the response, retries included.
+            retries: Number of retries of the request.
+            bytes_out: Size of the request body.
+            bytes_in: Size of the response body.
+        """
+        command = template_command(request.command) or str(request.domain)
+        key = (request.endpoint.name, command, method)
+        status = str(status)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series([0] * (len(self._buckets) + 1))
+
+            series.counts[bisect_left(self._buckets, latency)] += 1
+            series.sum += latency
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.retries += retries
+            series.bytes_out += bytes_out
+            series.bytes_in += bytes_in
+            if status == "429":
+                series.rate_limited += 1
+
+    def snapshot(self) -> list[RequestMetrics]:
+        """Copy of the current metrics, one entry per endpoint, command and method"""
+        with self._lock:
+            return [
+                RequestMetrics(
+                    endpoint=endpoint,
+                    command=command,
+                    method=method,
+                    statuses=MappingProxyType(dict(series.statuses)),
+                    retries=series.retries,
+                    bytes_out=series.bytes_out,
+                    bytes_in=series.bytes_in,
+                    rate_limited=series.rate_limited,
+                    latency=HistogramSnapshot(
+                        buckets=self._buckets,
+                        counts=tuple(series.counts),
+                        sum=series.sum,
+                        count=sum(series.counts),
+                    ),
+                )
+                for (endpoint, command, method), series in sorted(self._series.items())
+            ]
+
+    def reset(self) -> None:
+        """Drops all recorded metrics"""
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self, prefix: str = "pytado") -> str:
+        """The metrics in the Prometheus text exposition format"""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        snapshot = self.snapshot()
+
+        name = family("requests_total", "counter", "Requests sent to the Tado API.")
+        for metrics in snapshot:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f"{name}{_labels(metrics, status=status)} {count}")
+
+        name = family(
+            "request_duration_seconds", "histogram", "Latency of the requests."
+        )
+        for metrics in snapshot:
+            cumulative = 0
+            bounds = [*(_number(b) for b in metrics.latency.buckets), "+Inf"]
+            for bound, count in zip(bounds, metrics.latency.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(metrics, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(metrics)} {_number(metrics.latency.sum)}")
+            lines.append(f"{name}_count{_labels(metrics)} {metrics.latency.count}")
+
+        for attribute, help_text in (
+            ("retries", "Retries of the requests."),
+            ("bytes_out", "Bytes sent in request bodies."),
+            ("bytes_in", "Bytes received in response bodies."),
+            ("rate_limited", "Requests answered with 429 Too Many Requests."),
+        ):
+            name = family(f"{attribute}_total", "counter", help_text)
+            for metrics in snapshot:
+                lines.append(f"{name}{_labels(metrics)} {getattr(metrics, attribute)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
+
+
+def _labels(metrics: RequestMetrics, **extra: str) -> str:
+    labels = {
+        "endpoint": metrics.endpoint,
+        "command": metrics.command,
+        "method": metrics.method,
+        **extra,
+    }
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
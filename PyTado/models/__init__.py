@@ -1,8 +1,10 @@
 from PyTado.models.historic import Historic
+from PyTado.models.historic_columns import HistoricColumns
 from PyTado.models.return_models import Climate, SuccessResult
 
 __all__ = [
     "Climate",
     "Historic",
+    "HistoricColumns",
     "SuccessResult",
 ]
@@ -0,0 +1,263 @@
+"""Columnar representation of the day reports of a zone.
+
+`Historic` creates a pydantic model per data point and interval, which adds up when a
+year of day reports is analysed. `HistoricColumns` is built straight from the raw
+dayReport JSON instead: every time series becomes a `Series` of equally long columns,
+timestamps as milliseconds since the epoch (UTC) and numbers in `array.array`s,
+categorical values (e.g. the stripe type) in lists of strings.
+
+`Series.to_numpy()` converts the columns to NumPy arrays (datetime64[ms] for the
+timestamps), NumPy is only needed for that: install python-tado[numpy].
+
+Example usage: columns = tado.get_historic_columns(1, date(2025, 4, 7))
+               temperature = columns.inside_temperature.to_numpy()
+               temperature["celsius"].mean()
+"""
+
+import json
+from array import array
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Self
+
+from PyTado.exceptions import TadoException
+
+if TYPE_CHECKING:
+    import numpy as np  # pragma: no cover
+
+    Column = array[int] | array[float] | list[str | None]
+
+# columns holding milliseconds since the epoch
+TIME_COLUMNS = frozenset({"timestamp", "start", "end"})
+
+NAN = float("nan")
+
+
+def _epoch_ms(timestamp: str) -> int:
+    return round(datetime.fromisoformat(timestamp).timestamp() * 1000)
+
+
+def _temperature(value: Mapping[str, Any] | None, unit: str) -> float:
+    if not value:
+        return NAN
+    return float(value.get(unit, NAN))
+
+
+@dataclass(frozen=True)
+class Series:
+    """Columns of a time series, one entry per data point or interval in each.
+
+    Data points have a `timestamp` column, intervals `start` and `end` columns.
+    """
+
+    columns: Mapping[str, "Column"]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> "Column":
+        return self.columns[name]
+
+    def to_numpy(self) -> dict[str, "np.ndarray[Any, Any]"]:
+        """The columns as NumPy arrays, the numeric ones without copying"""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise TadoException(
+                "Series.to_numpy requires numpy, install python-tado[numpy]"
+            ) from e
+
+        result = {}
+        for name, column in self.columns.items():
+            if name in TIME_COLUMNS:
+                result[name] = np.asarray(column, dtype=np.int64).view("datetime64[ms]")
+            elif isinstance(column, array):
+                result[name] = np.asarray(column)
+            else:
+                result[name] = np.asarray(column, dtype=object)
+        return result
+
+    @classmethod
+    def concat(cls, parts: Iterable[Self]) -> Self:
+        """One series holding the entries of all parts, in order"""
+        columns: dict[str, "Column"] = {}
+        for part in parts:
+            for name, column in part.columns.items():
+                if name not in columns:
+                    columns[name] = column[:0]
+                columns[name].extend(column)  # type: ignore[arg-type]
+        return cls(columns)
+
+
+def _points(
+    raw: Mapping[str, Any] | None, values: Mapping[str, Callable[[Any], float]]
+) -> Series:
+    timestamps: array[int] = array("q")
+    columns = {name: array("d") for name in values}
+    getters = [(columns[name], getter) for name, getter in values.items()]
+
+    for point in (raw or {}).get("dataPoints") or ():
+        timestamps.append(_epoch_ms(point["timestamp"]))
+        value = point["value"]
+        for column, getter in getters:
+            column.append(getter(value))
+
+    return Series({"timestamp": timestamps, **columns})
+
+
+def _intervals(
+    raw: Mapping[str, Any] | None,
+    values: Mapping[str, Callable[[Any], float]],
+    labels: Mapping[str, Callable[[Any], str | None]],
+    typecode: str = "d",
+) -> Series:
+    start: array[int] = array("q")
+    end: array[int] = array("q")
+    numbers = {name: array(typecode) for name in values}
+    strings: dict[str, list[str | None]] = {name: [] for name in labels}
+    getters: list[tuple[Callable[[Any], None], Callable[[Any], Any]]] = [
+        (numbers[name].append, getter) for name, getter in values.items()
+    ]
+    getters += [(strings[name].append, getter) for name, getter in labels.items()]
+
+    for interval in (raw or {}).get("dataIntervals") or ():
+        start.append(_epoch_ms(interval["from"]))
+        end.append(_epoch_ms(interval["to"]))
+        value = interval["value"]
+        for append, getter in getters:
+            append(getter(value))
+
+    return Series({"start": start, "end": end, **numbers, **strings})
+
+
+def _setting_columns(
+    setting: Callable[[Any], Mapping[str, Any] | None],
+) -> tuple[dict[str, Callable[[Any], float]], dict[str, Callable[[Any], str | None]]]:
+    """Columns of a heating setting, `setting` picks it from the interval value"""
+    return (
+        {
+            "celsius": lambda v: _temperature(
+                (setting(v) or {}).get("temperature"), "celsius"
+            ),
+            "fahrenheit": lambda v: _temperature(
+                (setting(v) or {}).get("temperature"), "fahrenheit"
+            ),
+        },
+        {
+            "type": lambda v: (setting(v) or {}).get("type"),
+            "power": lambda v: (setting(v) or {}).get("power"),
+        },
+    )
+
+
+_TEMPERATURE = {
+    "celsius": lambda v: _temperature(v, "celsius"),
+    "fahrenheit": lambda v: _temperature(v, "fahrenheit"),
+}
+_WEATHER_TEMPERATURE = {
+    "celsius": lambda v: _temperature(v.get("temperature"), "celsius"),
+    "fahrenheit": lambda v: _temperature(v.get("temperature"), "fahrenheit"),
+}
+
+
+@dataclass(frozen=True)
+class HistoricColumns:
+    """The day report of a zone (see `Historic`) as columns."""
+
+    zone_type: str
+    start: int
+    """Start of the report in milliseconds since the epoch"""
+    end: int
+    """End of the report in milliseconds since the epoch"""
+    hours_in_day: int
+
+    measuring_device_connected: Series
+    """start, end, value (1 if connected)"""
+    inside_temperature: Series
+    """timestamp, celsius, fahrenheit"""
+    humidity: Series
+    """timestamp, value (0-1)"""
+    stripes: Series
+    """start, end, celsius, fahrenheit, stripe_type, type, power"""
+    settings: Series
+    """start, end, celsius, fahrenheit, type, power"""
+    call_for_heat: Series
+    """start, end, value (NONE, LOW, MEDIUM or HIGH)"""
+    weather_condition: Series
+    """start, end, celsius, fahrenheit, state"""
+    sunny: Series
+    """start, end, value (1 if sunny)"""
+    weather_slots: Series
+    """celsius, fahrenheit, slot (time of day, e.g. 04:00), state"""
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any] | list[Any] | str | bytes) -> Self:
+        """Columns of a raw dayReport response, parsed JSON or text"""
+        if isinstance(data, (str, bytes)):
+            data = json.loads(data)
+        if not isinstance(data, Mapping):
+            raise TadoException("Invalid response from Tado API")
+
+        measured = data.get("measuredData") or {}
+        weather = data.get("weather") or {}
+        interval = data.get("interval") or {}
+        setting_values, setting_labels = _setting_columns(lambda v: v)
+        stripe_values, stripe_labels = _setting_columns(lambda v: v.get("setting"))
+
+        slots = (weather.get("slots") or {}).get("slots") or {}
+
+        return cls(
+            zone_type=data.get("zoneType", ""),
+            start=_epoch_ms(interval["from"]) if "from" in interval else 0,
+            end=_epoch_ms(interval["to"]) if "to" in interval else 0,
+            hours_in_day=int(data.get("hoursInDay", 0)),
+            measuring_device_connected=_intervals(
+                measured.get("measuringDeviceConnected"), {"value": int}, {}, "b"
+            ),
+            inside_temperature=_points(measured.get("insideTemperature"), _TEMPERATURE),
+            humidity=_points(measured.get("humidity"), {"value": float}),
+            stripes=_intervals(
+                data.get("stripes"),
+                stripe_values,
+                {"stripe_type": lambda v: v.get("stripeType"), **stripe_labels},
+            ),
+            settings=_intervals(data.get("settings"), setting_values, setting_labels),
+            call_for_heat=_intervals(data.get("callForHeat"), {}, {"value": str}),
+            weather_condition=_intervals(
+                weather.get("condition"),
+                _WEATHER_TEMPERATURE,
+                {"state": lambda v: v.get("state")},
+            ),
+            sunny=_intervals(weather.get("sunny"), {"value": int}, {}, "b"),
+            weather_slots=Series(
+                {
+                    **{
+                        name: array("d", map(getter, slots.values()))
+                        for name, getter in _WEATHER_TEMPERATURE.items()
+                    },
+                    "slot": list(slots),
+                    "state": [value.get("state") for value in slots.values()],
+                }
+            ),
+        )
+
+    @classmethod
+    def concat(cls, reports: Iterable[Self]) -> Self:
+        """One report holding the series of several, e.g. the days of a year in order"""
+        reports = list(reports)
+        if not reports:
+            raise ValueError("concat() needs at least one report")
+
+        series = {
+            field.name: Series.concat(getattr(report, field.name) for report in reports)
+            for field in fields(cls)
+            if field.type is Series
+        }
+        return cls(
+            zone_type=reports[0].zone_type,
+            start=min(report.start for report in reports),
+            end=max(report.end for report in reports),
+            hours_in_day=sum(report.hours_in_day for report in reports),
+            **series,
+        )
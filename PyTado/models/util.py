@@ -12,10 +12,15 @@ centered around Pydantic for data validation and serialization. It includes:
   - Fields defined in the model but not present in the data
   - Validation errors with detailed context
 
+The validation wrapper costs a Python call per (nested) model. Setting the environment
+variable PYTADO_VALIDATION_MODE=production before PyTado is imported leaves it out of
+the models, they are then validated by pydantic-core alone.
+
 This module serves as the backbone for all data models in PyTado, ensuring consistent
 handling of API data and providing helpful debugging information during development.
 """
 
+import os
 from typing import Any, Self
 
 from pydantic import (
@@ -33,6 +38,14 @@ from PyTado.logger import Logger
 
 LOGGER = Logger(__name__)
 
+VALIDATION_MODE_ENV = "PYTADO_VALIDATION_MODE"
+PRODUCTION_VALIDATION = "production"
+
+# checked once, when the models are built
+DEBUG_VALIDATION = (
+    os.environ.get(VALIDATION_MODE_ENV, "").strip().lower() != PRODUCTION_VALIDATION
+)
+
 
 class Base(BaseModel):
     """Base model for all models in PyTado.
@@ -59,35 +72,40 @@ class Base(BaseModel):
     def to_dict(self) -> dict[str, Any]:
         return self.model_dump(by_alias=True)
 
-    @model_validator(mode="wrap")
-    @classmethod
-    def log_failed_validation(
-        cls, data: Any, handler: ModelWrapValidatorHandler[Self]
-    ) -> Self:
-        """Model validation debug helper.
-        Logs in the following cases:
-            - (Debug) Keys in data that are not in the model
-            - (Debug) Keys in the model that are not in the data
-            - (Error) Validation errors
-        (This is just for debugging and development, can be removed if not needed anymore)
-        """
-        try:
-            model: Self = handler(data)
-
-            extra = model.model_extra
-
-            if extra:
-                for key, value in extra.items():
-                    if value is not None:
-                        LOGGER.warning(
-                            "Model %s has extra key: %s with value %r", cls, key, value
-                        )
-
-            unused_keys = model.model_fields.keys() - model.model_fields_set
-            if unused_keys:
-                LOGGER.debug("Model %s has unused keys: %r", cls, unused_keys)
-
-            return model
-        except ValidationError:
-            LOGGER.error("Model %s failed to validate with data %r", cls, data)
-            raise
+    if DEBUG_VALIDATION:
+        # defined only in debug mode, a wrap validator runs for every nested model
+        @model_validator(mode="wrap")
+        @classmethod
+        def log_failed_validation(
+            cls, data: Any, handler: ModelWrapValidatorHandler[Self]
+        ) -> Self:
+            """Model validation debug helper.
+            Logs in the following cases:
+                - (Debug) Keys in data that are not in the model
+                - (Debug) Keys in the model that are not in the data
+                - (Error) Validation errors
+            (This is just for debugging and development, can be removed if not needed anymore)
+            """
+            try:
+                model: Self = handler(data)
+
+                extra = model.model_extra
+
+                if extra:
+                    for key, value in extra.items():
+                        if value is not None:
+                            LOGGER.warning(
+                                "Model %s has extra key: %s with value %r",
+                                cls,
+                                key,
+                                value,
+                            )
+
+                unused_keys = model.model_fields.keys() - model.model_fields_set
+                if unused_keys:
+                    LOGGER.debug("Model %s has unused keys: %r", cls, unused_keys)
+
+                return model
+            except ValidationError:
+                LOGGER.error("Model %s failed to validate with data %r", cls, data)
+                raise
@@ -0,0 +1,555 @@
+"""
+Adaptive polling of the state of all zones/rooms of a home.
+
+A poller loads the state of every zone with one `zoneStates` (or `rooms` for Tado X)
+request, compares it with the previous poll and hands only the zones which changed to
+its callback. The interval until the next poll adapts to the home:
+
+- `PollingPolicy.min_interval` while a zone is active (heating power above zero, an
+  overlay or boost, an open window) or something changed in the last poll,
+- backing off from `interval` up to `max_interval` while nothing changes,
+- `away_interval` while every zone is in AWAY mode,
+
+and never shorter than the share of the remaining rate limit budget allows until it
+resets (see PyTado.ratelimit).
+
+Example usage: poller = Poller(tado, callback=lambda changes: print(changes)).start()
+               ...
+               poller.stop()
+
+Several consumers can share the poller of a home through `subscribe()` (see
+`TadoBase.subscribe` and `AsyncTadoBase.subscribe`), each one receiving only the changes
+of the zones and fields it asked for. The shared poller runs while it has subscriptions.
+
+Example usage: async with tado.subscribe(zone=1, fields={"setting"}) as changes:
+                   async for change in changes:
+                       ...
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from pydantic import BaseModel
+
+from PyTado.diff import State, StateEvent, ZoneRemoved, diff
+from PyTado.exceptions import TadoException, TadoRateLimitException
+from PyTado.logger import Logger
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.types import Power, Presence
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_base_tado import AsyncTadoBase  # pragma: no cover
+    from PyTado.interface.api.base_tado import TadoBase  # pragma: no cover
+
+_LOGGER = Logger(__name__)
+
+# fields changing with every sensor reading, they do not make a state different
+IGNORED_FIELDS = frozenset({"timestamp"})
+
+
+@dataclass(frozen=True)
+class StateChange:
+    """The state of a zone/room changed between two polls."""
+
+    zone_id: int
+    old: State | None
+    """None if the zone appeared"""
+    new: State | None
+    """None if the zone disappeared"""
+    fields: frozenset[str]
+    """Names of the top level fields which changed"""
+    events: tuple[StateEvent, ...] = ()
+    """What changed as typed events, see PyTado.diff"""
+
+
+def _equal(old: Any, new: Any) -> bool:
+    """Compare two values, models field by field without the ignored fields"""
+    if isinstance(old, BaseModel) and isinstance(new, BaseModel):
+        if type(old) is not type(new):
+            return False
+        return all(
+            _equal(getattr(old, name), getattr(new, name))
+            for name in type(old).model_fields
+            if name not in IGNORED_FIELDS
+        )
+    return bool(old == new)
+
+
+def changed_fields(old: State, new: State) -> frozenset[str]:
+    """Names of the top level fields of two states of a zone which differ"""
+    return frozenset(
+        name
+        for name in type(new).model_fields
+        if not _equal(getattr(old, name, None), getattr(new, name, None))
+    )
+
+
+def diff_states(
+    old: Mapping[int, State], new: Mapping[int, State]
+) -> list[StateChange]:
+    """The changes from one poll of a home to the next, by zone id"""
+    changes = []
+    for zone_id, state in new.items():
+        previous = old.get(zone_id)
+        if previous is None:
+            fields = frozenset(type(state).model_fields)
+        else:
+            fields = changed_fields(previous, state)
+        if fields:
+            events = tuple(diff(zone_id, previous, state))
+            changes.append(StateChange(zone_id, previous, state, fields, events))
+    for zone_id, previous in old.items():
+        if zone_id not in new:
+            events = (ZoneRemoved(zone_id),)
+            changes.append(StateChange(zone_id, previous, None, frozenset(), events))
+    return changes
+
+
+def is_active(state: State) -> bool:
+    """Whether the zone is heating/cooling, overridden or has an open window"""
+    if state.open_window is not None:
+        return not isinstance(state, RoomState) or state.open_window.activated
+    if isinstance(state, RoomState):
+        return (
+            state.manual_control_termination is not None
+            or state.boost_mode is not None
+            or state.heating_power.percentage > 0
+        )
+
+    activity = state.activity_data_points
+    return (
+        state.overlay is not None
+        or (
+            activity.heating_power is not None and activity.heating_power.percentage > 0
+        )
+        or (activity.ac_power is not None and activity.ac_power.value == Power.ON)
+    )
+
+
+def is_away(state: State) -> bool:
+    """Whether the zone is in AWAY mode, unknown (False) for Tado X rooms"""
+    return isinstance(state, ZoneState) and state.tado_mode == Presence.AWAY
+
+
+@dataclass
+class PollingPolicy:
+    """Intervals in seconds of a poller."""
+
+    min_interval: float = 15.0
+    """While a zone is active or changed"""
+    interval: float = 60.0
+    """First interval after the home became idle"""
+    max_interval: float = 300.0
+    """Longest interval while the home is idle"""
+    away_interval: float = 900.0
+    """While every zone is in AWAY mode"""
+    backoff: float = 1.5
+    """Factor the interval grows by with every idle poll"""
+    quota_share: float = 0.5
+    """Share of the remaining rate limit budget the poller may use"""
+    error_interval: float = 60.0
+    """After a poll failed"""
+
+    def next_interval(
+        self,
+        previous: float,
+        states: Mapping[int, State],
+        changes: list[StateChange],
+        remaining: int | None = None,
+        reset: float | None = None,
+    ) -> float:
+        """
+        Seconds until the next poll.
+
+        Args:
+            previous: The interval before the last poll.
+            states: The states of the last poll.
+            changes: The changes found by the last poll.
+            remaining: Requests left in the rate limit budget, if known.
+            reset: Seconds until the rate limit budget resets, if known.
+        """
+        if changes or any(is_active(state) for state in states.values()):
+            interval = self.min_interval
+        elif states and all(is_away(state) for state in states.values()):
+            interval = self.away_interval
+        else:
+            interval = min(
+                max(previous * self.backoff, self.interval), self.max_interval
+            )
+
+        if remaining is not None and reset is not None:
+            # spread the share of the budget evenly until it resets
+            interval = max(interval, reset / max(remaining * self.quota_share, 1.0))
+        return interval
+
+
+class Subscription:
+    """Changes of the zones and fields a consumer subscribed to at a shared poller.
+
+    A change is selected if its zone is one of `zones` and one of `fields` changed,
+    a zone which disappeared is always selected. None selects every zone/field.
+    """
+
+    def __init__(
+        self,
+        poller: "BasePoller",
+        callback: Callable[[list[StateChange]], Any] | None,
+        zone: int | Iterable[int] | None = None,
+        fields: str | Iterable[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            poller: The poller delivering the changes.
+            callback: Called with the selected changes of every poll which found some.
+            zone: The id(s) of the zone(s)/room(s), None for all.
+            fields: The names of the top level fields of the states (e.g. "setting",
+                "overlay", "tado_mode"), None for all.
+        """
+        self._poller = poller
+        self._callback = callback
+        self.zones = None if zone is None else frozenset(_as_set(zone))
+        self.fields = None if fields is None else frozenset(_as_set(fields))
+
+    @property
+    def active(self) -> bool:
+        """Whether the subscription receives changes"""
+        return self in self._poller._subscriptions
+
+    def select(self, changes: list[StateChange]) -> list[StateChange]:
+        """The changes this subscription receives"""
+        return [
+            change
+            for change in changes
+            if (self.zones is None or change.zone_id in self.zones)
+            and (
+                self.fields is None or change.new is None or change.fields & self.fields
+            )
+        ]
+
+    def cancel(self) -> None:
+        """Stop receiving changes, the poller stops with its last subscription"""
+        self._poller._unsubscribe(self)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.cancel()
+
+    def _deliver(self, changes: list[StateChange]) -> Any:
+        selected = self.select(changes)
+        if selected and self._callback is not None:
+            return self._callback(selected)
+        return None
+
+
+class AsyncSubscription(Subscription):
+    """A `Subscription` at an `AsyncPoller`, an async iterator of the selected changes
+    if it has no callback.
+
+    The iterator ends when the subscription is cancelled or the poller stopped.
+    """
+
+    def __init__(
+        self,
+        poller: "AsyncPoller",
+        callback: Callable[[list[StateChange]], Any] | None = None,
+        zone: int | Iterable[int] | None = None,
+        fields: str | Iterable[str] | None = None,
+    ) -> None:
+        """See `Subscription`, the callback may be a coroutine function"""
+        super().__init__(poller, callback, zone, fields)
+        self._queue: asyncio.Queue[StateChange | None] = asyncio.Queue()
+
+    def cancel(self) -> None:
+        """See `Subscription.cancel`"""
+        if self.active:
+            super().cancel()
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> StateChange:
+        change = await self._queue.get()
+        if change is None:
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return change
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.cancel()
+
+    def _deliver(self, changes: list[StateChange]) -> Any:
+        if self._callback is not None:
+            return super()._deliver(changes)
+        for change in self.select(changes):
+            self._queue.put_nowait(change)
+        return None
+
+
+def _as_set(value: Any) -> Iterable[Any]:
+    return (value,) if isinstance(value, (int, str)) else value
+
+
+class BasePoller:
+    """State and interval bookkeeping shared by `Poller` and `AsyncPoller`."""
+
+    def __init__(
+        self,
+        home: Any,
+        callback: Callable[[list[StateChange]], Any] | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> None:
+        """
+        Args:
+            home: The API instance of the home (Tado, TadoX, AsyncTado, AsyncTadoX).
+            callback: Called with the changes of every poll which found some.
+            policy: The polling intervals, the defaults of PollingPolicy if None.
+        """
+        self._home = home
+        self._callback = callback
+        self.policy = policy or PollingPolicy()
+        self._states: dict[int, State] = {}
+        self._interval = self.policy.min_interval
+        self._subscriptions: list[Subscription] = []
+
+    @property
+    def states(self) -> dict[int, State]:
+        """The states of the last poll by zone id"""
+        return dict(self._states)
+
+    @property
+    def interval(self) -> float:
+        """Seconds until the next poll"""
+        return self._interval
+
+    def _apply(self, states: Mapping[int, State]) -> list[StateChange]:
+        changes = diff_states(self._states, states)
+        self._states = dict(states)
+
+        http = self._home._http
+        state = http.rate_limit.state(http._id)
+        self._interval = self.policy.next_interval(
+            self._interval,
+            self._states,
+            changes,
+            remaining=http.remaining_quota,
+            reset=state.reset if state is not None else None,
+        )
+        return changes
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def _failed(self, e: Exception) -> None:
+        if isinstance(e, TadoRateLimitException):
+            self._interval = self.policy.max_interval
+        else:
+            self._interval = self.policy.error_interval
+        if isinstance(e, TadoException):
+            _LOGGER.warning("Polling the zone states failed: %s", e)
+        else:
+            # e.g. a connection error or timeout, or a response which does not validate
+            _LOGGER.exception("Polling the zone states failed")
+
+
+class Poller(BasePoller):
+    """Polls the states of a `Tado`/`TadoX` home in a daemon thread."""
+
+    _home: "TadoBase"
+
+    def __init__(
+        self,
+        home: "TadoBase",
+        callback: Callable[[list[StateChange]], None] | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> None:
+        """See `BasePoller`"""
+        super().__init__(home, callback, policy)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the poller thread is running and not stopped"""
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stopped.is_set()
+        )
+
+    def start(self) -> Self:
+        """Start the poller thread, if it is not running yet"""
+        if not self.running:
+            # each thread has its own event: a stopped thread which did not exit yet
+            # (stopped by a callback, or the join timed out) must not keep polling
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stopped,),
+                name="PyTado poller",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the poller thread and wait for it to finish"""
+        self._stopped.set()
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def subscribe(
+        self,
+        callback: Callable[[list[StateChange]], None],
+        *,
+        zone: int | Iterable[int] | None = None,
+        fields: str | Iterable[str] | None = None,
+    ) -> Subscription:
+        """Call the callback with the changes of the zone(s) and field(s) (see
+        `Subscription`) from the next poll on, starting the poller thread"""
+        subscription = Subscription(self, callback, zone, fields)
+        self._subscriptions.append(subscription)
+        self.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        super()._unsubscribe(subscription)
+        if not self._subscriptions and self._callback is None:
+            self.stop()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def poll(self) -> list[StateChange]:
+        """Poll the states once, call the callback if they changed"""
+        changes = self._apply(self._home._get_zone_states_by_id())
+        if changes and self._callback is not None:
+            self._callback(changes)
+        for subscription in list(self._subscriptions):
+            try:
+                subscription._deliver(changes)
+            except Exception:
+                # a failing subscriber must not stop the others
+                _LOGGER.exception("A subscriber of the zone states failed")
+        return changes
+
+    def _run(self, stopped: threading.Event) -> None:
+        delay = 0.0
+        while not stopped.wait(delay):
+            try:
+                self.poll()
+            except Exception as e:
+                # keep polling, the subscriptions depend on this thread
+                self._failed(e)
+            delay = self._interval
+
+
+class AsyncPoller(BasePoller):
+    """Polls the states of an `AsyncTado`/`AsyncTadoX` home in an asyncio task.
+
+    The callback may be a coroutine function.
+    """
+
+    _home: "AsyncTadoBase"
+
+    def __init__(
+        self,
+        home: "AsyncTadoBase",
+        callback: Callable[[list[StateChange]], Any] | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> None:
+        """See `BasePoller`"""
+        super().__init__(home, callback, policy)
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the poller task is running"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> Self:
+        """Start the poller task in the running event loop, if it is not running yet"""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Cancel the poller task and wait for it to finish, ending the subscriptions"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscription in list(self._subscriptions):
+            subscription.cancel()
+
+    async def __aenter__(self) -> Self:
+        return self.start()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def subscribe(
+        self,
+        callback: Callable[[list[StateChange]], Any] | None = None,
+        *,
+        zone: int | Iterable[int] | None = None,
+        fields: str | Iterable[str] | None = None,
+    ) -> AsyncSubscription:
+        """Deliver the changes of the zone(s) and field(s) (see `AsyncSubscription`)
+        from the next poll on, starting the poller task"""
+        subscription = AsyncSubscription(self, callback, zone, fields)
+        self._subscriptions.append(subscription)
+        self.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        super()._unsubscribe(subscription)
+        if not self._subscriptions and self._callback is None and self._task:
+            # the task is not awaited, the subscription may be cancelled from it
+            self._task.cancel()
+            self._task = None
+
+    async def poll(self) -> list[StateChange]:
+        """See `Poller.poll`"""
+        changes = self._apply(await self._home._get_zone_states_by_id())
+        if changes and self._callback is not None:
+            result = self._callback(changes)
+            if asyncio.iscoroutine(result):
+                await result
+        for subscription in list(self._subscriptions):
+            try:
+                result = subscription._deliver(changes)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                # a failing subscriber must not stop the others
+                _LOGGER.exception("A subscriber of the zone states failed")
+        return changes
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                # keep polling, the subscriptions depend on this task
+                self._failed(e)
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,231 @@
+"""
+Client side budget of the API rate limit.
+
+Tado announces its rate limit with the `RateLimit-Policy` (e.g. `"perday";q=1000;w=86400`)
+and `RateLimit` (e.g. `"perday";r=250;t=1301`) headers of every response. `RateLimitBudget`
+tracks them per home in a token bucket, which is synchronized with the remaining quota
+announced by the API and refilled in between when the window resets (at the quota per
+window if the API did not announce the reset).
+
+By default the budget only keeps track. With `throttle=True` GET requests (polling) are
+spread over the time until the quota resets (at most `max_delay` apart) and delayed
+before they would use up the `reserve` of requests kept for writes (e.g.
+`set_zone_overlay`), which are never delayed.
+
+Example usage: http = Http(rate_limit=RateLimitBudget(throttle=True, reserve=50))
+               http.remaining_quota
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from PyTado.exceptions import TadoRateLimitException
+
+_ITEM_PARAM = re.compile(r";\s*([a-z]+)\s*=\s*(\d+)")
+
+
+def parse_rate_limit(header: str | None) -> dict[str, int]:
+    """
+    Parameters of a `RateLimit` or `RateLimit-Policy` header.
+
+    If the header announces several policies, the one with the fewest remaining requests
+    (or the smallest quota) is returned.
+    """
+    if not isinstance(header, str):
+        return {}
+
+    items = [
+        {name: int(value) for name, value in _ITEM_PARAM.findall(item)}
+        for item in header.split(",")
+    ]
+    items = [item for item in items if item]
+    if not items:
+        return {}
+
+    return min(items, key=lambda item: item.get("r", item.get("q", 0)))
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """Rate limit of a home as last announced by the API"""
+
+    quota: int | None
+    """Requests per window (`q` of `RateLimit-Policy`)"""
+    window: int | None
+    """Window in seconds (`w` of `RateLimit-Policy`)"""
+    remaining: int
+    """Remaining requests in the current window (`r` of `RateLimit`)"""
+    reset: int | None
+    """Seconds until the quota resets (`t` of `RateLimit`) when it was announced"""
+
+
+class _Bucket:
+    """Token bucket of one home"""
+
+    def __init__(self, state: RateLimitState, now: float) -> None:
+        self.blocked_until = now
+        self.next_read = now
+        self.sync(state, now)
+
+    def sync(self, state: RateLimitState, now: float) -> None:
+        """Takes over the rate limit announced by the API"""
+        self.state = state
+        self.tokens = float(state.remaining)
+        self.updated = now
+        self.reset_at = now + state.reset if state.reset is not None else None
+
+    @property
+    def rate(self) -> float:
+        """Refill rate in tokens per second"""
+        if not self.state.quota or not self.state.window:
+            return 0.0
+        return self.state.quota / self.state.window
+
+    def refill(self, now: float) -> None:
+        capacity = float(self.state.quota or self.state.remaining)
+        if self.reset_at is None:
+            # the reset is unknown, assume the quota comes back evenly
+            self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        elif now >= self.reset_at:
+            # the window is fixed (e.g. "perday"), the whole quota comes back at its end
+            self.tokens = capacity
+            if self.state.window:
+                passed = (now - self.reset_at) // self.state.window + 1
+                self.reset_at += passed * self.state.window
+            else:
+                self.reset_at = None
+        self.updated = now
+
+
+class RateLimitBudget:
+    """Token bucket budget of API requests per home, driven by the RateLimit headers.
+
+    Can be shared by several `Http`/`AsyncHttp` clients, e.g. of different homes.
+    """
+
+    def __init__(
+        self,
+        throttle: bool = False,
+        reserve: int = 0,
+        max_delay: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            throttle: Spread and delay GET requests to stay within the quota. If False,
+                the budget only keeps track of the rate limit.
+            reserve: Number of requests kept for writes, GET requests are delayed
+                before they would use them.
+            max_delay: Maximum delay of a GET request in seconds. A TadoRateLimitException
+                is raised instead of a longer delay.
+            clock: Monotonic clock in seconds, can be replaced in tests.
+        """
+        self.throttle = throttle
+        self.reserve = reserve
+        self.max_delay = max_delay
+        self._clock = clock
+
+        self._buckets: dict[int | None, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self, home_id: int | None, headers: Mapping[str, str], status: int = 200
+    ) -> None:
+        """Synchronizes the budget of a home with the headers of a response"""
+        limit = parse_rate_limit(headers.get("RateLimit"))
+        retry_after = headers.get("Retry-After")
+        if "r" not in limit and status != 429:
+            return
+
+        policy = parse_rate_limit(headers.get("RateLimit-Policy"))
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(home_id)
+            if "r" in limit:
+                state = RateLimitState(
+                    quota=policy.get("q"),
+                    window=policy.get("w"),
+                    remaining=limit["r"],
+                    reset=limit.get("t"),
+                )
+                if bucket is None:
+                    bucket = self._buckets[home_id] = _Bucket(state, now)
+                else:
+                    bucket.sync(state, now)
+
+            if bucket is not None and status == 429:
+                bucket.tokens = min(bucket.tokens, 0.0)
+                if isinstance(retry_after, str) and retry_after.isdigit():
+                    bucket.blocked_until = now + int(retry_after)
+
+    def state(self, home_id: int | None) -> RateLimitState | None:
+        """Rate limit of a home as last announced by the API, None if unknown"""
+        with self._lock:
+            bucket = self._buckets.get(home_id)
+            return bucket.state if bucket is not None else None
+
+    def remaining(self, home_id: int | None) -> int | None:
+        """Estimated number of requests left for a home, None if unknown"""
+        with self._lock:
+            bucket = self._buckets.get(home_id)
+            if bucket is None:
+                return None
+            bucket.refill(self._clock())
+            return max(int(bucket.tokens), 0)
+
+    def acquire(self, home_id: int | None, write: bool = False) -> float:
+        """
+        Takes a request from the budget of a home.
+
+        Returns:
+            float: Seconds the caller has to wait before sending the request, always 0
+                for writes or if the budget does not throttle.
+
+        Raises:
+            TadoRateLimitException: If a GET request would have to wait longer than
+                `max_delay`.
+        """
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(home_id)
+            if bucket is None:
+                return 0.0
+
+            bucket.refill(now)
+            if write or not self.throttle:
+                bucket.tokens -= 1
+                return 0.0
+
+            # tokens a read may use without touching the reserve of the writes
+            available = bucket.tokens - self.reserve
+            start = max(now, bucket.next_read, bucket.blocked_until)
+            if available < 1:
+                # refilled at once when the quota resets, or at the rate if it is unknown
+                if bucket.reset_at is not None:
+                    refilled = bucket.reset_at
+                elif bucket.rate:
+                    refilled = now + (1 - available) / bucket.rate
+                else:
+                    raise TadoRateLimitException(
+                        f"Rate limit budget exhausted ({int(bucket.tokens)} requests left)"
+                    )
+                start = max(start, refilled)
+
+            delay = start - now
+            if delay > self.max_delay:
+                raise TadoRateLimitException(
+                    f"Rate limit budget exhausted, next request in {delay:.0f}s"
+                )
+
+            bucket.tokens -= 1
+            if bucket.reset_at is not None and available > 1:
+                # e.g. 86s apart for a full quota of 1000 per day, which would make every
+                # second read raise, so a read waits at most max_delay for the previous one
+                spacing = (bucket.reset_at - start) / available
+                bucket.next_read = start + min(spacing, self.max_delay)
+            else:
+                bucket.next_read = start
+            return delay
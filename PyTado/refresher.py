@@ -0,0 +1,192 @@
+"""
+Background renewal of the OAuth access token.
+
+Without a refresher, the first request after the access token expired refreshes it
+before being sent, which adds a round trip to the token endpoint to that request. The
+refreshers renew the token `lead_time` seconds before that, in a thread for `Http` or
+an asyncio task for `AsyncHttp`, so requests always find a valid token.
+
+Example usage: http = Http(refresh_in_background=True)
+               # or, for a limited time
+               with TokenRefresher(http):
+                   ...
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Self
+
+from PyTado.exceptions import TadoException
+from PyTado.logger import Logger
+
+if TYPE_CHECKING:
+    from PyTado.http import AsyncHttp, BaseHttp, Http  # pragma: no cover
+
+_LOGGER = Logger(__name__)
+
+_DEFAULT_LEAD_TIME = 60.0
+_DEFAULT_RETRY_INTERVAL = 30.0
+
+
+def _next_refresh_in(
+    http: "BaseHttp", lead_time: float, retry_interval: float
+) -> float:
+    """Seconds until the token of the client should be renewed"""
+    if http.refresh_token is None:
+        # not logged in yet, e.g. the device flow is pending
+        return retry_interval
+
+    remaining = (http._refresh_at - datetime.now(timezone.utc)).total_seconds()
+    return max(remaining - lead_time, 0.0)
+
+
+def _failed(e: Exception) -> None:
+    if isinstance(e, TadoException):
+        _LOGGER.warning("Background token refresh failed: %s", e)
+    else:
+        # not wrapped by the client, e.g. a requests timeout
+        _LOGGER.exception("Background token refresh failed")
+
+
+class TokenRefresher:
+    """Renews the access token of a `Http` client in a daemon thread."""
+
+    def __init__(
+        self,
+        http: "Http",
+        lead_time: float = _DEFAULT_LEAD_TIME,
+        retry_interval: float = _DEFAULT_RETRY_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            http: The client whose token is renewed.
+            lead_time: Seconds before the token would be refreshed on the request path.
+            retry_interval: Seconds to wait after a failed refresh, or while the client
+                is not logged in yet.
+        """
+        self._http = http
+        self._lead_time = lead_time
+        self._retry_interval = retry_interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the refresher thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> Self:
+        """Start the refresher thread, if it is not running yet"""
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="PyTado token refresher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the refresher thread and wait for it to finish"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        delay = 0.0
+        while not self._stopped.wait(delay):
+            delay = self._refresh()
+
+    def _refresh(self) -> float:
+        """Refresh the token if it is due, return the seconds until the next attempt"""
+        due_in = _next_refresh_in(self._http, self._lead_time, self._retry_interval)
+        if due_in > 0:
+            return due_in
+
+        try:
+            refreshed = self._http._refresh_token(force_refresh=True)
+        except Exception as e:
+            # e.g. a timeout, the token must still be renewed before it expires
+            _failed(e)
+            return self._retry_interval
+
+        if not refreshed:
+            return self._retry_interval
+
+        _LOGGER.debug("Token refreshed in the background")
+        return _next_refresh_in(self._http, self._lead_time, self._retry_interval)
+
+
+class AsyncTokenRefresher:
+    """Renews the access token of an `AsyncHttp` client in an asyncio task."""
+
+    def __init__(
+        self,
+        http: "AsyncHttp",
+        lead_time: float = _DEFAULT_LEAD_TIME,
+        retry_interval: float = _DEFAULT_RETRY_INTERVAL,
+    ) -> None:
+        """See `TokenRefresher`"""
+        self._http = http
+        self._lead_time = lead_time
+        self._retry_interval = retry_interval
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the refresher task is running"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> Self:
+        """Start the refresher task in the running event loop, if it is not running yet"""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Cancel the refresher task and wait for it to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> Self:
+        return self.start()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        delay = 0.0
+        while True:
+            await asyncio.sleep(delay)
+            delay = await self._refresh()
+
+    async def _refresh(self) -> float:
+        """See `TokenRefresher._refresh`"""
+        due_in = _next_refresh_in(self._http, self._lead_time, self._retry_interval)
+        if due_in > 0:
+            return due_in
+
+        try:
+            refreshed = await self._http._refresh_token(force_refresh=True)
+        except Exception as e:
+            # e.g. a timeout, the token must still be renewed before it expires
+            _failed(e)
+            return self._retry_interval
+
+        if not refreshed:
+            return self._retry_interval
+
+        _LOGGER.debug("Token refreshed in the background")
+        return _next_refresh_in(self._http, self._lead_time, self._retry_interval)
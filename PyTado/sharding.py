@@ -0,0 +1,214 @@
+"""
+Polling the homes of many accounts with a pool of processes.
+
+Validating the zone states of hundreds of homes keeps one interpreter busy, the GIL
+prevents threads from spreading that over the cores. `ShardedPoller` splits the accounts
+(each one a token file) into shards, every shard is polled by its own worker process:
+
+- an account always goes to the same shard (by a hash of its token file), so only one
+  process logs in with it and rotates its refresh token,
+- a worker keeps the `Fleet` of each of its accounts and the last state of every zone,
+- a worker returns compact `ZoneDiff`s of the zones which changed, holding the plain
+  values of a `PyTado.diff.summary()` instead of the pydantic models.
+
+Example usage: with ShardedPoller(glob.glob("/var/tado/tokens/*.json")) as poller:
+                   while True:
+                       for zone_diff in poller.poll():
+                           ...
+                       time.sleep(60)
+"""
+
+import os
+import threading
+import zlib
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from PyTado.diff import StateEvent, diff_summaries, summary
+from PyTado.exceptions import TadoCredentialsException
+from PyTado.fleet import Fleet
+from PyTado.http import Http
+from PyTado.logger import Logger
+
+_LOGGER = Logger(__name__)
+
+# accounts of a shard polled concurrently by its worker
+DEFAULT_THREADS = 8
+
+
+@dataclass(frozen=True)
+class ZoneDiff:
+    """A zone of an account which changed between two polls of its shard."""
+
+    account: str
+    """The token file of the account"""
+    home_id: int
+    zone_id: int
+    old: Mapping[str, Any] | None
+    """The summary of the previous poll, None if the zone appeared"""
+    new: Mapping[str, Any] | None
+    """The summary of this poll, None if the zone disappeared"""
+
+    @property
+    def events(self) -> list[StateEvent]:
+        """The changes as events, see `PyTado.diff.diff_summaries`"""
+        return diff_summaries(self.zone_id, self.old or {}, self.new or {})
+
+
+@dataclass(frozen=True)
+class AccountError:
+    """Polling an account failed, it is retried with the next poll."""
+
+    account: str
+    message: str
+
+
+@dataclass
+class _Account:
+    fleet: Fleet
+    summaries: dict[tuple[int, int], dict[str, Any]] = field(default_factory=dict)
+
+
+# state of a worker process, by token file
+_accounts: dict[str, _Account] = {}
+
+
+def _login(account: str) -> _Account:
+    # a worker can not complete the device flow, and must keep the token file of an
+    # account even if /me failed only for the moment
+    return _Account(Fleet(Http(token_file_path=account, device_flow=False)))
+
+
+def _poll_account(account: str) -> list[ZoneDiff]:
+    state = _accounts.get(account)
+    if state is None:
+        state = _accounts[account] = _login(account)
+
+    summaries = {
+        (home_id, zone_id): summary(zone_state)
+        for home_id, zone_states in state.fleet.get_zone_states().items()
+        for zone_id, zone_state in zone_states.items()
+    }
+    diffs = []
+    for (home_id, zone_id), new in summaries.items():
+        old = state.summaries.get((home_id, zone_id))
+        if old != new:
+            diffs.append(ZoneDiff(account, home_id, zone_id, old, new))
+    for (home_id, zone_id), old in state.summaries.items():
+        if (home_id, zone_id) not in summaries:
+            diffs.append(ZoneDiff(account, home_id, zone_id, old, None))
+    state.summaries = summaries
+    return diffs
+
+
+def poll_shard(
+    accounts: list[str], threads: int = DEFAULT_THREADS
+) -> tuple[list[ZoneDiff], list[AccountError]]:
+    """
+    Poll the accounts of a shard, runs in its worker process.
+
+    The first poll of an account logs in with its token file and reports every zone.
+    A failed account is reported as `AccountError`. It is logged in again next time only
+    if its credentials were rejected, otherwise the next poll is compared with the last
+    successful one.
+    """
+
+    def poll(account: str) -> list[ZoneDiff] | AccountError:
+        try:
+            return _poll_account(account)
+        except TadoCredentialsException as e:
+            _accounts.pop(account, None)
+            return AccountError(account, str(e))
+        except Exception as e:
+            # one account, e.g. with a response which does not validate, must not fail
+            # the shard, and a transient error must not cost a login and every zone
+            return AccountError(account, str(e))
+
+    diffs: list[ZoneDiff] = []
+    errors: list[AccountError] = []
+    with ThreadPoolExecutor(
+        max_workers=max(min(threads, len(accounts)), 1),
+        thread_name_prefix="PyTado shard",
+    ) as pool:
+        for result in pool.map(poll, accounts):
+            if isinstance(result, AccountError):
+                errors.append(result)
+            else:
+                diffs += result
+    return diffs, errors
+
+
+def shard_of(account: str, shards: int) -> int:
+    """The shard of an account, the same in every process and run"""
+    return zlib.crc32(os.fspath(account).encode()) % shards
+
+
+def _process_executor() -> Executor:
+    return ProcessPoolExecutor(max_workers=1)
+
+
+class ShardedPoller:
+    """Polls the homes of many accounts, sharded over worker processes."""
+
+    def __init__(
+        self,
+        accounts: Iterable[str],
+        shards: int | None = None,
+        threads: int = DEFAULT_THREADS,
+        executor: Callable[[], Executor] = _process_executor,
+    ) -> None:
+        """
+        Args:
+            accounts: The token files of the accounts, with a valid refresh token each.
+            shards: The number of worker processes, the number of CPUs if None.
+            threads: Accounts polled concurrently in a worker.
+            executor: Creates the single worker executor of a shard, for tests.
+        """
+        self._shards = shards or os.cpu_count() or 1
+        self._threads = threads
+        self._accounts: list[list[str]] = [[] for _ in range(self._shards)]
+        for account in accounts:
+            self._accounts[shard_of(account, self._shards)].append(account)
+        # one executor with a single worker per shard pins its accounts to one process
+        self._executors = [executor() for _ in range(self._shards)]
+        self._lock = threading.Lock()
+        self.errors: list[AccountError] = []
+        """The failed accounts of the last poll"""
+
+    @property
+    def shards(self) -> list[list[str]]:
+        """The accounts of each shard"""
+        return [list(accounts) for accounts in self._accounts]
+
+    def poll(self) -> list[ZoneDiff]:
+        """Poll all shards concurrently, returns the zones which changed"""
+        with self._lock:
+            futures: list[Future[tuple[list[ZoneDiff], list[AccountError]]]] = [
+                executor.submit(poll_shard, accounts, self._threads)
+                for executor, accounts in zip(self._executors, self._accounts)
+                if accounts
+            ]
+            diffs: list[ZoneDiff] = []
+            errors: list[AccountError] = []
+            for future in futures:
+                shard_diffs, shard_errors = future.result()
+                diffs += shard_diffs
+                errors += shard_errors
+
+        for error in errors:
+            _LOGGER.warning("Polling %s failed: %s", error.account, error.message)
+        self.errors = errors
+        return diffs
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,319 @@
+"""
+Local store of the day reports of the zones.
+
+`HistoricStore` keeps the day reports in a SQLite database, keyed by home, zone and
+date. Every series of a report (see `HistoricColumns`) is stored column by column as
+the raw bytes of its array, so reading a report or a date range back only copies the
+columns from disk, without parsing the dayReport JSON or creating a model per point.
+
+`sync()` fetches only the days which are missing, or which were fetched before the end
+of their report and may still change (e.g. today), through `get_historic_range`.
+
+Example usage: store = HistoricStore("/var/tado/historic.sqlite")
+               store.sync(tado, zones=[1, 2], start=date(2025, 1, 1), end=date.today())
+               year = store.get_range(home_id, 1, date(2025, 1, 1), date(2025, 12, 31))
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from PyTado.interface.api.historic_range import (
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_WORKERS,
+    report_days,
+)
+from PyTado.models.historic_columns import HistoricColumns, Series
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_base_tado import AsyncTadoBase  # pragma: no cover
+    from PyTado.interface.api.base_tado import TadoBase  # pragma: no cover
+
+# a report fetched this long after its end is not expected to change anymore
+DEFAULT_SETTLE_TIME = 3600.0
+
+_SERIES = tuple(field.name for field in fields(HistoricColumns) if field.type is Series)
+_STRING_COLUMN = "s"
+_SEPARATOR = "\x1f"
+_NONE = "\x00"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS day_reports (
+    home_id INTEGER NOT NULL,
+    zone_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    zone_type TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    hours_in_day INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    complete INTEGER NOT NULL,
+    PRIMARY KEY (home_id, zone_id, day)
+);
+CREATE TABLE IF NOT EXISTS day_report_columns (
+    home_id INTEGER NOT NULL,
+    zone_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    series TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    typecode TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (home_id, zone_id, day, series, name),
+    FOREIGN KEY (home_id, zone_id, day)
+        REFERENCES day_reports (home_id, zone_id, day) ON DELETE CASCADE
+);
+"""
+
+
+def _encode(column: Any) -> tuple[str, bytes]:
+    if isinstance(column, array):
+        return column.typecode, column.tobytes()
+    text = _SEPARATOR.join(_NONE if value is None else value for value in column)
+    return _STRING_COLUMN, f"{len(column)}{_SEPARATOR}{text}".encode()
+
+
+def _decode(typecode: str, data: bytes) -> Any:
+    if typecode != _STRING_COLUMN:
+        column = array(typecode)
+        column.frombytes(data)
+        return column
+    count, _, text = data.decode().partition(_SEPARATOR)
+    if count == "0":
+        return []
+    return [None if value == _NONE else value for value in text.split(_SEPARATOR)]
+
+
+class HistoricStore:
+    """SQLite store of `HistoricColumns`, keyed by home, zone and date.
+
+    Thread safe, a store can be shared by the threads of a `get_historic_range`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+        settle_time: float = DEFAULT_SETTLE_TIME,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            path: The database file, created if it does not exist.
+            settle_time: Seconds after the end of a report until it is complete.
+            clock: Current time in seconds since the epoch, for tests.
+        """
+        self._settle_time = settle_time
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "HistoricStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def put(
+        self,
+        home_id: int,
+        zone_id: int,
+        day: date,
+        report: HistoricColumns,
+        fetched_at: float | None = None,
+    ) -> None:
+        """Store (or replace) the report of a zone for a day"""
+        fetched_at = self._clock() if fetched_at is None else fetched_at
+        complete = fetched_at * 1000 >= report.end + self._settle_time * 1000
+        key = (home_id, zone_id, day.isoformat())
+        rows = [
+            (*key, series, name, position, *_encode(column))
+            for series in _SERIES
+            for position, (name, column) in enumerate(
+                getattr(report, series).columns.items()
+            )
+        ]
+
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM day_reports WHERE home_id = ? AND zone_id = ? AND day = ?",
+                key,
+            )
+            self._db.execute(
+                "INSERT INTO day_reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    report.zone_type,
+                    report.start,
+                    report.end,
+                    report.hours_in_day,
+                    fetched_at,
+                    complete,
+                ),
+            )
+            self._db.executemany(
+                "INSERT INTO day_report_columns VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def get(self, home_id: int, zone_id: int, day: date) -> HistoricColumns | None:
+        """The stored report of a zone for a day, None if there is none"""
+        reports = list(self._read(home_id, zone_id, day, day))
+        return reports[0] if reports else None
+
+    def get_range(
+        self, home_id: int, zone_id: int, start: date, end: date
+    ) -> HistoricColumns | None:
+        """The stored reports of a zone from start to end (included) as one report, in
+        date order, None if there are none"""
+        reports = list(self._read(home_id, zone_id, start, end))
+        return HistoricColumns.concat(reports) if reports else None
+
+    def days(
+        self, home_id: int, zone_id: int, complete_only: bool = False
+    ) -> list[date]:
+        """The days stored for a zone, in order"""
+        query = "SELECT day FROM day_reports WHERE home_id = ? AND zone_id = ?"
+        if complete_only:
+            query += " AND complete"
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY day", (home_id, zone_id))
+            return [date.fromisoformat(day) for (day,) in rows]
+
+    def missing(
+        self, home_id: int, zones: Iterable[int], start: date, end: date
+    ) -> dict[int, list[date]]:
+        """Days from start to end (included) per zone which are not stored or were
+        stored before they were complete"""
+        missing = {}
+        for zone in zones:
+            complete = set(self.days(home_id, zone, complete_only=True))
+            missing[zone] = [
+                day for day in report_days(start, end) if day not in complete
+            ]
+        return missing
+
+    def sync(
+        self,
+        tado: "TadoBase",
+        zones: Iterable[int],
+        start: date,
+        end: date,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> int:
+        """
+        Fetch the missing and incomplete days of the zones from start to end (included).
+
+        Returns:
+            int: The number of fetched day reports.
+        """
+        home_id = tado._http._id
+        assert home_id is not None
+        fetched = 0
+        for first, last, zone_ids in self._missing_runs(home_id, zones, start, end):
+            for zone, day, report in tado.get_historic_range(
+                zone_ids,
+                first,
+                last,
+                columns=True,
+                workers=workers,
+                retries=retries,
+                retry_delay=retry_delay,
+            ):
+                self.put(home_id, zone, day, report)
+                fetched += 1
+        return fetched
+
+    async def async_sync(
+        self,
+        tado: "AsyncTadoBase",
+        zones: Iterable[int],
+        start: date,
+        end: date,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> int:
+        """See `sync`, for `AsyncTado`"""
+        home_id = tado._http._id
+        assert home_id is not None
+        fetched = 0
+        for first, last, zone_ids in self._missing_runs(home_id, zones, start, end):
+            async for zone, day, report in tado.get_historic_range(
+                zone_ids,
+                first,
+                last,
+                columns=True,
+                workers=workers,
+                retries=retries,
+                retry_delay=retry_delay,
+            ):
+                self.put(home_id, zone, day, report)
+                fetched += 1
+        return fetched
+
+    def _missing_runs(
+        self, home_id: int | None, zones: Iterable[int], start: date, end: date
+    ) -> Iterator[tuple[date, date, list[int]]]:
+        """(first day, last day, zones) of the runs of days missing for the same zones,
+        each run is fetched by one get_historic_range"""
+        assert home_id is not None
+        missing = {
+            zone: set(days)
+            for zone, days in self.missing(home_id, zones, start, end).items()
+        }
+        run: tuple[date, date, list[int]] | None = None
+        for day in report_days(start, end):
+            zone_ids = [zone for zone, days in missing.items() if day in days]
+            if run is not None and zone_ids == run[2]:
+                run = (run[0], day, zone_ids)
+                continue
+            if run is not None and run[2]:
+                yield run
+            run = (day, day, zone_ids)
+        if run is not None and run[2]:
+            yield run
+
+    def _read(
+        self, home_id: int, zone_id: int, start: date, end: date
+    ) -> Iterator[HistoricColumns]:
+        with self._lock:
+            reports = self._db.execute(
+                "SELECT day, zone_type, start, end, hours_in_day FROM day_reports "
+                "WHERE home_id = ? AND zone_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (home_id, zone_id, start.isoformat(), end.isoformat()),
+            ).fetchall()
+            columns = self._db.execute(
+                "SELECT day, series, name, typecode, data FROM day_report_columns "
+                "WHERE home_id = ? AND zone_id = ? AND day BETWEEN ? AND ? "
+                "ORDER BY day, series, position",
+                (home_id, zone_id, start.isoformat(), end.isoformat()),
+            ).fetchall()
+
+        series: dict[str, dict[str, dict[str, Any]]] = {}
+        for day, name, column, typecode, data in columns:
+            day_series = series.setdefault(day, {})
+            day_series.setdefault(name, {})[column] = _decode(typecode, data)
+
+        for day, zone_type, report_start, report_end, hours_in_day in reports:
+            day_series = series.get(day, {})
+            yield HistoricColumns(
+                zone_type=zone_type,
+                start=report_start,
+                end=report_end,
+                hours_in_day=hours_in_day,
+                **{name: Series(day_series.get(name, {})) for name in _SERIES},
+            )
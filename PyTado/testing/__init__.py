@@ -0,0 +1,5 @@
+"""Stand-ins for the Tado API, for benchmarks and tests without network access."""
+
+from .fake_server import FakeTadoServer, FakeTadoTransport, Route
+
+__all__ = ["FakeTadoServer", "FakeTadoTransport", "Route"]
@@ -0,0 +1,476 @@
+"""
+Local stand-in for the Tado API, for benchmarks, load tests and offline development.
+
+`FakeTadoServer` is a threaded HTTP server on 127.0.0.1 which answers the requests of
+PyTado with the JSON payloads of a fixture directory (e.g. tests/fixtures of the
+repository) for the my.tado.com, hops.tado.com, energy-insights.tado.com and
+minder.tado.com APIs. It simulates the OAuth device flow and token refreshes, and can
+add latency and inject 429 and 5xx responses.
+
+`FakeTadoServer.transport()` returns an adapter which sends the requests of `Http` to
+the server instead of the Tado hosts, with the original host in the `Host` header:
+
+Example usage: with FakeTadoServer("tests/fixtures", latency=0.05) as server:
+                   tado = Tado(saved_refresh_token="any", transport=server.transport())
+                   tado.get_zones()
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+import requests
+import requests.adapters
+from urllib3 import Retry
+
+from PyTado.http import default_retry
+
+# (status, extra headers, JSON body or None for an empty body)
+FakeResponse = tuple[int, dict[str, str], Any]
+Handler = Callable[[re.Match[str], dict[str, Any]], FakeResponse]
+
+_LOGIN_HOST = "login.tado.com"
+
+
+@dataclass(frozen=True)
+class Route:
+    """Answer of the fake server to the requests matching a method, host and path"""
+
+    method: str
+    host: str
+    path: re.Pattern[str]
+    answer: str | Handler | Any
+    """Fixture file name, handler or JSON body"""
+
+
+class FakeTadoServer:
+    """Threaded local HTTP server answering like the Tado API.
+
+    The server keeps the routes of one home (`home_id`). Reads are answered from the
+    fixtures, writes with 204 No Content. API requests need an access token issued by
+    the server, which it hands out for any refresh token and after the device flow.
+    """
+
+    def __init__(
+        self,
+        fixtures: str | Path,
+        home_id: int = 1234,
+        x_line: bool = False,
+        latency: float | Callable[[], float] = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        quota: int | None = None,
+        device_flow_polls: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            fixtures: Directory of the JSON fixtures, e.g. tests/fixtures.
+            home_id: Id of the home, as returned by the `me` request.
+            x_line: Serve a Tado X home instead of a pre line X home.
+            latency: Seconds to wait before answering, or a function returning them
+                (e.g. `lambda: random.expovariate(20)`).
+            error_rate: Share of API requests answered with 503 Service Unavailable.
+            rate_limit_rate: Share of API requests answered with 429 Too Many Requests.
+            quota: Requests per day announced in the RateLimit headers. API requests
+                beyond it are answered with 429. None to send no RateLimit headers.
+            device_flow_polls: Number of token polls of the device flow answered with
+                `authorization_pending` before the device counts as authorized.
+            seed: Seed of the random fault injection, for repeatable runs.
+        """
+        self.fixtures = Path(fixtures)
+        self.home_id = home_id
+        self.x_line = x_line
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.quota = quota
+        self.device_flow_polls = device_flow_polls
+
+        self.routes: list[Route] = self._default_routes()
+        self.requests: list[tuple[str, str, str]] = []
+        self.statuses: Counter[int] = Counter()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._fixture_cache: dict[str, Any] = {}
+        self._faults: list[int] = []
+        self._access_tokens: set[str] = set()
+        self._device_polls = 0
+        self._used = 0
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="Fake Tado server", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        # shutdown() waits for serve_forever(), which never ran if the server was not started
+        if self._thread.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeTadoServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def transport(self, max_retries: Retry | int | None = None) -> "FakeTadoTransport":
+        """
+        Adapter sending the requests to the Tado hosts to this server.
+
+        Args:
+            max_retries: Retry policy, defaults to the one of `Http`.
+        """
+        return FakeTadoTransport(
+            self.url,
+            max_retries=default_retry() if max_retries is None else max_retries,
+        )
+
+    def add(
+        self, method: str, host: str, path: str, answer: str | Handler | Any
+    ) -> None:
+        """
+        Adds a route, taking precedence over the existing ones.
+
+        Args:
+            method: HTTP method.
+            host: Host name, e.g. my.tado.com.
+            path: Regular expression matching the whole path, e.g. /api/v2/homes/1234/zones.
+            answer: Fixture file name (relative to the fixture directory), a handler
+                called with the path match and the JSON request body returning a
+                (status, headers, body) tuple, or the JSON body itself.
+        """
+        self.routes.insert(0, Route(method, host, re.compile(path), answer))
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Answers the next `count` API requests with `status`, e.g. 429 or 503"""
+        with self._lock:
+            self._faults.extend([status] * count)
+
+    def handle(
+        self, method: str, host: str, target: str, headers: dict[str, str], body: bytes
+    ) -> FakeResponse:
+        """Answers a request, see `Route`"""
+        url = urlsplit(target)
+        path = url.path
+        with self._lock:
+            self.requests.append((method, host, path))
+
+        if host == _LOGIN_HOST:
+            params = {
+                name: values[0]
+                for name, values in parse_qs(
+                    url.query + "&" + body.decode(errors="replace")
+                ).items()
+            }
+            return self._login(path, params)
+
+        if headers.get("Authorization", "").removeprefix("Bearer ") not in (
+            self._access_tokens
+        ):
+            return 401, {}, {"errors": [{"code": "unauthorized"}]}
+
+        fault = self._next_fault()
+        if fault is not None:
+            # no Retry-After, urllib3 would wait for it before retrying
+            return fault, self._rate_limit_headers(), {}
+
+        payload = json.loads(body) if body else {}
+        for route in self.routes:
+            if route.method != method or route.host != host:
+                continue
+            match = route.path.fullmatch(path)
+            if match is None:
+                continue
+            status, extra, response = self._answer(route, match, payload)
+            return status, {**self._rate_limit_headers(), **extra}, response
+
+        if method == "GET":
+            return 404, self._rate_limit_headers(), {"errors": [{"code": "notFound"}]}
+        return 204, self._rate_limit_headers(), None
+
+    def fixture(self, name: str) -> Any:
+        """JSON content of a fixture file"""
+        with self._lock:
+            if name not in self._fixture_cache:
+                self._fixture_cache[name] = json.loads(
+                    (self.fixtures / name).read_text(encoding="utf-8")
+                )
+            return self._fixture_cache[name]
+
+    def _answer(
+        self, route: Route, match: re.Match[str], payload: dict[str, Any]
+    ) -> FakeResponse:
+        if isinstance(route.answer, str) and route.answer.endswith(".json"):
+            return 200, {}, self.fixture(route.answer)
+        if callable(route.answer):
+            return route.answer(match, payload)
+        return 200, {}, route.answer
+
+    def _next_fault(self) -> int | None:
+        with self._lock:
+            if self._faults:
+                return self._faults.pop(0)
+
+            self._used += 1
+            if self.quota is not None and self._used > self.quota:
+                return 429
+
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                return 503
+        return None
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        if self.quota is None:
+            return {}
+        remaining = max(self.quota - self._used, 0)
+        return {
+            "RateLimit-Policy": f'"perday";q={self.quota};w=86400',
+            "RateLimit": f'"perday";r={remaining};t=86400',
+        }
+
+    def _issue_token(self) -> FakeResponse:
+        with self._lock:
+            access_token = f"fake-access-{len(self._access_tokens)}"
+            self._access_tokens.add(access_token)
+        return (
+            200,
+            {},
+            {
+                "access_token": access_token,
+                "expires_in": 600,
+                "refresh_token": f"fake-refresh-{len(self._access_tokens)}",
+            },
+        )
+
+    def _login(self, path: str, params: dict[str, str]) -> FakeResponse:
+        if path == "/oauth2/device_authorize":
+            self._device_polls = 0
+            return (
+                200,
+                {},
+                {
+                    "device_code": "fake-device-code",
+                    "expires_in": 300,
+                    "interval": 0,
+                    "user_code": "FAKE01",
+                    "verification_uri": "https://login.tado.com/oauth2/device",
+                    "verification_uri_complete": (
+                        "https://login.tado.com/oauth2/device?user_code=FAKE01"
+                    ),
+                },
+            )
+
+        if path != "/oauth2/token":
+            return 404, {}, {}
+
+        grant_type = params.get("grant_type", "")
+        if grant_type == "refresh_token" and params.get("refresh_token"):
+            return self._issue_token()
+
+        if grant_type.endswith("device_code") and params.get("device_code"):
+            with self._lock:
+                self._device_polls += 1
+                pending = self._device_polls <= self.device_flow_polls
+            if pending:
+                return 400, {}, {"error": "authorization_pending"}
+            return self._issue_token()
+
+        return 400, {}, {"error": "invalid_grant"}
+
+    def _zone_states(self, match: re.Match[str], payload: Any) -> FakeResponse:
+        states = {
+            str(zone["id"]): self.fixture(
+                "tadov2.water_heater.auto_mode.json"
+                if zone["type"] == "HOT_WATER"
+                else "tadov2.heating.auto_mode.json"
+            )
+            for zone in self.fixture("zones.json")
+        }
+        return 200, {}, {"zoneStates": states}
+
+    def _rooms(self, match: re.Match[str], payload: Any) -> FakeResponse:
+        state = self.fixture("home_1234/tadox.heating.auto_mode.json")
+        rooms = [
+            {**state, "id": room["roomId"], "name": room["roomName"]}
+            for room in self.fixture("tadox/rooms_and_devices.json")["rooms"]
+        ]
+        return 200, {}, rooms
+
+    def _default_routes(self) -> list[Route]:
+        home = f"homes/{self.home_id}"
+        my = f"/api/v2/{home}"
+        hops = f"/{home}"
+        home_state = (
+            "home_1234/tadox.my_api_v2_home_state.json"
+            if self.x_line
+            else "home_1234/tadov2.my_api_v2_home_state.json"
+        )
+        routes: list[tuple[str, str, str | Handler | Any]] = [
+            # my.tado.com
+            ("my.tado.com", "/api/v2/me", "home_1234/my_api_v2_me.json"),
+            ("my.tado.com", f"{my}/?", home_state),
+            (
+                "my.tado.com",
+                f"{my}/state",
+                "tadov2.home_state.auto_supported.auto_mode.json",
+            ),
+            ("my.tado.com", f"{my}/zones", "zones.json"),
+            ("my.tado.com", f"{my}/zoneStates", self._zone_states),
+            ("my.tado.com", rf"{my}/zones/\d+/state", "tadov2.heating.auto_mode.json"),
+            (
+                "my.tado.com",
+                rf"{my}/zones/\d+/dayReport",
+                "history.zone_day_report.json",
+            ),
+            (
+                "my.tado.com",
+                f"{my}/flowTemperatureOptimization",
+                "flow_temperature_optimization.json",
+            ),
+            (
+                "my.tado.com",
+                r"/api/v2/homeByBridge/[^/]+/boilerWiringInstallationState",
+                "home_by_bridge.boiler_wiring_installation_state.json",
+            ),
+            (
+                "my.tado.com",
+                r"/api/v2/homeByBridge/[^/]+/boilerMaxOutputTemperature",
+                "home_by_bridge.boiler_max_output_temperature.json",
+            ),
+            # hops.tado.com
+            ("hops.tado.com", hops, "home_1234/tadox.hops_homes.json"),
+            (
+                "hops.tado.com",
+                f"{hops}/roomsAndDevices",
+                "tadox/rooms_and_devices.json",
+            ),
+            ("hops.tado.com", f"{hops}/rooms", self._rooms),
+            (
+                "hops.tado.com",
+                rf"{hops}/rooms/\d+",
+                "home_1234/tadox.heating.auto_mode.json",
+            ),
+            (
+                "hops.tado.com",
+                rf"{hops}/rooms/\d+/schedule",
+                "home_1234/tadox.schedule.json",
+            ),
+            (
+                "hops.tado.com",
+                f"{hops}/features",
+                "tadox/hops_tado_homes_features.json",
+            ),
+            (
+                "hops.tado.com",
+                f"{hops}/heatPump",
+                "tadox/hops_tado_homes_heatPump.json",
+            ),
+            (
+                "hops.tado.com",
+                f"{hops}/programmer/domesticHotWater",
+                "tadox/hops_tado_homes_programmer_domesticHotWater.json",
+            ),
+            (
+                "hops.tado.com",
+                f"{hops}/quickActions/boost/boostableZones",
+                "tadox/hops_tado_homes_quickActions_boost_boostableZones.json",
+            ),
+            # energy-insights.tado.com and minder.tado.com
+            (
+                "energy-insights.tado.com",
+                f"/api/{home}/meterReadings",
+                {"readings": []},
+            ),
+            ("energy-insights.tado.com", f"/api/{home}/tariffs", []),
+            ("minder.tado.com", f"/v1/{home}/runningTimes", "running_times.json"),
+        ]
+        return [
+            Route("GET", host, re.compile(path), answer)
+            for host, path, answer in routes
+        ]
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                latency = server.latency
+                delay = latency() if callable(latency) else latency
+                if delay > 0:
+                    time.sleep(delay)
+
+                host = (self.headers.get("Host") or "").split(":", 1)[0]
+                status, headers, response = server.handle(
+                    self.command, host, self.path, dict(self.headers), body
+                )
+                with server._lock:
+                    server.statuses[status] += 1
+
+                data = b"" if response is None else json.dumps(response).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if data:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+class FakeTadoTransport(requests.adapters.HTTPAdapter):
+    """Adapter sending the requests to the Tado hosts to a `FakeTadoServer`."""
+
+    def __init__(self, server_url: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._server = urlsplit(server_url)
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        url = urlsplit(request.url or "")
+        if url.hostname is not None and url.hostname.endswith("tado.com"):
+            request.headers["Host"] = url.hostname
+            request.url = urlunsplit(
+                (self._server.scheme, self._server.netloc, url.path, url.query, "")
+            )
+        return super().send(request, **kwargs)
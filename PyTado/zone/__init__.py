@@ -1,6 +1,18 @@
 """Zone/Room data structures for all API interfaces."""
 
+from .async_hops_zone import AsyncTadoRoom
+from .async_my_zone import AsyncTadoZone
+from .base_zone import ZoneOverlay
 from .hops_zone import TadoRoom
 from .my_zone import TadoZone
+from .snapshot import AsyncHomeSnapshot, HomeSnapshot
 
-__all__ = ["TadoZone", "TadoRoom"]
+__all__ = [
+    "TadoZone",
+    "TadoRoom",
+    "AsyncTadoZone",
+    "AsyncTadoRoom",
+    "HomeSnapshot",
+    "AsyncHomeSnapshot",
+    "ZoneOverlay",
+]
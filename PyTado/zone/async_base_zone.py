@@ -0,0 +1,149 @@
+"""Base module for asyncio Tado zone (room) management and control.
+
+The asyncio zones expose the same read-only properties as the blocking zones
+(see `BaseZoneProperties`), but never perform I/O while a property is read.
+Instead the data is loaded explicitly with `await zone.update()`, all other
+API calls are coroutines.
+"""
+
+from abc import abstractmethod
+from datetime import date, timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from PyTado.exceptions import TadoException
+from PyTado.http import AsyncHttp, TadoRequest
+from PyTado.models import line_x, pre_line_x
+from PyTado.models.historic import Historic
+from PyTado.models.historic_columns import HistoricColumns
+from PyTado.models.pre_line_x.zone import Capabilities
+from PyTado.types import (
+    DayType,
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    Timetable,
+    VerticalSwing,
+    ZoneType,
+)
+from PyTado.zone.base_zone import BaseZoneProperties
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_hops_tado import AsyncTadoX
+    from PyTado.interface.api.async_my_tado import AsyncTado
+
+
+class AsyncBaseZone(BaseZoneProperties):
+    """Base class for asyncio Tado zone/room control.
+
+    Attributes:
+        id: The unique identifier of the zone/room
+        _home: Reference to the parent AsyncTado/AsyncTadoX instance
+        _http: asyncio HTTP client for making API requests
+    """
+
+    _id: int
+
+    _home: "AsyncTado | AsyncTadoX"
+    _http: AsyncHttp
+
+    def __init__(self, home: "AsyncTado | AsyncTadoX", id: int):
+        """Initialize a new AsyncBaseZone instance.
+
+        Args:
+            home: The parent AsyncTado/AsyncTadoX instance this zone/room belongs to
+            id: The unique identifier of the zone/room
+        """
+        self._home = home
+        self._http = home._http
+        self._id = id
+
+    def _not_loaded(self) -> NoReturn:
+        """Raise a helpful error if a property is read before the data was loaded."""
+        raise TadoException(
+            f"Data of zone {self._id} is not loaded, await update() first"
+        )
+
+    # the data is loaded by update(), which stores it in place of these properties
+
+    @cached_property
+    def _raw_state(self) -> line_x.RoomState | pre_line_x.ZoneState:
+        self._not_loaded()
+
+    @cached_property
+    def _raw_room(self) -> line_x.DevicesRooms | pre_line_x.Zone:
+        self._not_loaded()
+
+    @abstractmethod
+    async def update(self) -> None:
+        """Load all data which is needed by the properties of the zone/room."""
+
+    @abstractmethod
+    async def update_state(self) -> None:
+        """Load only the current state of the zone/room."""
+
+    @abstractmethod
+    async def get_capabilities(self) -> Capabilities:
+        """Gets capabilities of the zone/room."""
+
+    def _day_report_request(self, day_report_date: date) -> TadoRequest:
+        request = TadoRequest()
+        request.command = (
+            f"zones/{self._id:d}/dayReport?date={day_report_date.strftime('%Y-%m-%d')}"
+        )
+        return request
+
+    async def get_historic(self, day_report_date: date) -> Historic:
+        """
+        Gets historic information on given date for zone/room
+        """
+        request = self._day_report_request(day_report_date)
+        return Historic.model_validate(await self._http.request(request))
+
+    async def get_historic_columns(self, day_report_date: date) -> HistoricColumns:
+        """
+        Gets historic information on given date for zone/room as columns,
+        without creating a model per data point
+        """
+        request = self._day_report_request(day_report_date)
+        return HistoricColumns.from_json(await self._http.request(request))
+
+    @abstractmethod
+    async def get_schedule(
+        self, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> line_x.Schedule | list[pre_line_x.Schedule]:
+        """Get heating schedule, see `BaseZone.get_schedule`."""
+
+    @abstractmethod
+    async def set_schedule(
+        self,
+        data: list[pre_line_x.Schedule] | line_x.SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> None | list[pre_line_x.Schedule]:
+        """Set heating schedule, see `BaseZone.set_schedule`."""
+
+    @abstractmethod
+    async def reset_zone_overlay(self) -> None:
+        """Reset any manual control/overlay back to the automated schedule."""
+
+    @abstractmethod
+    async def set_zone_overlay(
+        self,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None | dict[str, Any] | list[Any] | str:
+        """Set zone overlay (manual control), see `BaseZone.set_zone_overlay`."""
@@ -0,0 +1,151 @@
+"""
+asyncio adapter to represent a tado zones and state for hops.tado.com (Tado X) API.
+"""
+
+import asyncio
+from datetime import timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, final
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Mode, TadoXRequest
+from PyTado.models import pre_line_x
+from PyTado.models.home import HomeState
+from PyTado.models.line_x.device import DevicesRooms
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.line_x.schedule import Schedule as ScheduleX
+from PyTado.models.line_x.schedule import SetSchedule
+from PyTado.models.pre_line_x.schedule import Schedule
+from PyTado.types import (
+    DayType,
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    Timetable,
+    VerticalSwing,
+    ZoneType,
+)
+from PyTado.zone.async_base_zone import AsyncBaseZone
+from PyTado.zone.hops_zone import (
+    TadoRoomProperties,
+    manual_control_payload,
+    room_capabilities,
+)
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_hops_tado import AsyncTadoX  # pragma: no cover
+
+
+@final
+class AsyncTadoRoom(TadoRoomProperties, AsyncBaseZone):
+    """asyncio Tado Room data structure for hops.tado.com (Tado X)."""
+
+    _home: "AsyncTadoX"
+
+    @cached_property
+    def _raw_state(self) -> RoomState:
+        self._not_loaded()
+
+    @cached_property
+    def _raw_room(self) -> DevicesRooms:
+        self._not_loaded()
+
+    @cached_property
+    def _home_state(self) -> HomeState:
+        self._not_loaded()
+
+    async def update(self) -> None:
+        """Load state, room data and home state of the room concurrently."""
+        await asyncio.gather(
+            self.update_state(), self.update_room(), self.update_home_state()
+        )
+
+    async def update_state(self) -> None:
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}"
+
+        self._raw_state = RoomState.model_validate(await self._http.request(request))
+
+    async def update_room(self) -> None:
+        """Load the room data (name, devices) of the room."""
+        room = await self._home._get_zone_data(self._id)
+        if not isinstance(room, DevicesRooms):
+            raise TadoException(
+                f"Room {self._id} not found in roomsAndDevices response"
+            )
+
+        self._raw_room = room
+
+    async def update_home_state(self) -> None:
+        """Load the presence state of the home the room belongs to."""
+        self._home_state = await self._home.get_home_state()
+
+    async def get_capabilities(self) -> pre_line_x.Capabilities:
+        return room_capabilities()
+
+    async def get_schedule(
+        self, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> ScheduleX | list[Schedule]:
+        """
+        Get the JSON representation of the schedule for a room.
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/schedule"
+
+        return ScheduleX.model_validate(await self._http.request(request))
+
+    async def set_schedule(
+        self,
+        data: list[Schedule] | SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> None | list[Schedule]:
+        if isinstance(data, SetSchedule):
+            request = TadoXRequest()
+            request.command = f"rooms/{self._id:d}/schedule"
+            request.action = Action.SET
+            request.payload = data.model_dump(by_alias=True, exclude_defaults=True)
+            request.mode = Mode.OBJECT
+            await self._http.request(request)
+            return None
+        raise TadoException("Invalid data type for set_schedule for Tado X API")
+
+    async def reset_zone_overlay(self) -> None:
+        """
+        Delete current overlay
+        """
+
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/resumeSchedule"
+        request.action = Action.SET
+
+        await self._http.request(request)
+
+    async def set_zone_overlay(
+        self,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None:
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}/manualControl"
+        request.action = Action.SET
+        request.payload = manual_control_payload(
+            overlay_mode, set_temp, duration, power, is_boost
+        )
+
+        await self._http.request(request)
+        return None
@@ -0,0 +1,252 @@
+"""
+asyncio adapter to represent a tado zones and state for my.tado.com API.
+"""
+
+import asyncio
+from datetime import timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, final
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Mode, TadoRequest
+from PyTado.models import line_x, pre_line_x
+from PyTado.models.pre_line_x.schedule import Schedule, Schedules
+from PyTado.models.pre_line_x.zone import Capabilities, ZoneControl
+from PyTado.types import (
+    DayType,
+    FanLevel,
+    FanSpeed,
+    HorizontalSwing,
+    HvacMode,
+    OverlayMode,
+    Power,
+    Timetable,
+    VerticalSwing,
+    ZoneType,
+)
+from PyTado.zone.async_base_zone import AsyncBaseZone
+from PyTado.zone.my_zone import TadoZoneProperties, overlay_payload
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_my_tado import AsyncTado  # pragma: no cover
+
+
+@final
+class AsyncTadoZone(TadoZoneProperties, AsyncBaseZone):
+    """asyncio Tado Zone data structure for my.tado.com."""
+
+    _home: "AsyncTado"
+
+    @cached_property
+    def _raw_state(self) -> pre_line_x.ZoneState:
+        self._not_loaded()
+
+    @cached_property
+    def _raw_room(self) -> pre_line_x.Zone:
+        self._not_loaded()
+
+    @cached_property
+    def _default_overlay(self) -> pre_line_x.ZoneOverlayDefault:
+        self._not_loaded()
+
+    async def update(self) -> None:
+        """Load state, zone data and default overlay of the zone concurrently."""
+        await asyncio.gather(
+            self.update_state(), self.update_room(), self.update_default_overlay()
+        )
+
+    async def update_state(self) -> None:
+        request = TadoRequest()
+        request.command = f"zones/{self._id}/state"
+
+        self._raw_state = pre_line_x.ZoneState.model_validate(
+            await self._http.request(request)
+        )
+
+    async def update_room(self) -> None:
+        """Load the zone data (name, type, devices) of the zone."""
+        zone = await self._home._get_zone_data(self._id)
+        if not isinstance(zone, pre_line_x.Zone):
+            raise TadoException(f"Zone with id {self._id} not found")
+
+        self._raw_room = zone
+
+    async def update_default_overlay(self) -> None:
+        """Load the default overlay settings of the zone."""
+        request = TadoRequest()
+        request.command = f"zones/{self._id}/defaultOverlay"
+
+        self._default_overlay = pre_line_x.ZoneOverlayDefault.model_validate(
+            await self._http.request(request)
+        )
+
+    async def get_capabilities(self) -> Capabilities:
+        capabilities = self._home._zone_capabilities.get(self._id)
+        if capabilities is None:
+            request = TadoRequest()
+            request.command = f"zones/{self._id:d}/capabilities"
+
+            capabilities = Capabilities.model_validate(
+                await self._http.request(request)
+            )
+            self._home._zone_capabilities[self._id] = capabilities
+
+        return capabilities
+
+    async def get_timetable(self) -> Timetable:
+        """
+        Get the Timetable type currently active
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/schedule/activeTimetable"
+        request.mode = Mode.PLAIN
+        data = await self._http.request(request)
+
+        if not isinstance(data, dict):
+            raise TadoException("Invalid response from Tado API")
+
+        if "id" not in data:
+            raise TadoException(f'Returned data did not contain "id" : {str(data)}')
+
+        return Timetable(data["id"])
+
+    async def get_schedule(
+        self, timetable: Timetable | None = None, day: DayType | None = None
+    ) -> list[Schedule] | line_x.Schedule:
+        """
+        Get the JSON representation of the schedule for a zone.
+        Zone has 3 different schedules, one for each timetable (see setTimetable)
+        """
+        request = TadoRequest()
+        if day:
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks/{day}"
+            )
+        else:
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks"
+            )
+        request.mode = Mode.PLAIN
+
+        return Schedules.validate_python(await self._http.request(request))
+
+    async def set_schedule(
+        self,
+        data: list[Schedule] | line_x.SetSchedule,
+        timetable: Timetable | None = None,
+        day: DayType | None = None,
+    ) -> None | list[Schedule]:
+        """
+        Set the schedule for a zone, day is required
+        """
+
+        if isinstance(data, list):
+            request = TadoRequest()
+            request.command = (
+                f"zones/{self._id:d}/schedule/timetables/{timetable:d}/blocks/{day}"
+            )
+            request.action = Action.CHANGE
+            request.payload = [schedule.model_dump(by_alias=True) for schedule in data]
+            return [
+                Schedule.model_validate(s) for s in await self._http.request(request)
+            ]
+        raise TadoException("Invalid data type for set_schedule for pre line x")
+
+    async def reset_zone_overlay(self) -> None:
+        """
+        Delete current overlay (Resume Schedule)
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/overlay"
+        request.action = Action.RESET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def set_zone_overlay(
+        self,
+        overlay_mode: OverlayMode,
+        set_temp: float | None = None,
+        duration: timedelta | None = None,
+        power: Power = Power.ON,
+        is_boost: bool | None = None,
+        device_type: ZoneType | None = None,
+        mode: HvacMode | None = None,
+        fan_speed: FanSpeed | None = None,
+        swing: Any = None,
+        fan_level: FanLevel | None = None,
+        vertical_swing: VerticalSwing | None = None,
+        horizontal_swing: HorizontalSwing | None = None,
+    ) -> None | dict[str, Any] | list[Any] | str:
+        if device_type is None:
+            if "_raw_room" not in self.__dict__:
+                await self.update_room()
+            device_type = self._raw_room.type
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/overlay"
+        request.action = Action.CHANGE
+        request.payload = overlay_payload(
+            overlay_mode,
+            set_temp,
+            duration,
+            power,
+            device_type,
+            mode,
+            fan_speed,
+            swing,
+            fan_level,
+            vertical_swing,
+            horizontal_swing,
+        )
+
+        return await self._http.request(request)
+
+    async def set_open_window(self) -> None:
+        """
+        Sets the window in zone to open
+        Note: This can only be set if an open window was detected in this zone
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/state/openWindow/activate"
+        request.action = Action.SET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def reset_open_window(self) -> None:
+        """
+        Sets the window in zone to closed
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/state/openWindow"
+        request.action = Action.RESET
+        request.mode = Mode.PLAIN
+
+        await self._http.request(request)
+
+    async def get_zone_control(self) -> ZoneControl:
+        """
+        Get zone control information
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/control"
+
+        return ZoneControl.model_validate(await self._http.request(request))
+
+    async def set_zone_heating_circuit(self, heating_circuit: int) -> ZoneControl:
+        """
+        Sets the heating circuit for a zone
+        """
+
+        request = TadoRequest()
+        request.command = f"zones/{self._id:d}/control/heatingCircuit"
+        request.action = Action.CHANGE
+        request.payload = {"circuitNumber": heating_circuit}
+
+        return ZoneControl.model_validate(await self._http.request(request))
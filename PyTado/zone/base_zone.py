@@ -21,6 +21,7 @@ Note:
 """
 
 from abc import abstractmethod
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, overload
@@ -28,7 +29,9 @@ from typing import TYPE_CHECKING, Any, overload
 from PyTado.http import Http, TadoRequest
 from PyTado.models import line_x, pre_line_x
 from PyTado.models.historic import Historic
-from PyTado.models.pre_line_x.zone import Capabilities
+from PyTado.models.historic_columns import HistoricColumns
+from PyTado.models.line_x.room import XOpenWindow
+from PyTado.models.pre_line_x.zone import Capabilities, OpenWindow
 from PyTado.models.return_models import Climate
 from PyTado.types import (
     DayType,
@@ -50,66 +53,50 @@ if TYPE_CHECKING:
     from PyTado.interface.api.my_tado import Tado
 
 
-class BaseZone:
-    """Base class for Tado zone/room control.
+@dataclass(frozen=True)
+class ZoneOverlay:
+    """The settings of `set_zone_overlay()` for one zone, see `set_zone_overlays()`.
 
-    This class provides the foundation for interacting with Tado zones/rooms,
-    implementing common functionality and defining the interface that specific
-    zone implementations must follow.
+    `device_type` defaults to the type of the zone, `mode` and the fan/swing settings
+    only apply to AC zones, `is_boost` only to Tado X rooms.
+    """
 
-    Attributes:
-        id: The unique identifier of the zone/room
-        _home: Reference to the parent Tado/TadoX instance
-        _http: HTTP client for making API requests
+    overlay_mode: OverlayMode
+    set_temp: float | None = None
+    duration: timedelta | None = None
+    power: Power = Power.ON
+    is_boost: bool | None = None
+    device_type: ZoneType | None = None
+    mode: HvacMode | None = None
+    fan_speed: FanSpeed | None = None
+    swing: Any = None
+    fan_level: FanLevel | None = None
+    vertical_swing: VerticalSwing | None = None
+    horizontal_swing: HorizontalSwing | None = None
+
+
+class BaseZoneProperties:
+    """Read-only properties of a Tado zone/room.
+
+    The properties only read the already loaded `_raw_state` and `_raw_room` data,
+    so they are shared between the blocking zones and the asyncio zones.
     """
 
     _id: int
 
-    _home: "Tado | TadoX"
-    _http: Http
-
-    def __init__(self, home: "Tado | TadoX", id: int):
-        """Initialize a new BaseZone instance.
-
-        Args:
-            home: The parent Tado/TadoX instance this zone/room belongs to
-            id: The unique identifier of the zone/room
-        """
-        self._home = home
-        self._http = home._http  # type: ignore
-        self._id = id
-
-    def update(self) -> None:
-        """Force update of the zone's cached state.
-
-        This method clears the cached state and room data, forcing a fresh
-        fetch on the next access. This is useful when the zone's state
-        might have changed externally.
-        """
-        try:
-            del self._raw_state
-        except AttributeError:
-            pass
-        try:
-            del self._raw_room
-        except AttributeError:
-            pass
-
-    @cached_property
+    @property
     @abstractmethod
     def _raw_state(self) -> line_x.RoomState | pre_line_x.ZoneState:
         """
         Raw state of the zone/room.
         """
-        pass
 
-    @cached_property
+    @property
     @abstractmethod
     def _raw_room(self) -> line_x.DevicesRooms | pre_line_x.Zone:
         """
         Raw room data.
         """
-        pass
 
     @property
     @abstractmethod
@@ -151,6 +138,13 @@ class BaseZone:
         """
         pass
 
+    @property
+    def open_window_state(self) -> OpenWindow | XOpenWindow | None:
+        """
+        State of the open window detection in the zone/room, None if no window is open.
+        """
+        return self._raw_state.open_window
+
     @property
     @abstractmethod
     def open_window_expiry_seconds(self) -> int | None:
@@ -326,21 +320,94 @@ class BaseZone:
             humidity=self.current_humidity or 0,
         )
 
+
+class BaseZone(BaseZoneProperties):
+    """Base class for Tado zone/room control.
+
+    This class provides the foundation for interacting with Tado zones/rooms,
+    implementing common functionality and defining the interface that specific
+    zone implementations must follow.
+
+    Attributes:
+        id: The unique identifier of the zone/room
+        _home: Reference to the parent Tado/TadoX instance
+        _http: HTTP client for making API requests
+    """
+
+    _id: int
+
+    _home: "Tado | TadoX"
+    _http: Http
+
+    def __init__(self, home: "Tado | TadoX", id: int):
+        """Initialize a new BaseZone instance.
+
+        Args:
+            home: The parent Tado/TadoX instance this zone/room belongs to
+            id: The unique identifier of the zone/room
+        """
+        self._home = home
+        self._http = home._http
+        self._id = id
+
+    def update(self) -> None:
+        """Force update of the zone's cached state.
+
+        This method clears the cached state and room data, forcing a fresh
+        fetch on the next access. This is useful when the zone's state
+        might have changed externally.
+        """
+        try:
+            del self._raw_state
+        except AttributeError:
+            pass
+        try:
+            del self._raw_room
+        except AttributeError:
+            pass
+
+    @cached_property
     @abstractmethod
-    def get_capabilities(self) -> Capabilities:
-        """Gets capabilities of the zone/room."""
+    def _raw_state(self) -> line_x.RoomState | pre_line_x.ZoneState:
+        """
+        Raw state of the zone/room.
+        """
+        pass
 
-    def get_historic(self, day_report_date: date) -> Historic:
+    @cached_property
+    @abstractmethod
+    def _raw_room(self) -> line_x.DevicesRooms | pre_line_x.Zone:
         """
-        Gets historic information on given date for zone/room
+        Raw room data.
         """
+        pass
 
+    @abstractmethod
+    def get_capabilities(self) -> Capabilities:
+        """Gets capabilities of the zone/room."""
+
+    def _day_report_request(self, day_report_date: date) -> TadoRequest:
         request = TadoRequest()
         request.command = (
             f"zones/{self._id:d}/dayReport?date={day_report_date.strftime('%Y-%m-%d')}"
         )
+        return request
+
+    def get_historic(self, day_report_date: date) -> Historic:
+        """
+        Gets historic information on given date for zone/room
+        """
+        request = self._day_report_request(day_report_date)
         return Historic.model_validate(self._http.request(request))
 
+    def get_historic_columns(self, day_report_date: date) -> HistoricColumns:
+        """
+        Gets historic information on given date for zone/room as columns,
+        without creating a model per data point
+        """
+        request = self._day_report_request(day_report_date)
+        return HistoricColumns.from_json(self._http.request(request))
+
     @overload
     def get_schedule(
         self, timetable: Timetable, day: DayType
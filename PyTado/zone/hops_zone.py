@@ -3,6 +3,7 @@ Adapter to represent a tado zones and state for hops.tado.com (Tado X) API.
 """
 
 import logging
+from abc import abstractmethod
 from datetime import datetime, timedelta
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, final, overload
@@ -12,7 +13,7 @@ from PyTado.exceptions import TadoException
 from PyTado.http import Action, Mode, TadoXRequest
 from PyTado.models import pre_line_x
 from PyTado.models.home import HomeState
-from PyTado.models.line_x.device import Device, DevicesResponse, DevicesRooms
+from PyTado.models.line_x.device import Device, DevicesRooms
 from PyTado.models.line_x.room import RoomState
 from PyTado.models.line_x.schedule import Schedule as ScheduleX
 from PyTado.models.line_x.schedule import SetSchedule
@@ -33,7 +34,7 @@ from PyTado.types import (
     VerticalSwing,
     ZoneType,
 )
-from PyTado.zone.base_zone import BaseZone
+from PyTado.zone.base_zone import BaseZone, BaseZoneProperties
 
 if TYPE_CHECKING:
     from PyTado.interface.api.hops_tado import TadoX  # pragma: no cover
@@ -41,48 +42,66 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-@final
-class TadoRoom(BaseZone):
-    _home: "TadoX"
+def room_capabilities() -> pre_line_x.Capabilities:
+    """Capabilities of a Tado X room, the API only supports heating rooms."""
+    return pre_line_x.Capabilities(
+        type=ZoneType.HEATING,
+        temperatures=pre_line_x.TemperatureCapability(
+            celsius=TemperatureCapabilitiesValues(
+                min=const.DEFAULT_TADOX_MIN_TEMP,
+                max=const.DEFAULT_TADOX_MAX_TEMP,
+                step=const.DEFAULT_TADOX_PRECISION,
+            )
+        ),
+    )
+
+
+def manual_control_payload(
+    overlay_mode: OverlayMode,
+    set_temp: float | None,
+    duration: timedelta | None,
+    power: Power,
+    is_boost: bool | None = None,
+) -> dict[str, Any]:
+    """Build the payload of a room manual control (overlay) for hops.tado.com."""
+    post_data: dict[str, Any] = {
+        "setting": {"power": power},
+        "termination": {"type": overlay_mode},
+    }
+
+    if is_boost is not None:
+        post_data["setting"]["isBoost"] = is_boost
+
+    if set_temp is not None:
+        post_data["setting"]["temperature"] = {
+            "value": set_temp,
+            "valueRaw": float(set_temp),
+            "precision": 0.1,
+        }
 
-    def update(self) -> None:
-        try:
-            del self._home_state
-        except AttributeError:
-            pass
-        return super().update()
+    if duration is not None:
+        post_data["termination"]["durationInSeconds"] = round(duration.total_seconds())
 
-    @cached_property
-    def _raw_state(self) -> RoomState:
-        print("Getting room state for room %s", self._id)
-        request = TadoXRequest()
-        request.command = f"rooms/{self._id:d}"
-        data = self._http.request(request)
+    return post_data
 
-        return RoomState.model_validate(data)
 
-    @cached_property
-    def _raw_room(self) -> DevicesRooms:
-        print("Getting room data for room %s", self._id)
-        request = TadoXRequest()
-        request.command = "roomsAndDevices"
-
-        rooms_and_devices = DevicesResponse.model_validate(self._http.request(request))
+class TadoRoomProperties(BaseZoneProperties):
+    """Read-only properties of a Tado X room, shared by TadoRoom and AsyncTadoRoom."""
 
-        room = next(
-            filter(lambda x: x.room_id == self._id, rooms_and_devices.rooms), None
-        )
-        if room is None:
-            raise TadoException(
-                f"Room {self._id} not found in roomsAndDevices response"
-            )
+    @property
+    @abstractmethod
+    def _raw_state(self) -> RoomState:
+        """Raw state of the room."""
 
-        return room
+    @property
+    @abstractmethod
+    def _raw_room(self) -> DevicesRooms:
+        """Raw room data."""
 
-    @cached_property
+    @property
+    @abstractmethod
     def _home_state(self) -> HomeState:
-        print("Getting home state")
-        return self._home.get_home_state()
+        """Presence state of the home the room belongs to."""
 
     @property
     def name(self) -> str:
@@ -215,22 +234,49 @@ class TadoRoom(BaseZone):
         """
         return ZoneType.HEATING
 
+
+@final
+class TadoRoom(TadoRoomProperties, BaseZone):
+    _home: "TadoX"
+
+    def update(self) -> None:
+        try:
+            del self._home_state
+        except AttributeError:
+            pass
+        return super().update()
+
+    @cached_property
+    def _raw_state(self) -> RoomState:
+        print("Getting room state for room %s", self._id)
+        request = TadoXRequest()
+        request.command = f"rooms/{self._id:d}"
+        data = self._http.request(request)
+
+        return RoomState.model_validate(data)
+
+    @cached_property
+    def _raw_room(self) -> DevicesRooms:
+        room = self._home._get_zone_data(self._id)
+        if not isinstance(room, DevicesRooms):
+            raise TadoException(
+                f"Room {self._id} not found in roomsAndDevices response"
+            )
+
+        return room
+
+    @cached_property
+    def _home_state(self) -> HomeState:
+        print("Getting home state")
+        return self._home.get_home_state()
+
     def get_capabilities(self) -> pre_line_x.Capabilities:
         _LOGGER.warning(
             "get_capabilities is not supported by Tado X API. "
             "We currently always return type heating."
         )
 
-        return pre_line_x.Capabilities(
-            type=ZoneType.HEATING,
-            temperatures=pre_line_x.TemperatureCapability(
-                celsius=TemperatureCapabilitiesValues(
-                    min=const.DEFAULT_TADOX_MIN_TEMP,
-                    max=const.DEFAULT_TADOX_MAX_TEMP,
-                    step=const.DEFAULT_TADOX_PRECISION,
-                )
-            ),
-        )
+        return room_capabilities()
 
     @overload
     def get_schedule(self, timetable: Timetable, day: DayType) -> list[Schedule]: ...
@@ -331,25 +377,9 @@ class TadoRoom(BaseZone):
         vertical_swing: VerticalSwing | None = None,
         horizontal_swing: HorizontalSwing | None = None,
     ) -> None | dict[str, Any]:
-        post_data: dict[str, Any] = {
-            "setting": {"power": power},
-            "termination": {"type": overlay_mode},
-        }
-
-        if is_boost is not None:
-            post_data["setting"]["isBoost"] = is_boost
-
-        if set_temp is not None:
-            post_data["setting"]["temperature"] = {
-                "value": set_temp,
-                "valueRaw": float(set_temp),
-                "precision": 0.1,
-            }
-
-        if duration is not None:
-            post_data["termination"]["durationInSeconds"] = round(
-                duration.total_seconds()
-            )
+        post_data = manual_control_payload(
+            overlay_mode, set_temp, duration, power, is_boost
+        )
 
         request = TadoXRequest()
         request.command = f"rooms/{self._id:d}/manualControl"
@@ -3,6 +3,8 @@ Adapter to represent a tado zones and state for my.tado.com API.
 """
 
 import logging
+from abc import abstractmethod
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta
 from functools import cached_property
 from typing import Any, final, overload
@@ -31,35 +33,110 @@ from PyTado.types import (
     VerticalSwing,
     ZoneType,
 )
-from PyTado.zone.base_zone import BaseZone
+from PyTado.zone.base_zone import BaseZone, BaseZoneProperties, ZoneOverlay
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@final
-class TadoZone(BaseZone):
-    """Tado Zone data structure for my.tado.com."""
+def overlay_payload(
+    overlay_mode: OverlayMode,
+    set_temp: float | None,
+    duration: timedelta | None,
+    power: Power,
+    device_type: ZoneType,
+    mode: HvacMode | None = None,
+    fan_speed: FanSpeed | None = None,
+    swing: Any = None,
+    fan_level: FanLevel | None = None,
+    vertical_swing: VerticalSwing | None = None,
+    horizontal_swing: HorizontalSwing | None = None,
+) -> dict[str, Any]:
+    """Build the payload of a zone overlay (manual control) for my.tado.com."""
+    post_data: dict[str, Any] = {
+        "setting": {"type": device_type, "power": power},
+        "termination": {"typeSkillBasedApp": overlay_mode},
+    }
+
+    if set_temp is not None:
+        post_data["setting"]["temperature"] = {"celsius": set_temp}
+        if fan_speed is not None:
+            post_data["setting"]["fanSpeed"] = fan_speed
+        elif fan_level is not None:
+            post_data["setting"]["fanLevel"] = fan_level
+        if swing is not None:
+            post_data["setting"]["swing"] = swing
+        else:
+            if vertical_swing is not None:
+                post_data["setting"]["verticalSwing"] = vertical_swing
+            if horizontal_swing is not None:
+                post_data["setting"]["horizontalSwing"] = horizontal_swing
+
+    if mode is not None:
+        post_data["setting"]["mode"] = mode
+
+    if duration is not None:
+        post_data["termination"]["durationInSeconds"] = duration.total_seconds()
+
+    return post_data
+
+
+def overlays_request(
+    overlays: Mapping[int, ZoneOverlay], types: Mapping[int, ZoneType]
+) -> TadoRequest:
+    """The request setting the overlays of several zones with one call."""
+    request = TadoRequest()
+    request.command = "overlay"
+    request.action = Action.SET
+    request.payload = {
+        "overlays": [
+            {
+                "room": zone,
+                "overlay": overlay_payload(
+                    overlay.overlay_mode,
+                    overlay.set_temp,
+                    overlay.duration,
+                    overlay.power,
+                    overlay.device_type or types[zone],
+                    overlay.mode,
+                    overlay.fan_speed,
+                    overlay.swing,
+                    overlay.fan_level,
+                    overlay.vertical_swing,
+                    overlay.horizontal_swing,
+                ),
+            }
+            for zone, overlay in overlays.items()
+        ]
+    }
+    return request
 
-    @cached_property
-    def _raw_state(self) -> pre_line_x.ZoneState:
-        request = TadoRequest()
-        request.command = f"zones/{self._id}/state"
 
-        return pre_line_x.ZoneState.model_validate(self._http.request(request))
+def reset_overlays_request(zones: Iterable[int]) -> TadoRequest:
+    """The request deleting the overlays of several zones with one call."""
+    request = TadoRequest()
+    request.command = "overlay"
+    request.action = Action.RESET
+    request.params = {"rooms": ",".join(str(zone) for zone in zones)}
+    return request
 
-    @cached_property
-    def _raw_room(self) -> pre_line_x.Zone:
-        request = TadoRequest()
-        request.command = "zones"
 
-        zones = [
-            pre_line_x.Zone.model_validate(zone) for zone in self._http.request(request)
-        ]
-        zone = next(filter(lambda z: z.id == self._id, zones), None)
-        if zone is None:
-            raise TadoException(f"Zone with id {self._id} not found")
+class TadoZoneProperties(BaseZoneProperties):
+    """Read-only properties of a my.tado.com zone, shared by TadoZone and AsyncTadoZone."""
 
-        return zone
+    @property
+    @abstractmethod
+    def _raw_state(self) -> pre_line_x.ZoneState:
+        """Raw state of the zone."""
+
+    @property
+    @abstractmethod
+    def _raw_room(self) -> pre_line_x.Zone:
+        """Raw zone data."""
+
+    @property
+    @abstractmethod
+    def _default_overlay(self) -> pre_line_x.ZoneOverlayDefault:
+        """Default overlay settings of the zone."""
 
     @property
     def devices(self) -> list[pre_line_x.Device]:
@@ -178,13 +255,6 @@ class TadoZone(BaseZone):
             return self._raw_state.overlay.termination.projected_expiry
         return None
 
-    @cached_property
-    def _default_overlay(self) -> pre_line_x.ZoneOverlayDefault:
-        request = TadoRequest()
-        request.command = f"zones/{self._id}/defaultOverlay"
-
-        return pre_line_x.ZoneOverlayDefault.model_validate(self._http.request(request))
-
     @property
     def default_overlay_termination_type(self) -> OverlayMode:
         return self._default_overlay.termination_condition.type
@@ -291,11 +361,50 @@ class TadoZone(BaseZone):
 
         return self._raw_room.type
 
-    def get_capabilities(self) -> Capabilities:
+
+@final
+class TadoZone(TadoZoneProperties, BaseZone):
+    """Tado Zone data structure for my.tado.com."""
+
+    def update(self) -> None:
+        try:
+            del self._default_overlay
+        except AttributeError:
+            pass
+        return super().update()
+
+    @cached_property
+    def _raw_state(self) -> pre_line_x.ZoneState:
         request = TadoRequest()
-        request.command = f"zones/{self._id:d}/capabilities"
+        request.command = f"zones/{self._id}/state"
 
-        return Capabilities.model_validate(self._http.request(request))
+        return pre_line_x.ZoneState.model_validate(self._http.request(request))
+
+    @cached_property
+    def _raw_room(self) -> pre_line_x.Zone:
+        zone = self._home._get_zone_data(self._id)
+        if not isinstance(zone, pre_line_x.Zone):
+            raise TadoException(f"Zone with id {self._id} not found")
+
+        return zone
+
+    @cached_property
+    def _default_overlay(self) -> pre_line_x.ZoneOverlayDefault:
+        request = TadoRequest()
+        request.command = f"zones/{self._id}/defaultOverlay"
+
+        return pre_line_x.ZoneOverlayDefault.model_validate(self._http.request(request))
+
+    def get_capabilities(self) -> Capabilities:
+        capabilities = self._home._zone_capabilities.get(self._id)
+        if capabilities is None:
+            request = TadoRequest()
+            request.command = f"zones/{self._id:d}/capabilities"
+
+            capabilities = Capabilities.model_validate(self._http.request(request))
+            self._home._zone_capabilities[self._id] = capabilities
+
+        return capabilities
 
     def get_timetable(self) -> Timetable:
         """
@@ -426,30 +535,19 @@ class TadoZone(BaseZone):
         vertical_swing: VerticalSwing | None = None,
         horizontal_swing: HorizontalSwing | None = None,
     ) -> None | dict[str, Any] | list[Any] | str:
-        post_data: dict[str, Any] = {
-            "setting": {"type": device_type or self._raw_room.type, "power": power},
-            "termination": {"typeSkillBasedApp": overlay_mode},
-        }
-
-        if set_temp is not None:
-            post_data["setting"]["temperature"] = {"celsius": set_temp}
-            if fan_speed is not None:
-                post_data["setting"]["fanSpeed"] = fan_speed
-            elif fan_level is not None:
-                post_data["setting"]["fanLevel"] = fan_level
-            if swing is not None:
-                post_data["setting"]["swing"] = swing
-            else:
-                if vertical_swing is not None:
-                    post_data["setting"]["verticalSwing"] = vertical_swing
-                if horizontal_swing is not None:
-                    post_data["setting"]["horizontalSwing"] = horizontal_swing
-
-        if mode is not None:
-            post_data["setting"]["mode"] = mode
-
-        if duration is not None:
-            post_data["termination"]["durationInSeconds"] = duration.total_seconds()
+        post_data = overlay_payload(
+            overlay_mode,
+            set_temp,
+            duration,
+            power,
+            device_type or self._raw_room.type,
+            mode,
+            fan_speed,
+            swing,
+            fan_level,
+            vertical_swing,
+            horizontal_swing,
+        )
 
         request = TadoRequest()
         request.command = f"zones/{self._id:d}/overlay"
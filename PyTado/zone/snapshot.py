@@ -0,0 +1,102 @@
+"""
+Snapshot of the state of all zones/rooms of a home.
+
+Instead of one `zones/{id}/state` (or `rooms/{id}`) request per zone, a snapshot loads
+the state of every zone with a single `zoneStates` (or `rooms` for Tado X) request and
+hands out zone objects backed by that shared data.
+"""
+
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.zone.async_hops_zone import AsyncTadoRoom
+from PyTado.zone.async_my_zone import AsyncTadoZone
+from PyTado.zone.hops_zone import TadoRoom
+from PyTado.zone.my_zone import TadoZone
+
+if TYPE_CHECKING:
+    from PyTado.interface.api.async_base_tado import AsyncTadoBase  # pragma: no cover
+    from PyTado.interface.api.base_tado import TadoBase  # pragma: no cover
+
+ZoneT = TypeVar("ZoneT")
+
+
+class BaseHomeSnapshot(Mapping[int, ZoneT], Generic[ZoneT]):
+    """Zone objects of a home by zone id, all backed by one shared state request.
+
+    The zone objects are kept across refreshes, so references handed out earlier see
+    the refreshed state as well.
+    """
+
+    taken_at: datetime
+
+    def __init__(self, home: Any, states: Mapping[int, ZoneState | RoomState]) -> None:
+        self._home = home
+        self._zones: dict[int, ZoneT] = {}
+        self._states: dict[int, ZoneState | RoomState] = {}
+        self._apply(states)
+
+    def _apply(self, states: Mapping[int, ZoneState | RoomState]) -> None:
+        zones: dict[int, ZoneT] = {}
+        for zone_id, state in states.items():
+            zone = self._zones.get(zone_id)
+            if zone is None:
+                zone = self._new_zone(zone_id)
+            # shadows the lazily loading `_raw_state` of the zone
+            zone._raw_state = state  # type: ignore[attr-defined]
+            zones[zone_id] = zone
+
+        self._zones = zones
+        self._states = dict(states)
+        self.taken_at = datetime.now(timezone.utc)
+
+    def _new_zone(self, zone_id: int) -> ZoneT:
+        return self._home.get_zone(zone_id)  # type: ignore[no-any-return]
+
+    @property
+    def states(self) -> dict[int, ZoneState | RoomState]:
+        """Raw state of every zone/room by id, as returned by the API."""
+        return dict(self._states)
+
+    def __getitem__(self, zone_id: int) -> ZoneT:
+        return self._zones[zone_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._zones)
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+
+class HomeSnapshot(BaseHomeSnapshot[TadoZone | TadoRoom]):
+    """Snapshot of all zones/rooms for the blocking `Tado`/`TadoX` clients.
+
+    Example usage: snapshot = tado.get_snapshot()
+                   for zone in snapshot.values():
+                       print(zone.name, zone.current_temp)
+                   snapshot.refresh()  # one request for the whole home
+    """
+
+    _home: "TadoBase"
+
+    def _new_zone(self, zone_id: int) -> TadoZone | TadoRoom:
+        # not the shared zone object of `get_zone()`, which drops the seeded state
+        # once it is stale
+        return self._home._create_zone(zone_id)
+
+    def refresh(self) -> None:
+        """Reload the state of all zones/rooms with a single request."""
+        self._apply(self._home._get_zone_states_by_id())
+
+
+class AsyncHomeSnapshot(BaseHomeSnapshot[AsyncTadoZone | AsyncTadoRoom]):
+    """Snapshot of all zones/rooms for the asyncio `AsyncTado`/`AsyncTadoX` clients."""
+
+    _home: "AsyncTadoBase"
+
+    async def refresh(self) -> None:
+        """Reload the state of all zones/rooms with a single request."""
+        self._apply(await self._home._get_zone_states_by_id())
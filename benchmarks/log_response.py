@@ -0,0 +1,100 @@
+"""
+Benchmark the per-response cost of the logging hook of `Http`.
+
+Replays every JSON payload of tests/fixtures through the response hook with DEBUG
+logging disabled, comparing the previous hook (body decoded and headers pretty printed
+by three registrations of the hook) with the current one. Both variants include the
+single decode `Http.request` does to return the payload.
+
+Usage: python benchmarks/log_response.py [--number N]
+"""
+
+import argparse
+import logging
+import pprint
+import timeit
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from PyTado.http import _LOGGER, Http
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def legacy_log_response(response: requests.Response) -> None:
+    """The hook as it was before, registered twice on the session and once per request"""
+    if response.text is None or response.text == "":
+        response_data: Any = {}
+    else:
+        response_data = response.json()
+
+    _LOGGER.debug(
+        f"\nRequest:\n\tMethod:{response.request.method}"
+        f"\n\tURL: {response.request.url}"
+        f"\n\tHeaders: {pprint.pformat(response.request.headers)}"
+        f"\nResponse:\n\tStatusCode: {response.status_code}"
+        f"\n\tData: {response_data}"
+    )
+
+
+def make_response(payload: bytes) -> requests.Response:
+    request = requests.Request(
+        "GET",
+        "https://my.tado.com/api/v2/homes/1234/zoneStates",
+        headers={"Authorization": "Bearer token", "user-agent": "PyTado/bench"},
+    ).prepare()
+
+    response = requests.Response()
+    response.status_code = 200
+    response._content = payload
+    response.encoding = "utf-8"
+    response.request = request
+    return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="requests per fixture")
+    args = parser.parse_args()
+
+    _LOGGER.setLevel(logging.WARNING)
+    http = Http.__new__(Http)
+    responses = {
+        path.relative_to(FIXTURES).as_posix(): make_response(path.read_bytes())
+        for path in sorted(FIXTURES.rglob("*.json"))
+    }
+
+    def legacy(response: requests.Response) -> None:
+        for _ in range(3):
+            legacy_log_response(response)
+        response.json()
+
+    def current(response: requests.Response) -> None:
+        http._log_response(response)
+        response.json()
+
+    print(f"{'fixture':<60} {'bytes':>7} {'before µs':>10} {'after µs':>9}")
+    total_before = total_after = 0.0
+    for name, response in responses.items():
+        before = timeit.timeit(lambda r=response: legacy(r), number=args.number)
+        after = timeit.timeit(lambda r=response: current(r), number=args.number)
+        total_before += before
+        total_after += after
+        print(
+            f"{name:<60} {len(response.content):>7} "
+            f"{before / args.number * 1e6:>10.1f} {after / args.number * 1e6:>9.1f}"
+        )
+
+    requests_total = args.number * len(responses)
+    saved = (total_before - total_after) / requests_total * 1e6
+    print(
+        f"\nmean CPU per request: before {total_before / requests_total * 1e6:.1f} µs, "
+        f"after {total_after / requests_total * 1e6:.1f} µs, saved {saved:.1f} µs "
+        f"({(1 - total_after / total_before) * 100:.0f}%)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark the throughput and tail latency of `Tado` against the local fake Tado server.
+
+Runs a number of threads sharing one client, each reading the state of the zones of the
+home (`get_state`, `get_zone_states`), against `PyTado.testing.FakeTadoServer` serving
+tests/fixtures with the given latency and fault injection.
+
+Usage: python benchmarks/throughput.py [--threads N] [--requests N] [--latency S]
+                                       [--error-rate R] [--seed N]
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+from PyTado.http import _LOGGER, Http
+from PyTado.interface.api import Tado
+from PyTado.models.util import LOGGER as MODELS_LOGGER
+from PyTado.testing import FakeTadoServer
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def percentile(values: list[float], share: float) -> float:
+    return sorted(values)[min(int(len(values) * share), len(values) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="requests per thread")
+    parser.add_argument("--latency", type=float, default=0.02, help="mean seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    _LOGGER.setLevel(logging.WARNING)
+    MODELS_LOGGER.setLevel(logging.WARNING)
+    latency = random.Random(args.seed)
+
+    with FakeTadoServer(
+        FIXTURES,
+        latency=lambda: latency.expovariate(1 / args.latency) if args.latency else 0,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    ) as server:
+        session = requests.Session()
+        session.trust_env = False
+        transport = server.transport()
+        transport.init_poolmanager(connections=10, maxsize=args.threads)
+        http = Http(
+            saved_refresh_token="benchmark", http_session=session, transport=transport
+        )
+        tado = Tado.from_http(http)
+
+        def worker(index: int) -> list[float]:
+            timings = []
+            for i in range(args.requests):
+                start = time.perf_counter()
+                if (index + i) % 2:
+                    tado.get_zone_states()
+                else:
+                    tado.get_state(1)
+                timings.append(time.perf_counter() - start)
+            return timings
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            timings = [
+                t for result in pool.map(worker, range(args.threads)) for t in result
+            ]
+        elapsed = time.perf_counter() - start
+
+    print(f"requests: {len(timings)} in {elapsed:.2f}s, {len(timings) / elapsed:.0f}/s")
+    # concurrent identical reads share one request, the server sees fewer
+    print(f"server statuses: {dict(server.statuses)}")
+    print(
+        "latency ms: "
+        f"mean {statistics.mean(timings) * 1e3:.1f}, "
+        f"p50 {percentile(timings, 0.5) * 1e3:.1f}, "
+        f"p95 {percentile(timings, 0.95) * 1e3:.1f}, "
+        f"p99 {percentile(timings, 0.99) * 1e3:.1f}, "
+        f"max {max(timings) * 1e3:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark the model validation in the debug and production validation modes.
+
+Parses tests/fixtures/history.zone_day_report.json into `Historic` and a zoneStates
+response built from the zone state fixtures into `ZoneState`s, once in a subprocess with
+the default (debug) validation and once with PYTADO_VALIDATION_MODE=production.
+
+Usage: python benchmarks/validation.py [--repeat N] [--zones N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+ZONE_STATE_FIXTURES = (
+    "tadov2.heating.auto_mode.json",
+    "tadov2.heating.manual_mode.json",
+    "tadov2.water_heater.auto_mode.json",
+    "smartac3.cool_mode.json",
+    "smartac3.with_swing.json",
+)
+
+
+def measure(repeat: int, zones: int) -> dict[str, float]:
+    """Seconds per parse of the fixtures with the validation mode of this process"""
+    from PyTado.models.historic import Historic
+    from PyTado.models.pre_line_x.zone import ZoneState
+    from PyTado.models.util import LOGGER
+
+    LOGGER.setLevel(logging.ERROR)
+
+    historic = json.loads((FIXTURES / "history.zone_day_report.json").read_text())
+    states = [json.loads((FIXTURES / name).read_text()) for name in ZONE_STATE_FIXTURES]
+    zone_states = {str(i): states[i % len(states)] for i in range(1, zones + 1)}
+
+    def timed(parse) -> float:
+        parse()  # warm up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse()
+        return (time.perf_counter() - start) / repeat
+
+    return {
+        "history.zone_day_report": timed(lambda: Historic.model_validate(historic)),
+        "zoneStates": timed(
+            lambda: {k: ZoneState.model_validate(v) for k, v in zone_states.items()}
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--zones", type=int, default=10, help="zones in zoneStates")
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.repeat, args.zones)))
+        return
+
+    results = {}
+    for mode in ("debug", "production"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", *sys.argv[1:]],
+            env={**os.environ, "PYTADO_VALIDATION_MODE": mode},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        results[mode] = json.loads(output.splitlines()[-1])
+
+    for name, debug in results["debug"].items():
+        production = results["production"][name]
+        print(
+            f"{name}: debug {debug * 1e3:.3f} ms, production {production * 1e3:.3f} ms, "
+            f"speedup {debug / production:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 """Common utils for tests."""
 
+import json
 import os
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from unittest import mock
 
 from typing_extensions import Never
@@ -18,6 +22,16 @@ def load_fixture(filename: str) -> str:
         return fd.read()
 
 
+class FakeClock:
+    """Monotonic clock which only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class TadoBaseTestCase(unittest.TestCase):
     """Test cases for tado class"""
 
@@ -62,3 +76,61 @@ class TadoBaseTestCase(unittest.TestCase):
             self.tado_client = TadoX.from_http(self.http)
         else:
             self.tado_client = Tado.from_http(self.http)
+
+
+class StubServer:
+    """Local keep-alive HTTP server answering with canned JSON responses.
+
+    Tests using it need the `allow_hosts(["127.0.0.1"])` marker.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], tuple[int, Any]] = {}
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+                path = self.path.split("?", 1)[0]
+                with stub._lock:
+                    stub.requests.append((self.command, path, dict(self.headers)))
+                status, body = stub.routes.get((self.command, path), (404, {}))
+
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(self, method: str, path: str, body: Any, status: int = 200) -> None:
+        self.routes[(method, path)] = (status, body)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,463 @@
+"""Test the asyncio client."""
+
+import asyncio
+import json
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+from unittest import mock
+
+from PyTado.exceptions import TadoException, TadoRateLimitException
+from PyTado.fleet import AsyncFleet
+from PyTado.http import AsyncHttp, DeviceActivationStatus
+from PyTado.interface.api import AsyncTado, AsyncTadoX
+from PyTado.poller import AsyncPoller, StateChange
+from PyTado.types import HvacMode, OverlayMode, Power, Presence
+
+from . import common
+
+TOKEN_RESPONSE = {
+    "access_token": "value",
+    "expires_in": 1000,
+    "refresh_token": "another_value",
+}
+
+
+class FakeBackend:
+    """Replaces AsyncHttp._send and answers from a table of canned responses."""
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], list[tuple[int, dict[str, str], str]]] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        text = "" if body is None else json.dumps(body)
+        self.routes.setdefault((method, url), []).append((status, headers or {}, text))
+
+    def add_fixture(self, url: str, filename: str) -> None:
+        self.add("GET", url, json.loads(common.load_fixture(filename)))
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: Any,
+        data: Any = None,
+        params: Any = None,
+    ) -> tuple[int, dict[str, str], str]:
+        self.calls.append((method, url))
+        responses = self.routes[(method, url)]
+        # the last response stays in place for all further calls
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+
+class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class, logs in an AsyncHttp with a saved refresh token."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.backend = FakeBackend()
+        self.backend.add("POST", "https://login.tado.com/oauth2/token", TOKEN_RESPONSE)
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/me", "home_1234/my_api_v2_me.json"
+        )
+
+        send_patch = mock.patch.object(
+            AsyncHttp, "_send", side_effect=self.backend.send
+        )
+        send_patch.start()
+        self.addCleanup(send_patch.stop)
+
+    async def login(self, home_fixture: str) -> AsyncHttp:
+        self.backend.add_fixture("https://my.tado.com/api/v2/homes/1234/", home_fixture)
+        http = AsyncHttp(saved_refresh_token="saved")
+        await http.login()
+        return http
+
+
+class AsyncHttpTestCase(AsyncTestCase):
+    """Test cases for the AsyncHttp class."""
+
+    async def test_login_with_saved_refresh_token(self) -> None:
+        http = await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+
+        self.assertEqual(
+            http.device_activation_status, DeviceActivationStatus.COMPLETED
+        )
+        self.assertEqual(http._id, 1234)
+        self.assertFalse(http.is_x_line)
+        self.assertEqual(http.refresh_token, "another_value")
+
+    async def test_login_falls_back_to_device_flow(self) -> None:
+        self.backend.routes.clear()
+        self.backend.add("POST", "https://login.tado.com/oauth2/token", status=401)
+        self.backend.add(
+            "POST",
+            "https://login.tado.com/oauth2/device_authorize",
+            {
+                "device_code": "XXX_code_XXX",
+                "expires_in": 300,
+                "interval": 0,
+                "user_code": "7BQ5ZQ",
+                "verification_uri": "https://login.tado.com/oauth2/device",
+                "verification_uri_complete": "https://login.tado.com/oauth2/device?user_code=7BQ5ZQ",
+            },
+        )
+
+        http = AsyncHttp(saved_refresh_token="saved")
+        status = await http.login()
+
+        self.assertEqual(status, DeviceActivationStatus.PENDING)
+        self.assertEqual(http.user_code, "7BQ5ZQ")
+
+    async def test_concurrent_requests_refresh_token_once(self) -> None:
+        http = await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            "tadov2.heating.auto_mode.json",
+        )
+        self.backend.calls.clear()
+        http._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        tado = AsyncTado.from_http(http)
+        await asyncio.gather(*(tado.get_state(1) for _ in range(5)))
+
+        token_calls = [c for c in self.backend.calls if c[1].endswith("/oauth2/token")]
+        self.assertEqual(len(token_calls), 1)
+
+    async def test_rate_limit(self) -> None:
+        http = await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+        self.backend.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            {"errors": [{"code": "tooManyRequests"}]},
+            status=429,
+            headers={
+                "ratelimit": '"perday";r=0',
+                "ratelimit-policy": '"perday";q=100;w=86400',
+            },
+        )
+
+        with self.assertRaises(TadoRateLimitException):
+            await AsyncTado.from_http(http).get_state(1)
+
+    async def test_no_content_returns_success(self) -> None:
+        http = await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+        self.backend.add(
+            "DELETE",
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            status=204,
+        )
+
+        await AsyncTado.from_http(http).get_zone(1).reset_zone_overlay()
+
+        self.assertEqual(
+            self.backend.calls[-1],
+            ("DELETE", "https://my.tado.com/api/v2/homes/1234/zones/1/overlay"),
+        )
+
+    async def test_close_keeps_caller_session(self) -> None:
+        session = mock.AsyncMock()
+        http = AsyncHttp(http_session=session)
+
+        await http.close()
+
+        session.close.assert_not_called()
+
+    async def test_background_token_refresh(self) -> None:
+        self.backend.add("POST", "https://login.tado.com/oauth2/token", TOKEN_RESPONSE)
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/",
+            "home_1234/tadov2.my_api_v2_home_state.json",
+        )
+        http = AsyncHttp(saved_refresh_token="saved", refresh_in_background=True)
+        await http.login()
+        self.assertTrue(http.token_refresher.running)
+
+        # due within the lead time of the refresher
+        http._refresh_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        self.backend.calls.clear()
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if http._refresh_at > datetime.now(timezone.utc) + timedelta(seconds=60):
+                break
+
+        self.assertEqual(
+            self.backend.calls, [("POST", "https://login.tado.com/oauth2/token")]
+        )
+
+        await http.close()
+        self.assertFalse(http.token_refresher.running)
+
+
+class AsyncFleetTestCase(AsyncTestCase):
+    """Test cases for the AsyncFleet class."""
+
+    async def test_homes(self) -> None:
+        me = json.loads(common.load_fixture("home_1234/my_api_v2_me.json"))
+        me["homes"].append({"id": 5678, "name": "Tado X Home"})
+        self.backend.routes.pop(("GET", "https://my.tado.com/api/v2/me"))
+        self.backend.add("GET", "https://my.tado.com/api/v2/me", me)
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/5678/",
+            "home_1234/tadox.my_api_v2_home_state.json",
+        )
+        home_state = json.loads(
+            common.load_fixture("tadov2.home_state.auto_supported.auto_mode.json")
+        )
+        for home_id in (1234, 5678):
+            self.backend.add(
+                "GET", f"https://my.tado.com/api/v2/homes/{home_id}/state", home_state
+            )
+        fleet = AsyncFleet(
+            await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+        )
+
+        states = await fleet.get_home_states()
+
+        self.assertEqual(sorted(states), [1234, 5678])
+        self.assertIsInstance(await fleet.home(5678), AsyncTadoX)
+        self.assertEqual(
+            self.backend.calls.count(("POST", "https://login.tado.com/oauth2/token")), 1
+        )
+
+
+class AsyncTadoTestCase(AsyncTestCase):
+    """Test cases for AsyncTado and AsyncTadoZone."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        http = await self.login("home_1234/tadov2.my_api_v2_home_state.json")
+        self.tado_client = AsyncTado.from_http(http)
+
+    async def test_zone_state(self) -> None:
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            "tadov2.heating.auto_mode.json",
+        )
+        zone = self.tado_client.get_zone(1)
+
+        with self.assertRaises(TadoException):
+            zone.current_temp
+
+        await zone.update_state()
+
+        self.assertEqual(zone.current_hvac_mode, HvacMode.AUTO)
+        self.assertEqual(zone.current_temp, 20.65)
+        self.assertEqual(zone.power, Power.ON)
+        self.assertEqual(zone.tado_mode, Presence.HOME)
+
+    async def test_zone_registry(self) -> None:
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/zones", "zones.json"
+        )
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/zones/1/capabilities",
+            "zone_with_swing_capabilities.json",
+        )
+        self.backend.add("PUT", "https://my.tado.com/api/v2/homes/1234/zones/1/overlay")
+
+        for _ in range(2):
+            await self.tado_client.set_zone_overlay(1, OverlayMode.MANUAL, 20.0)
+            await self.tado_client.get_capabilities(1)
+        self.tado_client.invalidate_zone_index()
+        await self.tado_client.get_capabilities(1)
+
+        self.assertEqual(
+            [url.rsplit("/1234/", 1)[1] for method, url in self.backend.calls[3:]],
+            [
+                "zones",
+                "zones/1/overlay",
+                "zones/1/capabilities",
+                "zones/1/overlay",
+                "zones/1/capabilities",
+            ],
+        )
+
+    async def test_snapshot(self) -> None:
+        self.backend.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            {
+                "zoneStates": {
+                    "1": json.loads(
+                        common.load_fixture("tadov2.heating.auto_mode.json")
+                    )
+                }
+            },
+        )
+
+        snapshot = await self.tado_client.get_snapshot()
+        await snapshot.refresh()
+
+        self.assertEqual(snapshot[1].current_temp, 20.65)
+        self.assertEqual(
+            self.backend.calls.count(
+                ("GET", "https://my.tado.com/api/v2/homes/1234/zoneStates")
+            ),
+            2,
+        )
+
+    async def test_historic_range(self) -> None:
+        url = (
+            "https://my.tado.com/api/v2/homes/1234/zones/{}/dayReport?date=2025-04-0{}"
+        )
+        for day in (6, 7):
+            self.backend.add_fixture(url.format(1, day), "history.zone_day_report.json")
+            self.backend.add_fixture(url.format(2, day), "history.zone_day_report.json")
+        # the first attempt of one day fails and is retried
+        self.backend.routes[("GET", url.format(2, 6))].insert(
+            0, (500, {}, '{"errors": []}')
+        )
+
+        reports = [
+            (zone, day)
+            async for zone, day, _ in self.tado_client.get_historic_range(
+                [1, 2], date(2025, 4, 6), date(2025, 4, 7), retry_delay=0
+            )
+        ]
+
+        self.assertEqual(
+            reports,
+            [
+                (1, date(2025, 4, 6)),
+                (2, date(2025, 4, 6)),
+                (1, date(2025, 4, 7)),
+                (2, date(2025, 4, 7)),
+            ],
+        )
+
+    async def test_poller(self) -> None:
+        self.backend.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            {
+                "zoneStates": {
+                    "1": json.loads(
+                        common.load_fixture("tadov2.heating.auto_mode.json")
+                    )
+                }
+            },
+        )
+        received: asyncio.Queue[list[StateChange]] = asyncio.Queue()
+
+        async with AsyncPoller(self.tado_client, callback=received.put):
+            (change,) = await asyncio.wait_for(received.get(), 5)
+
+        self.assertEqual(change.zone_id, 1)
+        self.assertIsNone(change.old)
+
+    async def test_subscribe(self) -> None:
+        raw = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+        self.backend.add(
+            "GET",
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            {"zoneStates": {"1": raw, "2": raw}},
+        )
+        received: asyncio.Queue[list[StateChange]] = asyncio.Queue()
+
+        self.tado_client.subscribe(received.put)
+        changes = []
+        async with self.tado_client.subscribe(zone=2) as subscription:
+            async for change in subscription:
+                changes.append(change)
+                # ends the iterator of every subscription
+                await self.tado_client.close()
+
+        self.assertEqual([change.zone_id for change in changes], [2])
+        self.assertEqual(len(await received.get()), 2)
+        self.assertFalse(self.tado_client.poller.running)
+
+    async def test_writes_are_counted(self) -> None:
+        self.backend.add(
+            "PUT", "https://my.tado.com/api/v2/devices/VA1/childLock", {"success": True}
+        )
+
+        await self.tado_client.set_child_lock("VA1", True)
+
+        # e.g. a GET which raced the write does not store its response in the cache
+        self.assertEqual(self.tado_client._http._writes, 1)
+
+    async def test_boiler_max_output_temperature(self) -> None:
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homeByBridge/IB123456789/"
+            "boilerMaxOutputTemperature?authKey=authcode",
+            "home_by_bridge.boiler_max_output_temperature.json",
+        )
+
+        max_output = await self.tado_client.get_boiler_max_output_temperature(
+            "IB123456789", "authcode"
+        )
+
+        self.assertEqual(max_output.boiler_max_output_temperature_in_celsius, 50)
+
+    async def test_x_line_home_is_rejected(self) -> None:
+        self.backend.routes.pop(("GET", "https://my.tado.com/api/v2/homes/1234/"))
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/",
+            "home_1234/tadox.my_api_v2_home_state.json",
+        )
+
+        with self.assertRaises(TadoException):
+            await AsyncTado.create(saved_refresh_token="saved")
+
+
+class AsyncTadoXTestCase(AsyncTestCase):
+    """Test cases for AsyncTadoX and AsyncTadoRoom."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        http = await self.login("home_1234/tadox.my_api_v2_home_state.json")
+        self.tado_client = AsyncTadoX.from_http(http)
+
+        self.backend.add_fixture(
+            "https://hops.tado.com/homes/1234/roomsAndDevices",
+            "tadox/rooms_and_devices.json",
+        )
+
+    async def test_get_zones_seeds_room_data(self) -> None:
+        rooms = await self.tado_client.get_zones()
+
+        self.assertEqual(rooms[0].name, "Room 1")
+        self.assertEqual(
+            self.backend.calls[-1],
+            ("GET", "https://hops.tado.com/homes/1234/roomsAndDevices"),
+        )
+
+    async def test_manual_control(self) -> None:
+        self.backend.add(
+            "POST", "https://hops.tado.com/homes/1234/rooms/1/manualControl", "0"
+        )
+
+        self.assertEqual(await self.tado_client.set_manual_control(1, m_temp=0), -1)
+        self.assertEqual(await self.tado_client.set_manual_control(1, m_temp=21), 0)
+        self.assertEqual(
+            self.backend.calls[-1],
+            ("POST", "https://hops.tado.com/homes/1234/rooms/1/manualControl"),
+        )
+
+    async def test_room_update(self) -> None:
+        self.backend.add_fixture(
+            "https://hops.tado.com/homes/1234/rooms/1",
+            "home_1234/tadox.heating.auto_mode.json",
+        )
+        self.backend.add_fixture(
+            "https://my.tado.com/api/v2/homes/1234/state",
+            "tadov2.home_state.auto_supported.auto_mode.json",
+        )
+        room = self.tado_client.get_zone(1)
+
+        await room.update()
+
+        self.assertEqual(room.current_hvac_mode, HvacMode.AUTO)
+        self.assertEqual(room.current_temp, 24.0)
+        self.assertEqual(room.target_temp, 22.0)
+        self.assertEqual(room.tado_mode_setting, Presence.AUTO)
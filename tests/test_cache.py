@@ -0,0 +1,322 @@
+"""Test the response cache."""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+
+from PyTado.cache import (
+    AsyncSingleFlight,
+    ResponseCache,
+    SingleFlight,
+    request_key,
+    zone_of,
+)
+from PyTado.http import Action, TadoRequest, TadoXRequest
+from PyTado.types import OverlayMode
+
+from . import common
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    """Test cases for the ResponseCache class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = common.FakeClock()
+        self.cache = ResponseCache(clock=self.clock)
+
+    def test_request_key(self) -> None:
+        a = TadoRequest(
+            command="zones/1/dayReport", params={"date": "2024-01-01", "a": 1}
+        )
+        b = TadoRequest(
+            command="zones/1/dayReport", params={"a": 1, "date": "2024-01-01"}
+        )
+
+        self.assertEqual(request_key(a, 1), request_key(b, 1))
+        self.assertNotEqual(request_key(a, 1), request_key(a, 2))
+        self.assertNotEqual(
+            request_key(a), request_key(TadoXRequest(command=a.command))
+        )
+
+    def test_zone_of(self) -> None:
+        self.assertEqual(zone_of(TadoRequest(command="zones/12/state")), 12)
+        self.assertEqual(zone_of(TadoXRequest(command="rooms/3")), 3)
+        self.assertIsNone(zone_of(TadoRequest(command="zoneStates")))
+        self.assertIsNone(zone_of(TadoRequest()))
+
+    def test_ttl_per_kind_of_request(self) -> None:
+        self.assertEqual(self.cache.ttl_for(TadoRequest(command="zones")), 6 * 3600)
+        self.assertEqual(self.cache.ttl_for(TadoRequest(command="zoneStates")), 10)
+        self.assertEqual(self.cache.ttl_for(TadoXRequest(command="rooms/1")), 10)
+        self.assertIsNone(self.cache.ttl_for(TadoXRequest(command="rooms/1/schedule")))
+        self.assertIsNone(self.cache.ttl_for(TadoRequest()))
+
+    def test_expiry(self) -> None:
+        request = TadoRequest(command="zoneStates")
+        self.cache.put(request, {"zoneStates": {}})
+
+        self.clock.now = 9.9
+        self.assertEqual(self.cache.get(request), {"zoneStates": {}})
+
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get(request))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_uncached_requests_are_not_stored(self) -> None:
+        self.cache.put(
+            TadoRequest(command="zones/1/schedule/activeTimetable"), {"id": 0}
+        )
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache(max_entries=2, clock=self.clock)
+        first, second, third = (
+            TadoRequest(command=f"zones/{i}/state") for i in (1, 2, 3)
+        )
+
+        cache.put(first, 1)
+        cache.put(second, 2)
+        cache.get(first)
+        cache.put(third, 3)
+
+        self.assertEqual(cache.get(first), 1)
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.get(third), 3)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_zone_write_invalidates_zone_and_home_entries(self) -> None:
+        for command in ("zones/1/state", "zones/2/state", "zoneStates"):
+            self.cache.put(TadoRequest(command=command), command, home_id=1)
+        self.cache.put(TadoRequest(command="zoneStates"), "other home", home_id=2)
+
+        self.cache.invalidate(
+            TadoRequest(command="zones/1/overlay", action=Action.CHANGE), home_id=1
+        )
+
+        self.assertIsNone(self.cache.get(TadoRequest(command="zones/1/state"), 1))
+        self.assertIsNone(self.cache.get(TadoRequest(command="zoneStates"), 1))
+        self.assertEqual(
+            self.cache.get(TadoRequest(command="zones/2/state"), 1), "zones/2/state"
+        )
+        self.assertEqual(
+            self.cache.get(TadoRequest(command="zoneStates"), 2), "other home"
+        )
+
+    def test_home_write_invalidates_home(self) -> None:
+        self.cache.put(TadoRequest(command="zones/1/state"), 1, home_id=1)
+        self.cache.put(TadoRequest(command="zones"), [], home_id=1)
+
+        self.cache.invalidate(
+            TadoRequest(command="presenceLock", action=Action.CHANGE), home_id=1
+        )
+
+        self.assertEqual(len(self.cache), 0)
+
+
+def wait_for(condition, timeout: float = 5) -> None:
+    """Waits until condition() is true, fails after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class SingleFlightTestCase(unittest.TestCase):
+    """Test cases for the SingleFlight and AsyncSingleFlight classes."""
+
+    def test_concurrent_calls_share_one_call(self) -> None:
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn() -> dict:
+            calls.append(1)
+            release.wait(5)
+            return {"zoneStates": {}}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flights.do, ("key",), fn) for _ in range(4)]
+            wait_for(lambda: flights.shared == 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+        # the finished call is not reused
+        self.assertEqual(flights.do(("key",), lambda: "again"), "again")
+
+    def test_error_is_shared(self) -> None:
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def fn() -> None:
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flights.do, ("key",), fn) for _ in range(2)]
+            wait_for(lambda: flights.shared == 1)
+            release.set()
+            for future in futures:
+                self.assertRaises(ValueError, future.result)
+
+    def test_forget_starts_new_call(self) -> None:
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def fn() -> str:
+            release.wait(5)
+            return "before write"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(flights.do, ("key",), fn)
+            wait_for(lambda: ("key",) in flights._calls)
+            flights.forget()
+            self.assertEqual(flights.do(("key",), lambda: "after write"), "after write")
+            release.set()
+            self.assertEqual(future.result(), "before write")
+
+    def test_async_concurrent_calls_share_one_call(self) -> None:
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fn() -> dict:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"zoneStates": {}}
+
+        async def main() -> list:
+            waiter = asyncio.ensure_future(flights.do(("key",), fn))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await asyncio.gather(*(flights.do(("key",), fn) for _ in range(3)))
+
+        results = asyncio.run(main())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.shared, 3)
+        self.assertTrue(all(result is results[0] for result in results))
+
+
+class HttpCacheTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the response cache in Http.request."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.http._cache = ResponseCache()
+
+    @responses.activate
+    def test_cached_reads_and_invalidating_writes(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            json=json.loads(common.load_fixture("tadov2.heating.auto_mode.json")),
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            json={},
+            status=200,
+        )
+
+        self.tado_client.get_state(1)
+        self.tado_client.get_state(1)
+        self.assertEqual(len(responses.calls), 1)
+
+        self.tado_client.set_zone_overlay(
+            1, OverlayMode.MANUAL, set_temp=21, device_type="HEATING"
+        )
+        self.tado_client.get_state(1)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.http.cache.hits, 1)
+
+    @responses.activate
+    def test_write_during_read_is_not_cached(self) -> None:
+        state = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+
+        def write_while_reading(_):
+            # another thread writes while the read is in flight
+            writer = threading.Thread(
+                target=self.tado_client.set_zone_overlay,
+                args=(1, OverlayMode.MANUAL),
+                kwargs={"set_temp": 21, "device_type": "HEATING"},
+            )
+            writer.start()
+            writer.join()
+            return 200, {}, json.dumps(state)
+
+        responses.add_callback(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            callback=write_while_reading,
+        )
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            json={},
+            status=200,
+        )
+
+        self.tado_client.get_state(1)
+
+        # the response may predate the write, it is not served from the cache
+        self.assertEqual(len(self.http.cache), 0)
+
+
+class HttpSingleFlightTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for coalescing concurrent GET requests in Http.request."""
+
+    @responses.activate
+    def test_concurrent_reads_share_one_request(self) -> None:
+        body = json.dumps(
+            {
+                "zoneStates": {
+                    "1": json.loads(
+                        common.load_fixture("tadov2.heating.auto_mode.json")
+                    )
+                }
+            }
+        )
+
+        def callback(request):
+            wait_for(lambda: self.http._flights.shared == 3)
+            return 200, {}, body
+
+        responses.add_callback(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            callback=callback,
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda _: self.tado_client.get_zone_states(), range(4))
+            )
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertTrue(all(list(result) == ["1"] for result in results))
+
+    @responses.activate
+    def test_sequential_reads_are_not_coalesced(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {}},
+            status=200,
+        )
+
+        self.tado_client.get_zone_states()
+        self.tado_client.get_zone_states()
+
+        self.assertEqual(len(responses.calls), 2)
@@ -0,0 +1,134 @@
+"""Test recording and replaying the traffic of Http."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.cassette import Cassette, redact_body, redact_url, request_key
+from PyTado.exceptions import TadoException
+from PyTado.http import Http, TadoRequest
+from PyTado.interface.api import Tado
+
+from . import common
+
+TOKEN_URL = "https://login.tado.com/oauth2/token"
+STATE_URL = "https://my.tado.com/api/v2/homes/1234/zones/1/state"
+
+
+class CassetteTestCase(unittest.TestCase):
+    """Test cases for the Cassette class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traffic.jsonl")
+
+    def test_redact(self) -> None:
+        self.assertEqual(
+            redact_url(
+                "https://login.tado.com/oauth2/token?device_code=abc&client_id=1"
+            ),
+            "https://login.tado.com/oauth2/token?device_code=REDACTED&client_id=1",
+        )
+        self.assertEqual(
+            redact_body("grant_type=refresh_token&refresh_token=secret"),
+            "grant_type=refresh_token&refresh_token=REDACTED",
+        )
+        self.assertEqual(
+            redact_body('{"access_token": "secret", "expires_in": 600}'),
+            '{"access_token": "REDACTED", "expires_in": 600}',
+        )
+
+    @responses.activate
+    def record(self) -> None:
+        responses.add(
+            responses.POST,
+            TOKEN_URL,
+            json={
+                "access_token": "secret-access",
+                "expires_in": 600,
+                "refresh_token": "secret-refresh",
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/me",
+            json=json.loads(common.load_fixture("home_1234/my_api_v2_me.json")),
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/",
+            json=json.loads(
+                common.load_fixture("home_1234/tadov2.my_api_v2_home_state.json")
+            ),
+            status=200,
+        )
+        for fixture in (
+            "tadov2.heating.auto_mode.json",
+            "tadov2.heating.off_mode.json",
+        ):
+            responses.add(
+                responses.GET,
+                STATE_URL,
+                json=json.loads(common.load_fixture(fixture)),
+                status=200,
+                headers={"RateLimit": '"perday";r=99;t=100'},
+            )
+
+        with Cassette(self.path) as cassette:
+            http = Http(saved_refresh_token="saved", transport=cassette.recorder())
+            tado = Tado.from_http(http)
+            tado.get_state(1)
+            tado.get_state(1)
+
+    def test_record_redacts_tokens(self) -> None:
+        self.record()
+
+        with open(self.path, encoding="utf-8") as stream:
+            content = stream.read()
+
+        self.assertEqual(len(content.splitlines()), 5)
+        for secret in ("saved", "secret-access", "secret-refresh"):
+            self.assertNotIn(secret, content)
+        self.assertNotIn("Bearer", content)
+
+    def test_replay_without_network(self) -> None:
+        self.record()
+
+        # sockets are disabled in the tests, every answer comes from the cassette
+        with Cassette(self.path) as cassette:
+            http = Http(saved_refresh_token="other", transport=cassette.player())
+            tado = Tado.from_http(http)
+
+            self.assertEqual(http._id, 1234)
+            self.assertEqual(tado.get_state(1).setting.power, "ON")
+            # repeated requests are replayed in order, the last one repeats
+            self.assertEqual(tado.get_state(1).setting.power, "OFF")
+            self.assertEqual(tado.get_state(1).setting.power, "OFF")
+            self.assertEqual(http.remaining_quota, 99)
+
+            with self.assertRaises(TadoException):
+                http.request(TadoRequest(command="zones/2/state"))
+
+    def test_large_cassette(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as stream:
+            for i in range(20000):
+                key = request_key("GET", f"https://my.tado.com/api/v2/homes/{i}/", "")
+                entry = {"key": key, "status": 200, "headers": {}, "body": str(i)}
+                stream.write(json.dumps(entry) + "\n")
+
+        with Cassette(self.path) as cassette:
+            player = cassette.player()
+            self.assertEqual(len(cassette), 20000)
+
+            request = mock.Mock(
+                method="GET", url="https://my.tado.com/api/v2/homes/19999/", body=None
+            )
+            self.assertEqual(player.send(request).text, "19999")
@@ -0,0 +1,140 @@
+"""Test the change events of zone/room states."""
+
+import copy
+import json
+import unittest
+from typing import Any
+
+from PyTado.diff import (
+    ConnectionChanged,
+    CurrentTemperatureChanged,
+    HeatingPowerChanged,
+    OverlayEnded,
+    OverlayStarted,
+    PowerChanged,
+    PresenceChanged,
+    TargetTemperatureChanged,
+    WindowClosed,
+    WindowOpened,
+    ZoneAdded,
+    ZoneRemoved,
+    diff,
+    diff_home,
+    diff_summaries,
+    summary,
+)
+from PyTado.models.line_x.room import RoomState
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.types import LinkState, Power, Presence
+
+from . import common
+
+
+def load(filename: str) -> dict[str, Any]:
+    return json.loads(common.load_fixture(filename))
+
+
+class ZoneStateDiffTestCase(unittest.TestCase):
+    """Test cases for the events of pre Tado X zones."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.raw = load("tadov2.heating.auto_mode.json")
+        self.old = ZoneState.model_validate(self.raw)
+
+    def changed(self, raw: dict[str, Any]) -> list[Any]:
+        return diff(1, self.old, ZoneState.model_validate(raw))
+
+    def test_no_changes(self) -> None:
+        self.assertEqual(self.changed(copy.deepcopy(self.raw)), [])
+        self.assertEqual(diff(1, self.old, self.old), [])
+
+    def test_overlay(self) -> None:
+        manual = ZoneState.model_validate(load("tadov2.heating.manual_mode.json"))
+
+        events = diff(1, self.old, manual)
+
+        self.assertIn(OverlayStarted(1), events)
+        self.assertIn(
+            TargetTemperatureChanged(
+                1,
+                self.old.setting.temperature.celsius,  # type: ignore[union-attr]
+                manual.setting.temperature.celsius,  # type: ignore[union-attr]
+            ),
+            events,
+        )
+        self.assertIn(OverlayEnded(1), diff(1, manual, self.old))
+
+    def test_values(self) -> None:
+        raw = copy.deepcopy(self.raw)
+        raw["sensorDataPoints"]["insideTemperature"]["celsius"] = 23.5
+        raw["activityDataPoints"]["heatingPower"]["percentage"] = 40.0
+        raw["tadoMode"] = Presence.AWAY
+        raw["link"] = {"state": LinkState.OFFLINE}
+        current = self.raw["sensorDataPoints"]["insideTemperature"]["celsius"]
+
+        self.assertEqual(
+            self.changed(raw),
+            [
+                CurrentTemperatureChanged(1, current, 23.5),
+                HeatingPowerChanged(1, 0.0, 40.0),
+                PresenceChanged(1, Presence.HOME, Presence.AWAY),
+                ConnectionChanged(1, True, False),
+            ],
+        )
+
+    def test_window(self) -> None:
+        raw = copy.deepcopy(self.raw)
+        raw["openWindow"] = {
+            "detectedTime": "2025-01-01T00:00:00Z",
+            "durationInSeconds": 900,
+            "expiry": "2025-01-01T00:15:00Z",
+            "remainingTimeInSeconds": 600,
+        }
+
+        self.assertEqual(self.changed(raw), [WindowOpened(1)])
+        self.assertEqual(
+            diff(1, ZoneState.model_validate(raw), self.old), [WindowClosed(1)]
+        )
+
+    def test_zones_added_and_removed(self) -> None:
+        self.assertEqual(diff(1, None, self.old), [ZoneAdded(1, self.old)])
+        self.assertEqual(diff(1, self.old, None), [ZoneRemoved(1)])
+        self.assertEqual(
+            diff_home({1: self.old, 2: self.old}, {1: self.old, 3: self.old}),
+            [ZoneAdded(3, self.old), ZoneRemoved(2)],
+        )
+
+    def test_summaries(self) -> None:
+        manual = ZoneState.model_validate(load("tadov2.heating.manual_mode.json"))
+
+        old, new = summary(self.old), summary(manual)
+
+        self.assertEqual(old["presence"], Presence.HOME)
+        self.assertFalse(old["overlay"])
+        self.assertEqual(diff_summaries(1, old, new), diff(1, self.old, manual))
+
+
+class RoomStateDiffTestCase(unittest.TestCase):
+    """Test cases for the events of Tado X rooms."""
+
+    def test_boost_and_power(self) -> None:
+        auto = RoomState.model_validate(load("home_1234/tadox.heating.auto_mode.json"))
+        boost = RoomState.model_validate(
+            load("home_1234/tadox.heating.boost_mode.json")
+        )
+        off = RoomState.model_validate(load("home_1234/tadox.heating.manual_off.json"))
+
+        self.assertIn(OverlayStarted(1), diff(1, auto, boost))
+        events = diff(1, auto, off)
+        self.assertIn(PowerChanged(1, Power.ON, Power.OFF), events)
+        self.assertIn(TargetTemperatureChanged(1, 22.0, None), events)
+
+    def test_window(self) -> None:
+        raw = load("home_1234/tadox.heating.auto_mode.json")
+        closed = RoomState.model_validate(raw)
+        raw["openWindow"] = {"activated": True, "expiryInSeconds": 600}
+
+        self.assertEqual(
+            diff(1, closed, RoomState.model_validate(raw)), [WindowOpened(1)]
+        )
@@ -0,0 +1,103 @@
+"""Test the fake Tado server."""
+
+import os
+import unittest
+
+import pytest
+import requests
+
+from PyTado.exceptions import TadoRateLimitException
+from PyTado.http import DeviceActivationStatus, Http
+from PyTado.interface import api
+from PyTado.interface.interface import Tado
+from PyTado.testing import FakeTadoServer
+from PyTado.types import ZoneType
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.mark.allow_hosts(["127.0.0.1"])
+class FakeTadoServerTestCase(unittest.TestCase):
+    """Test cases for PyTado clients talking to the FakeTadoServer."""
+
+    def start(self, **kwargs) -> FakeTadoServer:
+        server = FakeTadoServer(FIXTURES, seed=1, **kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def session(self) -> requests.Session:
+        session = requests.Session()
+        # keep proxy settings from the environment away from the local server
+        session.trust_env = False
+        return session
+
+    def test_stop_without_start(self) -> None:
+        server = FakeTadoServer(FIXTURES)
+
+        # returns instead of waiting for a server loop which never ran
+        server.stop()
+        self.assertTrue(server.url.startswith("http://127.0.0.1:"))
+
+    def test_device_flow(self) -> None:
+        server = self.start(device_flow_polls=2)
+
+        tado = Tado(http_session=self.session(), transport=server.transport())
+        self.assertEqual(
+            tado.device_activation_status(), DeviceActivationStatus.PENDING
+        )
+        tado.device_activation()
+
+        self.assertEqual(
+            tado.device_activation_status(), DeviceActivationStatus.COMPLETED
+        )
+        token_polls = [r for r in server.requests if r[2] == "/oauth2/token"]
+        self.assertEqual(len(token_polls), 3)
+
+        zones = tado.get_zones()
+        self.assertEqual([zone.name for zone in zones], ["Living Room", "Hot Water"])
+        self.assertEqual(tado.get_zone_states().keys(), {"1", "2"})
+
+    def test_x_line_home(self) -> None:
+        server = self.start(x_line=True)
+
+        tado = Tado(
+            saved_refresh_token="saved",
+            http_session=self.session(),
+            transport=server.transport(),
+        )
+
+        self.assertTrue(tado._http.is_x_line)
+        snapshot = tado.get_snapshot()
+        self.assertEqual(list(snapshot), [1, 2])
+
+    def test_rejects_unknown_token(self) -> None:
+        server = self.start()
+
+        response = self.session().get(
+            f"{server.url}/api/v2/me",
+            headers={"Host": "my.tado.com", "Authorization": "Bearer stolen"},
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_fault_injection(self) -> None:
+        server = self.start(quota=100)
+        http = Http(
+            saved_refresh_token="saved",
+            http_session=self.session(),
+            transport=server.transport(),
+        )
+        tado = api.Tado.from_http(http)
+
+        # 5xx responses are retried by the transport
+        server.fail_next(503)
+        self.assertEqual(tado.get_state(1).setting.type, ZoneType.HEATING)
+        self.assertEqual(server.statuses[503], 1)
+        # me, home and zone state, injected faults are not counted
+        self.assertEqual(http.remaining_quota, 97)
+
+        server.fail_next(429)
+        with self.assertRaises(TadoRateLimitException):
+            tado.get_state(1)
+        self.assertEqual(http.remaining_quota, 0)
@@ -0,0 +1,136 @@
+"""Test the Fleet class."""
+
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import responses
+
+from PyTado.exceptions import TadoException
+from PyTado.fleet import Fleet
+from PyTado.http import Http, TadoXRequest
+from PyTado.interface.api import Tado, TadoX
+from PyTado.types import Presence
+
+from . import common
+
+ME = json.loads(common.load_fixture("home_1234/my_api_v2_me.json"))
+ME["homes"].append({"id": 5678, "name": "Tado X Home"})
+TADOX_HOME = json.loads(
+    common.load_fixture("home_1234/tadox.my_api_v2_home_state.json")
+)
+HOME_STATE = json.loads(
+    common.load_fixture("tadov2.home_state.auto_supported.auto_mode.json")
+)
+
+
+class FleetTestCase(unittest.TestCase):
+    """Test cases for the Fleet class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        responses.start()
+        self.addCleanup(responses.reset)
+        self.addCleanup(responses.stop)
+
+        self.token = responses.add(
+            responses.POST,
+            "https://login.tado.com/oauth2/token",
+            json={
+                "access_token": "value",
+                "expires_in": 1000,
+                "refresh_token": "another_value",
+            },
+        )
+        responses.add(responses.GET, "https://my.tado.com/api/v2/me", json=ME)
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/",
+            json=json.loads(
+                common.load_fixture("home_1234/tadov2.my_api_v2_home_state.json")
+            ),
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/5678/",
+            json={**TADOX_HOME, "id": 5678},
+        )
+
+        self.http = Http(saved_refresh_token="saved")
+        self.fleet = Fleet(self.http)
+
+    def test_discover(self) -> None:
+        homes = self.fleet.homes
+
+        self.assertEqual(list(homes), [1234, 5678])
+        self.assertIsInstance(homes[1234], Tado)
+        self.assertIsInstance(homes[5678], TadoX)
+        # one login for all homes
+        self.assertEqual(self.token.call_count, 1)
+
+        with self.assertRaises(TadoException):
+            self.fleet.home(1)
+
+    def test_bulk(self) -> None:
+        for home_id, presence in ((1234, Presence.HOME), (5678, Presence.AWAY)):
+            responses.add(
+                responses.GET,
+                f"https://my.tado.com/api/v2/homes/{home_id}/state",
+                json={**HOME_STATE, "presence": presence},
+            )
+
+        states = self.fleet.get_home_states()
+
+        self.assertEqual(
+            {home_id: state.presence for home_id, state in states.items()},
+            {1234: Presence.HOME, 5678: Presence.AWAY},
+        )
+        self.assertEqual(
+            {call.request.headers["Authorization"] for call in responses.calls[1:]},
+            {"Bearer value"},
+        )
+
+    def test_return_exceptions(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/state",
+            json=HOME_STATE,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/5678/state",
+            status=500,
+            json={"errors": []},
+        )
+
+        states = self.fleet.map(
+            lambda home: home.get_home_state(), return_exceptions=True
+        )
+
+        self.assertEqual(states[1234].presence, Presence.HOME)
+        self.assertIsInstance(states[5678], TadoException)
+        with self.assertRaises(TadoException):
+            self.fleet.get_home_states()
+
+    def test_shared_token_refresh(self) -> None:
+        responses.add(responses.GET, "https://hops.tado.com/homes/5678/rooms", json=[])
+        self.fleet.discover()
+        self.http._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        responses.replace(
+            responses.POST,
+            "https://login.tado.com/oauth2/token",
+            json={
+                "access_token": "new_value",
+                "expires_in": 1000,
+                "refresh_token": "new_refresh_value",
+            },
+        )
+
+        self.assertEqual(self.fleet.request(5678, TadoXRequest(command="rooms")), [])
+
+        # the home refreshed the token of the account client
+        self.assertEqual(self.http.refresh_token, "new_refresh_value")
+        self.assertEqual(self.fleet.home(1234)._http.refresh_token, "new_refresh_value")
+        self.assertEqual(
+            responses.calls[-1].request.headers["Authorization"], "Bearer new_value"
+        )
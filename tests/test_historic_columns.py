@@ -0,0 +1,115 @@
+"""Test the columnar day reports."""
+
+import math
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from PyTado.exceptions import TadoException
+from PyTado.models.historic import Historic
+from PyTado.models.historic_columns import HistoricColumns, Series
+
+from . import common
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def epoch_ms(value: datetime) -> int:
+    return round(value.timestamp() * 1000)
+
+
+class HistoricColumnsTestCase(unittest.TestCase):
+    """Test cases for the HistoricColumns class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.raw = common.load_fixture("history.zone_day_report.json")
+        self.columns = HistoricColumns.from_json(self.raw)
+
+    def test_matches_the_model(self) -> None:
+        historic = Historic.model_validate_json(self.raw)
+        columns = self.columns
+
+        self.assertEqual(columns.zone_type, historic.zone_type)
+        self.assertEqual(columns.hours_in_day, historic.hours_in_day)
+        self.assertEqual(columns.start, epoch_ms(historic.interval.from_date))
+        self.assertEqual(columns.end, epoch_ms(historic.interval.to_date))
+
+        points = historic.measured_data.inside_temperature.data_points or []
+        self.assertEqual(
+            list(columns.inside_temperature["timestamp"]),
+            [epoch_ms(point.timestamp) for point in points],
+        )
+        self.assertEqual(
+            list(columns.inside_temperature["celsius"]),
+            [point.value.celsius for point in points],
+        )
+        humidity = historic.measured_data.humidity.data_points or []
+        self.assertEqual(
+            list(columns.humidity["value"]), [point.value for point in humidity]
+        )
+
+        stripes = historic.stripes.data_intervals
+        self.assertEqual(len(columns.stripes), len(stripes))
+        self.assertEqual(
+            columns.stripes["stripe_type"], [i.value.stripe_type for i in stripes]
+        )
+        self.assertEqual(columns.stripes["end"][1], epoch_ms(stripes[1].to_date))
+        # the first stripe has no setting
+        self.assertIsNone(columns.stripes["power"][0])
+        self.assertTrue(math.isnan(columns.stripes["celsius"][0]))
+
+        settings = historic.settings.data_intervals
+        self.assertEqual(columns.settings["power"], [i.value.power for i in settings])
+        self.assertEqual(
+            columns.call_for_heat["value"],
+            [i.value for i in historic.call_for_heat.data_intervals],
+        )
+        self.assertEqual(
+            columns.weather_condition["state"],
+            [i.value.state for i in historic.weather.condition.data_intervals],
+        )
+        self.assertEqual(list(columns.sunny["value"]), [0])
+        self.assertEqual(list(columns.measuring_device_connected["value"]), [1])
+        self.assertEqual(
+            columns.weather_slots["slot"], list(historic.weather.slots.slots)
+        )
+
+    def test_concat(self) -> None:
+        year = HistoricColumns.concat([self.columns] * 3)
+
+        self.assertEqual(len(year.inside_temperature), 3 * 99)
+        self.assertEqual(len(year.weather_slots), 3 * 5)
+        self.assertEqual(year.hours_in_day, 72)
+        # the parts are not changed
+        self.assertEqual(len(self.columns.inside_temperature), 99)
+
+        with self.assertRaises(ValueError):
+            HistoricColumns.concat([])
+
+    def test_empty_series(self) -> None:
+        columns = HistoricColumns.from_json({"zoneType": "HEATING"})
+
+        self.assertEqual(len(columns.inside_temperature), 0)
+        self.assertEqual(len(columns.stripes), 0)
+        self.assertEqual(len(Series({})), 0)
+
+    def test_invalid_response(self) -> None:
+        with self.assertRaises(TadoException):
+            HistoricColumns.from_json([])
+
+    def test_to_numpy_requires_numpy(self) -> None:
+        with mock.patch.dict("sys.modules", {"numpy": None}):
+            with self.assertRaises(TadoException):
+                self.columns.inside_temperature.to_numpy()
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_numpy(self) -> None:
+        arrays = self.columns.inside_temperature.to_numpy()
+
+        self.assertEqual(arrays["timestamp"].dtype, numpy.dtype("datetime64[ms]"))
+        self.assertEqual(arrays["timestamp"][0], numpy.datetime64("2025-04-06T21:45"))
+        self.assertAlmostEqual(float(arrays["celsius"].min()), 19.58)
@@ -0,0 +1,134 @@
+"""Test fetching the day reports of a date range."""
+
+import json
+import threading
+from datetime import date
+from unittest import mock
+
+import responses
+from responses import matchers
+
+from PyTado.exceptions import TadoException, TadoRateLimitException
+from PyTado.interface.api.historic_range import report_days
+from PyTado.models import Historic, HistoricColumns
+
+from . import common
+
+DAY_REPORT = json.loads(common.load_fixture("history.zone_day_report.json"))
+
+
+def add_day_report(zone: int, day: date, status: int = 200) -> None:
+    responses.add(
+        responses.GET,
+        f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/dayReport",
+        match=[matchers.query_param_matcher({"date": day.isoformat()})],
+        json=DAY_REPORT if status == 200 else {"errors": []},
+        status=status,
+    )
+
+
+class HistoricRangeTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for get_historic_range."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        sleep_patch = mock.patch("PyTado.interface.api.historic_range.time.sleep")
+        self.sleep = sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+
+    def test_report_days(self) -> None:
+        self.assertEqual(
+            list(report_days(date(2024, 2, 28), date(2024, 3, 1))),
+            [date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1)],
+        )
+        self.assertEqual(list(report_days(date(2024, 3, 1), date(2024, 2, 28))), [])
+
+    @responses.activate
+    def test_reports_in_date_order(self) -> None:
+        days = list(report_days(date(2025, 4, 1), date(2025, 4, 10)))
+        for day in days:
+            for zone in (1, 2):
+                add_day_report(zone, day)
+
+        reports = list(
+            self.tado_client.get_historic_range([1, 2], days[0], days[-1], workers=3)
+        )
+
+        self.assertEqual(
+            [(zone, day) for zone, day, _ in reports],
+            [(zone, day) for day in days for zone in (1, 2)],
+        )
+        self.assertTrue(all(isinstance(r, Historic) for _, _, r in reports))
+
+    @responses.activate
+    def test_columns(self) -> None:
+        add_day_report(1, date(2025, 4, 7))
+
+        ((zone, day, report),) = self.tado_client.get_historic_range(
+            [1], date(2025, 4, 7), date(2025, 4, 7), columns=True
+        )
+
+        self.assertEqual((zone, day), (1, date(2025, 4, 7)))
+        self.assertIsInstance(report, HistoricColumns)
+
+    @responses.activate
+    def test_failed_days_are_retried(self) -> None:
+        add_day_report(1, date(2025, 4, 7), status=500)
+        add_day_report(1, date(2025, 4, 7))
+
+        reports = list(
+            self.tado_client.get_historic_range([1], date(2025, 4, 7), date(2025, 4, 7))
+        )
+
+        self.assertEqual(len(reports), 1)
+        self.sleep.assert_called_once_with(1.0)
+
+    @responses.activate
+    def test_error_after_the_retries(self) -> None:
+        add_day_report(1, date(2025, 4, 7), status=500)
+
+        with self.assertRaises(TadoException):
+            list(
+                self.tado_client.get_historic_range(
+                    [1], date(2025, 4, 7), date(2025, 4, 7), retries=2
+                )
+            )
+        self.assertEqual([c.args for c in self.sleep.call_args_list], [(1.0,), (2.0,)])
+
+    @responses.activate
+    def test_rate_limit_is_not_retried(self) -> None:
+        add_day_report(1, date(2025, 4, 7), status=429)
+
+        with self.assertRaises(TadoRateLimitException):
+            list(
+                self.tado_client.get_historic_range(
+                    [1], date(2025, 4, 7), date(2025, 4, 7)
+                )
+            )
+        self.sleep.assert_not_called()
+
+    @responses.activate
+    def test_fetches_a_bounded_window_ahead(self) -> None:
+        days = list(report_days(date(2025, 1, 1), date(2025, 12, 31)))
+        for day in days:
+            add_day_report(1, day)
+
+        fetched = 0
+        lock = threading.Lock()
+        get_historic = self.tado_client.get_historic
+
+        def counting_get_historic(zone: int, day: date) -> Historic:
+            nonlocal fetched
+            with lock:
+                fetched += 1
+            return get_historic(zone, day)
+
+        self.tado_client.get_historic = counting_get_historic  # type: ignore[method-assign]
+
+        reports = self.tado_client.get_historic_range([1], days[0], days[-1], workers=2)
+        next(reports)
+        reports.close()
+
+        # the window of 2 * workers days, and the next one after the first was taken
+        self.assertGreater(fetched, 0)
+        self.assertLessEqual(fetched, 5)
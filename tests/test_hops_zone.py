@@ -23,6 +23,7 @@ from PyTado.types import (
     Presence,
     ZoneType,
 )
+from PyTado.zone import ZoneOverlay
 
 from . import common
 
@@ -232,6 +233,27 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=True):
         assert len(history.weather.condition.data_intervals) == 99
         assert len(history.weather.sunny.data_intervals) == 1
 
+    @responses.activate
+    def test_get_historic_columns(self) -> None:
+        self.set_fixture("home_1234/tadox.heating.auto_mode.json")
+
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/dayReport",
+            match=[matchers.query_param_matcher({"date": "2025-04-07"})],
+            json=json.loads(common.load_fixture("history.zone_day_report.json")),
+        )
+
+        columns = self.tado_client.get_historic_columns(1, datetime(2025, 4, 7))
+        assert columns.zone_type == ZoneType.HEATING
+        assert (
+            columns.start == datetime(2025, 4, 6, 21, 45, tzinfo=UTC).timestamp() * 1000
+        )
+        assert len(columns.inside_temperature) == 99
+        assert len(columns.stripes) == 33
+        assert columns.stripes["stripe_type"][1] == StripeType.OVERLAY_ACTIVE
+        assert columns.stripes["celsius"][1] == 19.0
+
     @responses.activate
     def test_not_existing_room(self) -> None:
         responses.add(
@@ -311,6 +333,30 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=True):
 
         assert len(responses.calls) == 1
 
+    @responses.activate
+    def test_set_zone_overlays(self) -> None:
+        """Tado X has no bulk endpoint, every room gets its own request."""
+        manual_control = responses.add(
+            responses.POST,
+            "https://hops.tado.com/homes/1234/rooms/1/manualControl",
+            status=204,
+        )
+        resume_schedule = responses.add(
+            responses.POST,
+            "https://hops.tado.com/homes/1234/rooms/2/resumeSchedule",
+            status=200,
+        )
+
+        self.tado_client.set_zone_overlays(
+            {
+                1: ZoneOverlay(OverlayMode.MANUAL, set_temp=20.0),
+                2: None,
+            }
+        )
+
+        assert manual_control.call_count == 1
+        assert resume_schedule.call_count == 1
+
     @responses.activate
     def test_set_schedule(self) -> None:
         expected_json = {
@@ -416,3 +462,12 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=True):
         assert schedule.schedule[0].setting.power == Power.ON
         assert schedule.schedule[0].setting.temperature.value == 18.0
         assert len(schedule.schedule) == 28
+
+    @responses.activate
+    def test_zone_index_is_shared(self) -> None:
+        """Room data of all rooms is loaded with a single roomsAndDevices request."""
+        rooms = self.tado_client.get_zones()
+
+        assert [room.name for room in rooms] == ["Room 1", " Room 2"]
+        assert len(self.tado_client.get_zone(1).devices) > 0
+        assert len(responses.calls) == 1
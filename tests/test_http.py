@@ -2,15 +2,19 @@
 
 import io
 import json
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
+import pytest
+import requests
 import responses
 
 from PyTado.const import CLIENT_ID_DEVICE
 from PyTado.exceptions import TadoException, TadoRateLimitException
-from PyTado.http import Domain, Endpoint, Http, TadoRequest
+from PyTado.http import ConnectionStats, Domain, Endpoint, Http, TadoRequest
 
 from . import common
 
@@ -392,3 +396,193 @@ class TestHttp(unittest.TestCase):
                 http.request(request)
 
         self.assertIn('"perday";r=0;t=1301', str(err.exception))
+
+    @responses.activate
+    def test_log_hook_registered_once(self):
+        """The logging hook is registered once, on the session only."""
+        http = Http()
+
+        self.assertEqual(http._session.hooks["response"].count(http._log_response), 1)
+
+        http._setup_session(http._session)
+        self.assertEqual(http._session.hooks["response"].count(http._log_response), 1)
+
+    @responses.activate
+    @mock.patch("time.sleep", return_value=None)
+    def test_response_body_is_decoded_once(self, mock_sleep):
+        """Response bodies are decoded once per request, with and without debug logging."""
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            json=json.loads(common.load_fixture("tadov2.heating.auto_mode.json")),
+            status=200,
+        )
+
+        for debug in (False, True):
+            with self.subTest(debug=debug):
+                http = Http(debug=debug)
+                http.device_activation()
+
+                with mock.patch(
+                    "requests.Response.json",
+                    autospec=True,
+                    side_effect=lambda response: json.loads(response.text),
+                ) as json_mock:
+                    http.request(TadoRequest(command="zones/1/state"))
+
+                self.assertEqual(json_mock.call_count, 1)
+
+
+@pytest.mark.allow_hosts(["127.0.0.1"])
+class TestHttpConnectionReuse(unittest.TestCase):
+    """Test that token refreshes keep the session and its connections."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = common.StubServer()
+        self.server.add(
+            "POST",
+            "/oauth2/token",
+            {
+                "access_token": "refreshed",
+                "expires_in": 600,
+                "refresh_token": "another_value",
+            },
+        )
+        self.server.add(
+            "GET",
+            "/zones/1/state",
+            json.loads(common.load_fixture("tadov2.heating.auto_mode.json")),
+        )
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        for patch in (
+            mock.patch("PyTado.http.Http._login_device_flow"),
+            mock.patch("PyTado.http._TOKEN_URL", f"{self.server.url}/oauth2/token"),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_refresh_keeps_session_and_connection(self):
+        session = requests.Session()
+        # keep CA bundle settings from the environment out of the pool keys
+        session.trust_env = False
+        http = Http(http_session=session)
+        http._id = 1234
+        http._token_refresh = "saved"
+
+        with mock.patch.object(
+            http,
+            "_configure_url",
+            side_effect=lambda request: f"{self.server.url}/{request.command}",
+        ):
+            for _ in range(3):
+                http.request(TadoRequest(command="zones/1/state"))
+
+            http._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+            for _ in range(3):
+                http.request(TadoRequest(command="zones/1/state"))
+
+        self.assertIs(http._session, session)
+        self.assertEqual(
+            [path for _, path, _ in self.server.requests].count("/oauth2/token"), 1
+        )
+        self.assertEqual(
+            self.server.requests[-1][2]["Authorization"], "Bearer refreshed"
+        )
+        self.assertEqual(
+            http.connection_stats, ConnectionStats(connections=1, requests=7)
+        )
+        self.assertEqual(http.connection_stats.reused, 6)
+
+
+@pytest.mark.allow_hosts(["127.0.0.1"])
+class TestHttpThreadSafety(unittest.TestCase):
+    """Stress test one Http client used by many threads at once."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = common.StubServer()
+        self.server.add(
+            "POST",
+            "/oauth2/token",
+            {
+                "access_token": "refreshed",
+                "expires_in": 600,
+                "refresh_token": "another_value",
+            },
+        )
+        self.server.add(
+            "GET",
+            "/zones/1/state",
+            json.loads(common.load_fixture("tadov2.heating.auto_mode.json")),
+        )
+        self.server.add("PUT", "/zones/1/overlay", {})
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        for patch in (
+            mock.patch("PyTado.http.Http._login_device_flow"),
+            mock.patch("PyTado.http._TOKEN_URL", f"{self.server.url}/oauth2/token"),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_concurrent_requests(self):
+        session = requests.Session()
+        session.trust_env = False
+        http = Http(http_session=session)
+        http._id = 1234
+        http._token_refresh = "saved"
+        http._refresh_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        read = TadoRequest(command="zones/1/state")
+        write = TadoRequest(
+            command="zones/1/overlay",
+            action="PUT",
+            payload={"setting": {"type": "HEATING", "power": "OFF"}},
+        )
+        start = threading.Barrier(8)
+
+        def worker(index: int) -> None:
+            start.wait()
+            for i in range(25):
+                http.request(write if (index + i) % 2 else read)
+
+        with mock.patch.object(
+            http,
+            "_configure_url",
+            side_effect=lambda request: f"{self.server.url}/{request.command}",
+        ):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for future in [pool.submit(worker, index) for index in range(8)]:
+                    future.result()
+
+        api_requests = [r for r in self.server.requests if r[1] != "/oauth2/token"]
+        self.assertEqual(len(self.server.requests) - len(api_requests), 1)
+        # identical reads may have been coalesced, writes never are
+        self.assertEqual(len([r for r in api_requests if r[0] == "PUT"]), 100)
+        for method, _, headers in api_requests:
+            self.assertEqual(headers["Authorization"], "Bearer refreshed")
+            if method == "PUT":
+                self.assertEqual(
+                    headers["Content-Type"], "application/json;charset=UTF-8"
+                )
+            else:
+                self.assertNotIn("Content-Type", headers)
+        self.assertNotIn("Content-Type", http._headers)
+
+    def test_discard_token_replaces_headers(self):
+        http = Http(http_session=requests.Session())
+        http._headers = {**http._headers, "Authorization": "Bearer old"}
+        headers = http._headers
+
+        http._discard_token()
+
+        # a thread still sending with the old headers never sees them change
+        self.assertEqual(headers["Authorization"], "Bearer old")
+        self.assertNotIn("Authorization", http._headers)
@@ -0,0 +1,145 @@
+"""Test the request metrics."""
+
+import unittest
+
+import responses
+
+from PyTado.exceptions import TadoException
+from PyTado.http import Action, Domain, Endpoint, TadoRequest
+from PyTado.metrics import STATUS_ERROR, MetricsRegistry, template_command
+
+from . import common
+
+
+class MetricsRegistryTestCase(unittest.TestCase):
+    """Test cases for the MetricsRegistry class."""
+
+    def test_template_command(self) -> None:
+        self.assertEqual(template_command("zones/12/state"), "zones/{id}/state")
+        self.assertEqual(
+            template_command("rooms/3/timetables/0/blocks"),
+            "rooms/{id}/timetables/{id}/blocks",
+        )
+        self.assertEqual(template_command("12"), "{id}")
+        self.assertEqual(template_command("zoneStates"), "zoneStates")
+        self.assertEqual(template_command(None), "")
+
+    def test_template_command_without_query_and_dates(self) -> None:
+        # one series for the day reports of every day
+        self.assertEqual(
+            template_command("zones/1/dayReport?date=2024-01-01"),
+            "zones/{id}/dayReport",
+        )
+        self.assertEqual(
+            template_command("rooms/2/history/2024-01-01"), "rooms/{id}/history/{date}"
+        )
+
+    def test_observe(self) -> None:
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        state = TadoRequest(command="zones/1/state")
+        metrics.observe(state, "GET", 200, 0.05, bytes_in=100)
+        metrics.observe(
+            TadoRequest(command="zones/2/state"), "GET", 429, 0.5, retries=2
+        )
+        metrics.observe(state, "GET", STATUS_ERROR, 5.0)
+        metrics.observe(TadoRequest(command="zones/1/overlay"), "PUT", 204, 0.2, 50)
+
+        overlay, state_metrics = metrics.snapshot()
+
+        self.assertEqual(overlay.command, "zones/{id}/overlay")
+        self.assertEqual(overlay.method, "PUT")
+        self.assertEqual(overlay.bytes_out, 0)
+
+        self.assertEqual(state_metrics.endpoint, Endpoint.MY_API.name)
+        self.assertEqual(state_metrics.command, "zones/{id}/state")
+        self.assertEqual(state_metrics.requests, 3)
+        self.assertEqual(
+            dict(state_metrics.statuses), {"200": 1, "429": 1, STATUS_ERROR: 1}
+        )
+        self.assertEqual(state_metrics.rate_limited, 1)
+        self.assertEqual(state_metrics.retries, 2)
+        self.assertEqual(state_metrics.bytes_in, 100)
+        self.assertEqual(state_metrics.latency.counts, (1, 1, 1))
+        self.assertAlmostEqual(state_metrics.latency.sum, 5.55)
+        self.assertEqual(state_metrics.latency.quantile(0.5), 1.0)
+        self.assertEqual(state_metrics.latency.quantile(0.99), float("inf"))
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), [])
+
+    def test_commands_without_id_use_the_domain(self) -> None:
+        metrics = MetricsRegistry()
+        metrics.observe(TadoRequest(domain=Domain.ME, command=None), "GET", 200, 0.1)
+
+        self.assertEqual(metrics.snapshot()[0].command, str(Domain.ME))
+
+    def test_to_prometheus(self) -> None:
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        request = TadoRequest(command="zones/1/state", action=Action.GET)
+        metrics.observe(request, "GET", 200, 0.05, bytes_in=10)
+        metrics.observe(request, "GET", 429, 0.5)
+
+        text = metrics.to_prometheus()
+        labels = 'endpoint="MY_API",command="zones/{id}/state",method="GET"'
+
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn("# TYPE pytado_requests_total counter", text)
+        self.assertIn(f'pytado_requests_total{{{labels},status="200"}} 1', text)
+        self.assertIn(f'pytado_requests_total{{{labels},status="429"}} 1', text)
+        self.assertIn("# TYPE pytado_request_duration_seconds histogram", text)
+        self.assertIn(
+            f'pytado_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', text
+        )
+        self.assertIn(
+            f'pytado_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text
+        )
+        self.assertIn(f"pytado_request_duration_seconds_count{{{labels}}} 2", text)
+        self.assertIn(f"pytado_bytes_in_total{{{labels}}} 10", text)
+        self.assertIn(f"pytado_rate_limited_total{{{labels}}} 1", text)
+
+
+class HttpMetricsTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the metrics of Http.request."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.metrics = MetricsRegistry()
+        self.http._metrics = self.metrics
+
+    @responses.activate
+    def test_requests_are_recorded(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {}},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"errors": [{"code": "rateLimited"}]},
+            status=429,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/state",
+            body=ConnectionError("unreachable"),
+        )
+
+        self.tado_client.get_zone_states()
+        with self.assertRaises(TadoException):
+            self.tado_client.get_zone_states()
+        with self.assertRaises(ConnectionError):
+            self.tado_client.get_state(1)
+
+        self.assertIs(self.http.metrics, self.metrics)
+        zone_states, state = self.metrics.snapshot()
+
+        self.assertEqual(zone_states.command, "zoneStates")
+        self.assertEqual(dict(zone_states.statuses), {"200": 1, "429": 1})
+        self.assertEqual(zone_states.rate_limited, 1)
+        self.assertGreater(zone_states.bytes_in, 0)
+        self.assertEqual(zone_states.latency.count, 2)
+
+        self.assertEqual(state.command, "zones/{id}/state")
+        self.assertEqual(dict(state.statuses), {STATUS_ERROR: 1})
@@ -7,6 +7,8 @@ from unittest import mock
 import responses
 
 from PyTado.http import TadoRequest
+from PyTado.types import OverlayMode, Power
+from PyTado.zone import ZoneOverlay
 
 from . import common
 
@@ -184,3 +186,44 @@ class TadoTestCase(common.TadoBaseTestCase, is_x_line=False):
 
         # Verify the response
         self.assertEqual(response.max_flow_temperature, 50)
+
+    @responses.activate
+    def test_set_zone_overlays(self):
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json=json.loads(common.load_fixture("zones.json")),
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            "https://my.tado.com/api/v2/homes/1234/overlay",
+            status=204,
+        )
+        responses.add(
+            responses.DELETE,
+            "https://my.tado.com/api/v2/homes/1234/overlay?rooms=3",
+            status=204,
+        )
+
+        self.tado_client.set_zone_overlays(
+            {
+                1: ZoneOverlay(OverlayMode.MANUAL, set_temp=21.0),
+                2: ZoneOverlay(OverlayMode.MANUAL, power=Power.OFF),
+                3: None,
+            }
+        )
+
+        # one request sets both zones, one resets the third
+        posts = [call for call in responses.calls if call.request.method == "POST"]
+        self.assertEqual(len(posts), 1)
+        overlays = json.loads(posts[0].request.body)["overlays"]
+        self.assertEqual([overlay["room"] for overlay in overlays], [1, 2])
+        self.assertEqual(
+            [overlay["overlay"]["setting"]["type"] for overlay in overlays],
+            ["HEATING", "HOT_WATER"],
+        )
+        self.assertEqual(
+            overlays[0]["overlay"]["setting"]["temperature"], {"celsius": 21.0}
+        )
+        self.assertEqual(responses.calls[-1].request.method, "DELETE")
@@ -5,6 +5,7 @@ from datetime import datetime
 
 import responses
 
+from PyTado.exceptions import TadoException
 from PyTado.interface.api import Tado
 from PyTado.types import (
     FanLevel,
@@ -15,6 +16,7 @@ from PyTado.types import (
     Power,
     Presence,
     VerticalSwing,
+    ZoneType,
 )
 
 from . import common
@@ -301,3 +303,105 @@ class TadoZoneTestCase(common.TadoBaseTestCase, is_x_line=False):
         assert mode.current_hvac_mode == HvacMode.OFF
         assert mode.target_temp is None
         assert mode.available is True
+
+    @responses.activate
+    def test_zone_index_is_shared(self):
+        """Zone data of all zones is loaded with a single zones request."""
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json=json.loads(common.load_fixture("zones.json")),
+            status=200,
+        )
+
+        zones = self.tado_client.get_zones()
+
+        assert [zone.name for zone in zones] == ["Living Room", "Hot Water"]
+        assert self.tado_client.get_zone(2).zone_type == ZoneType.HOT_WATER
+        assert len(responses.calls) == 1
+
+        self.tado_client.refresh_zone_index()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_zone_index_unknown_zone(self):
+        """An unknown zone reloads the index once before failing."""
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json=json.loads(common.load_fixture("zones.json")),
+            status=200,
+        )
+
+        with self.assertRaises(TadoException):
+            self.tado_client.get_zone(3).name
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_zone_registry(self):
+        """Zone types and capabilities are loaded once per home."""
+        zones = responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones",
+            json=json.loads(common.load_fixture("zones.json")),
+            status=200,
+        )
+        capabilities = responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/capabilities",
+            json=json.loads(common.load_fixture("zone_with_swing_capabilities.json")),
+            status=200,
+        )
+        overlay = responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            json={},
+            status=200,
+        )
+
+        for _ in range(2):
+            self.tado_client.set_zone_overlay(1, OverlayMode.MANUAL, set_temp=20.0)
+            self.tado_client.get_capabilities(1)
+
+        assert overlay.call_count == 2
+        assert (zones.call_count, capabilities.call_count) == (1, 1)
+
+        self.tado_client.invalidate_zone_index()
+        self.tado_client.set_zone_overlay(1, OverlayMode.MANUAL, set_temp=20.0)
+        self.tado_client.get_capabilities(1)
+
+        assert (zones.call_count, capabilities.call_count) == (2, 2)
+
+    @responses.activate
+    def test_zone_objects_are_reused(self):
+        """get_zone() returns the same zone with its data until it is stale."""
+        clock = common.FakeClock()
+        self.tado_client._clock = clock
+        self.set_state_fixture("tadov2.heating.auto_mode.json")
+
+        zone = self.tado_client.get_zone(1)
+        self.tado_client.get_climate(1)
+        self.tado_client.get_window_state(1)
+
+        assert self.tado_client.get_zone(1) is zone
+        assert len(responses.calls) == 1
+
+        # the data expires after zone_ttl seconds
+        clock.now += self.tado_client.zone_ttl
+        self.tado_client.get_climate(1)
+        assert self.tado_client.get_zone(1) is zone
+        assert len(responses.calls) == 2
+
+        # and with every write of the client
+        responses.add(
+            responses.PUT,
+            "https://my.tado.com/api/v2/homes/1234/zones/1/overlay",
+            json={},
+            status=200,
+        )
+        self.tado_client.set_zone_overlay(
+            1, OverlayMode.MANUAL, set_temp=21.0, device_type=ZoneType.HEATING
+        )
+        self.tado_client.get_climate(1)
+        assert len(responses.calls) == 4
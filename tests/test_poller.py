@@ -0,0 +1,263 @@
+"""Test the adaptive poller."""
+
+import copy
+import json
+import threading
+import unittest
+from typing import Any
+
+import requests
+import responses
+
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.poller import _LOGGER as POLLER_LOGGER
+from PyTado.poller import Poller, PollingPolicy, Subscription, diff_states
+from PyTado.types import Presence
+
+from . import common
+
+ZONE_STATES_URL = "https://my.tado.com/api/v2/homes/1234/zoneStates"
+IDLE = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+OVERLAY = json.loads(common.load_fixture("tadov2.heating.manual_mode.json"))
+
+
+def state(raw: dict[str, Any], **changes: Any) -> dict[str, Any]:
+    raw = copy.deepcopy(raw)
+    raw.update(changes)
+    return raw
+
+
+def heating(raw: dict[str, Any], percentage: float) -> dict[str, Any]:
+    raw = copy.deepcopy(raw)
+    raw["activityDataPoints"]["heatingPower"]["percentage"] = percentage
+    return raw
+
+
+class DiffStatesTestCase(unittest.TestCase):
+    """Test cases for diff_states."""
+
+    def test_changed_fields(self) -> None:
+        old = {1: ZoneState.model_validate(IDLE), 2: ZoneState.model_validate(IDLE)}
+        reading = copy.deepcopy(IDLE)
+        reading["sensorDataPoints"]["insideTemperature"][
+            "timestamp"
+        ] = "2025-01-01T00:00:00Z"
+        new = {
+            1: ZoneState.model_validate(heating(IDLE, 40.0)),
+            2: ZoneState.model_validate(reading),
+            3: ZoneState.model_validate(IDLE),
+        }
+
+        changes = {change.zone_id: change for change in diff_states(old, new)}
+
+        # a new timestamp alone is no change
+        self.assertEqual(sorted(changes), [1, 3])
+        self.assertEqual(changes[1].fields, {"activity_data_points"})
+        self.assertIsNone(changes[3].old)
+
+        (removed,) = diff_states(new, {1: new[1], 2: new[2]})
+        self.assertEqual(removed.zone_id, 3)
+        self.assertIsNone(removed.new)
+
+
+class PollingPolicyTestCase(unittest.TestCase):
+    """Test cases for the PollingPolicy class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.policy = PollingPolicy(
+            min_interval=10, interval=60, max_interval=200, away_interval=900
+        )
+        self.idle = {1: ZoneState.model_validate(IDLE)}
+
+    def test_backs_off_while_idle(self) -> None:
+        intervals = [10.0]
+        for _ in range(5):
+            intervals.append(self.policy.next_interval(intervals[-1], self.idle, []))
+
+        self.assertEqual(intervals, [10, 60, 90, 135, 200, 200])
+
+    def test_active_zones(self) -> None:
+        for raw in (OVERLAY, heating(IDLE, 30.0), state(IDLE, openWindow=OPEN_WINDOW)):
+            states = {1: ZoneState.model_validate(raw)}
+            self.assertEqual(self.policy.next_interval(200, states, []), 10)
+
+    def test_away(self) -> None:
+        away = {1: ZoneState.model_validate(state(IDLE, tadoMode=Presence.AWAY))}
+
+        self.assertEqual(self.policy.next_interval(60, away, []), 900)
+
+    def test_rate_limit_budget(self) -> None:
+        # 100 requests left for the next 6000s, half of them for the poller
+        self.assertEqual(
+            self.policy.next_interval(10, self.idle, [], remaining=100, reset=6000), 120
+        )
+
+
+OPEN_WINDOW = {
+    "detectedTime": "2025-01-01T00:00:00Z",
+    "durationInSeconds": 900,
+    "expiry": "2025-01-01T00:15:00Z",
+    "remainingTimeInSeconds": 600,
+}
+
+
+class PollerTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the Poller class."""
+
+    def add_zone_states(self, *states: dict[str, Any]) -> None:
+        for zone_states in states:
+            responses.add(
+                responses.GET,
+                ZONE_STATES_URL,
+                json={"zoneStates": {"1": zone_states}},
+                headers={
+                    "RateLimit-Policy": '"perday";q=1000;w=86400',
+                    "RateLimit": '"perday";r=900;t=3600',
+                },
+            )
+
+    @responses.activate
+    def test_poll(self) -> None:
+        self.add_zone_states(IDLE, IDLE, heating(IDLE, 50.0), IDLE)
+        received: list[Any] = []
+        poller = Poller(
+            self.tado_client,
+            callback=received.append,
+            policy=PollingPolicy(min_interval=10, interval=60),
+        )
+
+        # the first poll reports every zone
+        (change,) = poller.poll()
+        self.assertIsNone(change.old)
+        self.assertEqual(poller.interval, 10)
+
+        self.assertEqual(poller.poll(), [])
+        self.assertEqual(poller.interval, 60)
+
+        (change,) = poller.poll()
+        self.assertEqual(change.fields, {"activity_data_points"})
+        self.assertEqual(poller.interval, 10)
+
+        poller.poll()
+        self.assertEqual(len(received), 3)
+        self.assertEqual(poller.states[1], ZoneState.model_validate(IDLE))
+
+    @responses.activate
+    def test_thread(self) -> None:
+        self.add_zone_states(IDLE)
+        polled = threading.Event()
+
+        with Poller(self.tado_client, callback=lambda _: polled.set()) as poller:
+            self.assertTrue(polled.wait(5))
+            self.assertTrue(poller.running)
+
+        self.assertFalse(poller.running)
+
+    @responses.activate
+    def test_thread_survives_errors(self) -> None:
+        responses.add(
+            responses.GET, ZONE_STATES_URL, body=requests.Timeout("read timed out")
+        )
+        self.add_zone_states(IDLE)
+        polled = threading.Event()
+        policy = PollingPolicy(error_interval=0.01)
+
+        poller = Poller(self.tado_client, policy=policy)
+
+        # the timeout is logged and a later poll still delivers the changes
+        with (
+            self.assertLogs(POLLER_LOGGER, "ERROR"),
+            poller.subscribe(lambda _: polled.set()),
+        ):
+            self.assertTrue(polled.wait(5))
+            self.assertTrue(poller.running)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertFalse(poller.running)
+
+    @responses.activate
+    def test_restart_while_stopping(self) -> None:
+        self.add_zone_states(IDLE)
+        polled = threading.Event()
+        release = threading.Event()
+
+        def block(_: Any) -> None:
+            polled.set()
+            release.wait(5)
+
+        poller = Poller(self.tado_client, callback=block).start()
+        self.assertTrue(polled.wait(5))
+        first = poller._thread
+        assert first is not None
+
+        # the join times out while the callback blocks the first thread
+        poller.stop(timeout=0.01)
+        self.assertFalse(poller.running)
+        poller.start()
+        release.set()
+
+        # the first thread exits, only the new one keeps polling
+        first.join(5)
+        self.assertFalse(first.is_alive())
+        self.assertTrue(poller.running)
+        poller.stop()
+        self.assertFalse(poller.running)
+
+
+class SubscriptionTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the subscriptions of a home."""
+
+    def test_select(self) -> None:
+        old = {1: ZoneState.model_validate(IDLE), 2: ZoneState.model_validate(IDLE)}
+        new = {
+            1: ZoneState.model_validate(heating(IDLE, 40.0)),
+            2: ZoneState.model_validate(state(IDLE, tadoMode=Presence.AWAY)),
+        }
+        changes = diff_states(old, new)
+        poller = Poller(self.tado_client)
+
+        by_zone = Subscription(poller, None, zone=2)
+        by_field = Subscription(poller, None, fields="tado_mode")
+        both = Subscription(poller, None, zone=[1], fields={"tado_mode"})
+
+        self.assertEqual([change.zone_id for change in by_zone.select(changes)], [2])
+        self.assertEqual([change.zone_id for change in by_field.select(changes)], [2])
+        self.assertEqual(both.select(changes), [])
+        # a removed zone has no changed fields but is always selected
+        (removed,) = both.select(diff_states(new, {2: new[2]}))
+        self.assertIsNone(removed.new)
+
+    @responses.activate
+    def test_subscribe(self) -> None:
+        subscribed = threading.Event()
+
+        def zone_states(_: Any) -> tuple[int, dict[str, str], str]:
+            # the first poll waits for both subscriptions
+            subscribed.wait(5)
+            return 200, {}, json.dumps({"zoneStates": {"1": IDLE, "2": OVERLAY}})
+
+        responses.add_callback(responses.GET, ZONE_STATES_URL, callback=zone_states)
+        received: list[list[int]] = []
+        polled = threading.Event()
+
+        def failing(_: Any) -> None:
+            raise ValueError("subscriber bug")
+
+        def overlays(changes: list[Any]) -> None:
+            received.append([change.zone_id for change in changes])
+            polled.set()
+
+        with self.assertLogs(POLLER_LOGGER, "ERROR"):
+            failed = self.tado_client.subscribe(failing)
+            with self.tado_client.subscribe(overlays, zone=2) as subscription:
+                subscribed.set()
+                self.assertTrue(polled.wait(5))
+                self.assertTrue(self.tado_client.poller.running)
+                failed.cancel()
+
+        # one shared poller, stopped with its last subscription
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(received, [[2]])
+        self.assertFalse(subscription.active)
+        self.assertFalse(self.tado_client.poller.running)
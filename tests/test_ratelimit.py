@@ -0,0 +1,149 @@
+"""Test the rate limit budget."""
+
+import unittest
+from unittest import mock
+
+import responses
+
+from PyTado.exceptions import TadoRateLimitException
+from PyTado.ratelimit import RateLimitBudget, RateLimitState, parse_rate_limit
+
+from . import common
+
+POLICY = '"perday";q=1000;w=86400'
+
+
+def headers(remaining: int, reset: int = 1000) -> dict[str, str]:
+    """RateLimit headers of a response"""
+    return {
+        "RateLimit-Policy": POLICY,
+        "RateLimit": f'"perday";r={remaining};t={reset}',
+    }
+
+
+class RateLimitBudgetTestCase(unittest.TestCase):
+    """Test cases for the RateLimitBudget class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = common.FakeClock()
+
+    def test_parse_rate_limit(self) -> None:
+        self.assertEqual(parse_rate_limit(POLICY), {"q": 1000, "w": 86400})
+        self.assertEqual(
+            parse_rate_limit('"perhour";r=80;t=10, "perday";r=20;t=1301'),
+            {"r": 20, "t": 1301},
+        )
+        self.assertEqual(parse_rate_limit(None), {})
+        self.assertEqual(parse_rate_limit("garbage"), {})
+
+    def test_tracks_headers(self) -> None:
+        budget = RateLimitBudget(clock=self.clock)
+        self.assertIsNone(budget.remaining(1))
+
+        budget.update(1, headers(250, reset=1301))
+
+        self.assertEqual(
+            budget.state(1),
+            RateLimitState(quota=1000, window=86400, remaining=250, reset=1301),
+        )
+        self.assertEqual(budget.remaining(1), 250)
+        self.assertIsNone(budget.state(2))
+
+        # tracking only, requests are never delayed
+        self.assertEqual(budget.acquire(1), 0)
+        self.assertEqual(budget.remaining(1), 249)
+
+        # the window is fixed, the quota is only refilled when it resets
+        self.clock.now = 864
+        self.assertEqual(budget.remaining(1), 249)
+        self.clock.now = 1301
+        self.assertEqual(budget.remaining(1), 1000)
+
+        # and again at the end of the next window
+        budget.acquire(1)
+        self.clock.now = 1301 + 86399
+        self.assertEqual(budget.remaining(1), 999)
+        self.clock.now = 1301 + 86400
+        self.assertEqual(budget.remaining(1), 1000)
+
+    def test_refills_at_rate_without_reset(self) -> None:
+        budget = RateLimitBudget(clock=self.clock)
+        budget.update(1, {"RateLimit-Policy": POLICY, "RateLimit": '"perday";r=250'})
+
+        self.clock.now = 864
+        self.assertEqual(budget.remaining(1), 260)
+
+    def test_throttle_spreads_reads(self) -> None:
+        budget = RateLimitBudget(throttle=True, clock=self.clock)
+        budget.update(1, headers(100, reset=100))
+
+        self.assertEqual(budget.acquire(1), 0)
+        self.assertAlmostEqual(budget.acquire(1), 1, places=2)
+        # writes are not delayed
+        self.assertEqual(budget.acquire(1, write=True), 0)
+
+    def test_throttle_spreads_reads_at_most_max_delay(self) -> None:
+        budget = RateLimitBudget(throttle=True, clock=self.clock)
+        budget.update(1, headers(1000, reset=86400))
+
+        # 86.4s apart would exceed max_delay
+        self.assertEqual(budget.acquire(1), 0)
+        self.assertAlmostEqual(budget.acquire(1), 60)
+
+    def test_throttle_keeps_reserve_for_writes(self) -> None:
+        budget = RateLimitBudget(throttle=True, reserve=5, clock=self.clock)
+        budget.update(1, headers(6, reset=5000))
+
+        self.assertEqual(budget.acquire(1), 0)
+        with self.assertRaises(TadoRateLimitException):
+            budget.acquire(1)
+        self.assertEqual(budget.acquire(1, write=True), 0)
+
+        budget.max_delay = 5000
+        # the reads wait for the reset of the quota
+        self.assertAlmostEqual(budget.acquire(1), 5000)
+
+    def test_retry_after_blocks_reads(self) -> None:
+        budget = RateLimitBudget(throttle=True, clock=self.clock)
+        budget.update(1, {**headers(0, reset=30), "Retry-After": "30"}, status=429)
+
+        self.assertEqual(budget.remaining(1), 0)
+        self.assertAlmostEqual(budget.acquire(1), 30)
+
+
+class HttpRateLimitTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the rate limit budget in Http.request."""
+
+    @responses.activate
+    def test_remaining_quota_from_every_response(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {}},
+            headers=headers(250),
+            status=200,
+        )
+
+        self.assertIsNone(self.http.remaining_quota)
+        self.tado_client.get_zone_states()
+        self.assertEqual(self.http.remaining_quota, 250)
+
+    @responses.activate
+    def test_throttled_reads_are_delayed(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {}},
+            headers=headers(10, reset=100),
+            status=200,
+        )
+        self.http._rate_limit = RateLimitBudget(throttle=True)
+
+        with mock.patch("PyTado.http.time.sleep") as sleep:
+            # the first request learns the rate limit, the second one is not delayed
+            for _ in range(3):
+                self.tado_client.get_zone_states()
+
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args.args[0], 10, delta=1)
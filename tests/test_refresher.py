@@ -0,0 +1,102 @@
+"""Test the background token refresher."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import requests
+import responses
+
+from PyTado.refresher import _LOGGER as REFRESHER_LOGGER
+from PyTado.refresher import TokenRefresher
+
+from . import common
+
+TOKEN_URL = "https://login.tado.com/oauth2/token"
+
+
+class TokenRefresherTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the TokenRefresher class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.http._token_refresh = "refresh"
+        self.http._headers = {**self.http._headers, "Authorization": "Bearer old"}
+
+    def watch_refresh(self) -> threading.Event:
+        """Event set once the token has been refreshed"""
+        refreshed = threading.Event()
+        set_oauth_header = self.http._set_oauth_header
+
+        def wrapper(data):
+            try:
+                return set_oauth_header(data)
+            finally:
+                refreshed.set()
+
+        self.http._set_oauth_header = wrapper
+        return refreshed
+
+    @responses.activate
+    def test_refreshes_before_expiry(self) -> None:
+        responses.add(
+            responses.POST,
+            TOKEN_URL,
+            json={"access_token": "new", "expires_in": 600, "refresh_token": "next"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {}},
+            status=200,
+        )
+        # due within the lead time of the refresher
+        self.http._refresh_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+        refreshed = self.watch_refresh()
+
+        with TokenRefresher(self.http, lead_time=60) as refresher:
+            self.assertTrue(refreshed.wait(5))
+            self.assertTrue(refresher.running)
+        self.assertFalse(refresher.running)
+
+        self.assertEqual(self.http._headers["Authorization"], "Bearer new")
+        self.assertEqual(self.http.refresh_token, "next")
+
+        # the request path finds a valid token
+        self.tado_client.get_zone_states()
+        self.assertEqual(
+            [call.request.method for call in responses.calls], ["POST", "GET"]
+        )
+
+    @responses.activate
+    def test_retries_after_timeout(self) -> None:
+        responses.add(responses.POST, TOKEN_URL, body=requests.Timeout("timed out"))
+        responses.add(
+            responses.POST,
+            TOKEN_URL,
+            json={"access_token": "new", "expires_in": 600, "refresh_token": "next"},
+            status=200,
+        )
+        self.http._refresh_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+        refreshed = self.watch_refresh()
+
+        with (
+            self.assertLogs(REFRESHER_LOGGER, "ERROR"),
+            TokenRefresher(self.http, lead_time=60, retry_interval=0.01),
+        ):
+            self.assertTrue(refreshed.wait(5))
+
+        self.assertEqual(self.http.refresh_token, "next")
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_waits_until_due(self) -> None:
+        self.http._refresh_at = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        refresher = TokenRefresher(self.http, lead_time=60).start()
+        refresher.stop(timeout=5)
+
+        self.assertFalse(refresher.running)
+        self.assertEqual(len(responses.calls), 0)
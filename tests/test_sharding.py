@@ -0,0 +1,173 @@
+"""Test the sharded poller."""
+
+import copy
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest import mock
+
+import responses
+
+from PyTado import sharding
+from PyTado.diff import HeatingPowerChanged
+from PyTado.sharding import ShardedPoller, ZoneDiff, poll_shard, shard_of
+
+from . import common
+
+IDLE = json.loads(common.load_fixture("tadov2.heating.auto_mode.json"))
+
+
+def heating(percentage: float) -> dict[str, Any]:
+    raw = copy.deepcopy(IDLE)
+    raw["activityDataPoints"]["heatingPower"]["percentage"] = percentage
+    return raw
+
+
+class ShardingTestCase(unittest.TestCase):
+    """Test cases for poll_shard and ShardedPoller."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        responses.start()
+        self.addCleanup(responses.reset)
+        self.addCleanup(responses.stop)
+        self.addCleanup(sharding._accounts.clear)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.account = os.path.join(directory.name, "account.json")
+        with open(self.account, "w", encoding="utf-8") as f:
+            json.dump({"refresh_token": "saved"}, f)
+        self.missing = os.path.join(directory.name, "missing.json")
+
+        self.token = responses.add(
+            responses.POST,
+            "https://login.tado.com/oauth2/token",
+            json={
+                "access_token": "value",
+                "expires_in": 1000,
+                "refresh_token": "another_value",
+            },
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/me",
+            json=json.loads(common.load_fixture("home_1234/my_api_v2_me.json")),
+        )
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/",
+            json=json.loads(
+                common.load_fixture("home_1234/tadov2.my_api_v2_home_state.json")
+            ),
+        )
+
+    def add_zone_states(self, *zone_states: dict[str, Any]) -> None:
+        for raw in zone_states:
+            responses.add(
+                responses.GET,
+                "https://my.tado.com/api/v2/homes/1234/zoneStates",
+                json={"zoneStates": {"1": raw}},
+            )
+
+    def test_poll_shard(self) -> None:
+        self.add_zone_states(IDLE, IDLE, heating(50.0))
+
+        # the first poll reports every zone, an unusable account an error
+        (added,), (error,) = poll_shard([self.account, self.missing])
+        self.assertEqual(
+            (added.account, added.home_id, added.zone_id), (self.account, 1234, 1)
+        )
+        self.assertIsNone(added.old)
+        self.assertEqual(error.account, self.missing)
+
+        self.assertEqual(poll_shard([self.account]), ([], []))
+
+        (changed,), _ = poll_shard([self.account])
+        self.assertEqual(
+            pickle.loads(pickle.dumps(changed)).events,
+            [HeatingPowerChanged(1, 0.0, 50.0)],
+        )
+        # the worker logged in once
+        self.assertEqual(self.token.call_count, 1)
+
+    def test_login_failure_keeps_token_file(self) -> None:
+        responses.replace(
+            responses.GET, "https://my.tado.com/api/v2/me", json={}, status=429
+        )
+
+        _, (error,) = poll_shard([self.account])
+
+        # no device flow in the worker, the token may work again with the next poll
+        self.assertEqual(error.account, self.account)
+        self.assertTrue(os.path.exists(self.account))
+        self.assertFalse(
+            any("device_authorize" in call.request.url for call in responses.calls)
+        )
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_transient_error_keeps_login_and_states(self, sleep: mock.Mock) -> None:
+        self.add_zone_states(IDLE)
+        # the first attempt and every retry of the client
+        for _ in range(6):
+            responses.add(
+                responses.GET,
+                "https://my.tado.com/api/v2/homes/1234/zoneStates",
+                status=503,
+            )
+        self.add_zone_states(IDLE)
+
+        poll_shard([self.account])
+        _, (error,) = poll_shard([self.account])
+
+        # compared with the poll before the error, without logging in again
+        self.assertEqual(error.account, self.account)
+        self.assertEqual(poll_shard([self.account]), ([], []))
+        self.assertEqual(self.token.call_count, 1)
+
+    def test_rejected_credentials_log_in_again(self) -> None:
+        self.add_zone_states(IDLE)
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            status=401,
+        )
+        self.add_zone_states(IDLE)
+
+        poll_shard([self.account])
+        poll_shard([self.account])
+        (added,), _ = poll_shard([self.account])
+
+        self.assertIsNone(added.old)
+        self.assertEqual(self.token.call_count, 2)
+
+    def test_invalid_response_fails_only_its_account(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json={"zoneStates": {"1": {"setting": "invalid"}}},
+        )
+
+        diffs, (error,) = poll_shard([self.account])
+
+        self.assertEqual(diffs, [])
+        self.assertEqual(error.account, self.account)
+
+    def test_sharded_poller(self) -> None:
+        self.add_zone_states(IDLE)
+        accounts = [self.account, self.missing, "a.json", "b.json", "c.json"]
+
+        with ShardedPoller(
+            accounts, shards=3, executor=lambda: ThreadPoolExecutor(1)
+        ) as poller:
+            diffs = poller.poll()
+
+        self.assertEqual(sorted(sum(poller.shards, [])), sorted(accounts))
+        for index, shard in enumerate(poller.shards):
+            self.assertTrue(all(shard_of(account, 3) == index for account in shard))
+        self.assertEqual([type(diff) for diff in diffs], [ZoneDiff])
+        self.assertEqual(len(poller.errors), 4)
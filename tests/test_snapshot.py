@@ -0,0 +1,149 @@
+"""Test the HomeSnapshot object."""
+
+import json
+
+import responses
+
+from PyTado.interface.api import Tado, TadoX
+from PyTado.types import ZoneType
+from PyTado.zone import HomeSnapshot
+
+from . import common
+
+
+def zone_states(**states: str) -> dict:
+    """zoneStates response with the given state fixture per zone id"""
+    return {
+        "zoneStates": {
+            zone_id.removeprefix("zone_"): json.loads(common.load_fixture(filename))
+            for zone_id, filename in states.items()
+        }
+    }
+
+
+def rooms(*filenames: str) -> list:
+    """rooms response with the given room state fixtures, numbered from 1"""
+    result = []
+    for room_id, filename in enumerate(filenames, start=1):
+        room = json.loads(common.load_fixture(filename))
+        room["id"] = room_id
+        room["name"] = f"Room {room_id}"
+        result.append(room)
+    return result
+
+
+class HomeSnapshotTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for the snapshot of a pre line X home"""
+
+    tado_client: Tado
+
+    @responses.activate
+    def test_snapshot_uses_single_request(self):
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json=zone_states(
+                zone_1="tadov2.heating.auto_mode.json",
+                zone_2="tadov2.water_heater.auto_mode.json",
+            ),
+            status=200,
+        )
+
+        snapshot = self.tado_client.get_snapshot()
+
+        assert isinstance(snapshot, HomeSnapshot)
+        assert list(snapshot) == [1, 2]
+        assert snapshot[1].current_temp == 20.65
+        assert snapshot[1].setting.type == ZoneType.HEATING
+        assert snapshot[2].setting.type == ZoneType.HOT_WATER
+        assert snapshot[2].target_temp == 65.0
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_refresh_updates_zone_objects(self):
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json=zone_states(zone_1="tadov2.heating.auto_mode.json"),
+            status=200,
+        )
+
+        snapshot = self.tado_client.get_snapshot()
+        zone = snapshot[1]
+        taken_at = snapshot.taken_at
+
+        responses.replace(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json=zone_states(
+                zone_1="tadov2.heating.off_mode.json",
+                zone_2="tadov2.water_heater.auto_mode.json",
+            ),
+            status=200,
+        )
+        snapshot.refresh()
+
+        assert snapshot[1] is zone
+        assert zone.target_temp is None
+        assert 2 in snapshot
+        assert snapshot.taken_at >= taken_at
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_snapshot_outlives_zone_ttl(self):
+        """The snapshot zones are not the stale objects of get_zone()."""
+        clock = common.FakeClock()
+        self.tado_client._clock = clock
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json=zone_states(zone_1="tadov2.heating.auto_mode.json"),
+            status=200,
+        )
+
+        snapshot = self.tado_client.get_snapshot()
+        self.tado_client.get_zone(1)
+        clock.now += self.tado_client.zone_ttl
+        self.tado_client.get_zone(1)
+
+        assert snapshot[1] is not self.tado_client.get_zone(1)
+        assert snapshot[1].current_temp == 20.65
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_zone_states_keeps_string_keys(self):
+        responses.add(
+            responses.GET,
+            "https://my.tado.com/api/v2/homes/1234/zoneStates",
+            json=zone_states(zone_1="tadov2.heating.auto_mode.json"),
+            status=200,
+        )
+
+        assert list(self.tado_client.get_zone_states()) == ["1"]
+
+
+class HomeSnapshotXTestCase(common.TadoBaseTestCase, is_x_line=True):
+    """Test cases for the snapshot of a Tado X home"""
+
+    tado_client: TadoX
+
+    @responses.activate
+    def test_snapshot_uses_single_request(self):
+        responses.add(
+            responses.GET,
+            "https://hops.tado.com/homes/1234/rooms",
+            json=rooms(
+                "home_1234/tadox.heating.auto_mode.json",
+                "home_1234/tadox.heating.manual_mode.json",
+            ),
+            status=200,
+        )
+
+        snapshot = self.tado_client.get_snapshot()
+
+        assert list(snapshot) == [1, 2]
+        assert snapshot[1].current_temp == 24.0
+        assert snapshot[2].current_temp == 24.07
+        assert snapshot[2].target_temp == 20.0
+        assert snapshot.states[2].name == "Room 2"
+        assert len(responses.calls) == 1
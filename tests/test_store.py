@@ -0,0 +1,144 @@
+"""Test the local store of the day reports."""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import UTC, date, datetime
+
+import responses
+from responses import matchers
+
+from PyTado.interface.api.historic_range import report_days
+from PyTado.models import HistoricColumns
+from PyTado.store import HistoricStore
+
+from . import common
+
+DAY_REPORT = common.load_fixture("history.zone_day_report.json")
+REPORT = HistoricColumns.from_json(DAY_REPORT)
+# the fixture report ends on 2025-04-07 22:15 UTC
+AFTER_END = datetime(2025, 4, 8, tzinfo=UTC).timestamp()
+BEFORE_END = datetime(2025, 4, 7, 12, tzinfo=UTC).timestamp()
+
+
+class HistoricStoreTestCase(unittest.TestCase):
+    """Test cases for the HistoricStore class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = AFTER_END
+        self.store = HistoricStore(clock=lambda: self.now)
+        self.addCleanup(self.store.close)
+
+    def assertReportEqual(self, left: HistoricColumns, right: HistoricColumns) -> None:
+        self.assertEqual(repr(left), repr(right))
+
+    def test_put_and_get(self) -> None:
+        self.assertIsNone(self.store.get(1234, 1, date(2025, 4, 7)))
+
+        self.store.put(1234, 1, date(2025, 4, 7), REPORT)
+
+        self.assertReportEqual(self.store.get(1234, 1, date(2025, 4, 7)), REPORT)
+        self.assertIsNone(self.store.get(1234, 2, date(2025, 4, 7)))
+        self.assertIsNone(self.store.get(4321, 1, date(2025, 4, 7)))
+
+    def test_get_range(self) -> None:
+        for day in (date(2025, 4, 5), date(2025, 4, 7), date(2025, 4, 6)):
+            self.store.put(1234, 1, day, REPORT)
+
+        year = self.store.get_range(1234, 1, date(2025, 1, 1), date(2025, 12, 31))
+
+        assert year is not None
+        self.assertReportEqual(year, HistoricColumns.concat([REPORT] * 3))
+        self.assertEqual(
+            self.store.days(1234, 1),
+            [date(2025, 4, 5), date(2025, 4, 6), date(2025, 4, 7)],
+        )
+        self.assertIsNone(
+            self.store.get_range(1234, 1, date(2024, 1, 1), date(2024, 12, 31))
+        )
+
+    def test_replaces_reports(self) -> None:
+        self.store.put(1234, 1, date(2025, 4, 7), HistoricColumns.from_json({}))
+        self.store.put(1234, 1, date(2025, 4, 7), REPORT)
+
+        self.assertReportEqual(self.store.get(1234, 1, date(2025, 4, 7)), REPORT)
+
+    def test_missing_days(self) -> None:
+        self.store.put(1234, 1, date(2025, 4, 6), REPORT)
+        self.now = BEFORE_END
+        self.store.put(1234, 1, date(2025, 4, 7), REPORT)
+
+        self.assertEqual(
+            self.store.missing(1234, [1, 2], date(2025, 4, 6), date(2025, 4, 7)),
+            {
+                # fetched before the end of the report, may still change
+                1: [date(2025, 4, 7)],
+                2: [date(2025, 4, 6), date(2025, 4, 7)],
+            },
+        )
+
+    def test_persists(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "historic.sqlite")
+            with HistoricStore(path) as store:
+                store.put(1234, 1, date(2025, 4, 7), REPORT)
+            with HistoricStore(path) as store:
+                self.assertReportEqual(store.get(1234, 1, date(2025, 4, 7)), REPORT)
+
+
+class HistoricStoreSyncTestCase(common.TadoBaseTestCase, is_x_line=False):
+    """Test cases for HistoricStore.sync."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = AFTER_END
+        self.store = HistoricStore(clock=lambda: self.now)
+        self.addCleanup(self.store.close)
+
+    def add_day_reports(self, zone: int, start: date, end: date) -> None:
+        for day in report_days(start, end):
+            responses.add(
+                responses.GET,
+                f"https://my.tado.com/api/v2/homes/1234/zones/{zone}/dayReport",
+                match=[matchers.query_param_matcher({"date": day.isoformat()})],
+                json=json.loads(DAY_REPORT),
+            )
+
+    def day_report_calls(self) -> list[str]:
+        return [
+            call.request.url or ""
+            for call in responses.calls
+            if "dayReport" in (call.request.url or "")
+        ]
+
+    @responses.activate
+    def test_sync_fetches_only_missing_days(self) -> None:
+        self.add_day_reports(1, date(2025, 4, 1), date(2025, 4, 7))
+        self.add_day_reports(2, date(2025, 4, 1), date(2025, 4, 7))
+        self.store.put(1234, 1, date(2025, 4, 3), REPORT)
+        self.now = BEFORE_END
+        self.store.put(1234, 2, date(2025, 4, 7), REPORT)
+        self.now = AFTER_END
+
+        fetched = self.store.sync(
+            self.tado_client, [1, 2], date(2025, 4, 1), date(2025, 4, 7)
+        )
+
+        # all days but 2025-04-03 of zone 1, the incomplete day of zone 2 again
+        self.assertEqual(fetched, 13)
+        self.assertEqual(len(self.day_report_calls()), 13)
+        self.assertNotIn(
+            "zones/1/dayReport?date=2025-04-03", " ".join(self.day_report_calls())
+        )
+
+        # everything is complete now
+        responses.calls.reset()
+        self.assertEqual(
+            self.store.sync(
+                self.tado_client, [1, 2], date(2025, 4, 1), date(2025, 4, 7)
+            ),
+            0,
+        )
+        self.assertEqual(self.day_report_calls(), [])
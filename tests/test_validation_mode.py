@@ -0,0 +1,50 @@
+"""Test the production validation mode of the models."""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from PyTado.models.pre_line_x.zone import DazzleMode
+from PyTado.models.util import DEBUG_VALIDATION, LOGGER
+
+ROOT = Path(__file__).parent.parent
+
+SCRIPT = """
+from PyTado.models.pre_line_x.zone import ZoneState
+from PyTado.models.util import Base
+from tests.common import load_fixture
+
+assert not Base.__pydantic_decorators__.model_validators
+assert not ZoneState.__pydantic_decorators__.model_validators
+state = ZoneState.model_validate_json(load_fixture("tadov2.heating.auto_mode.json"))
+print(state.setting.power)
+"""
+
+
+class ValidationModeTestCase(unittest.TestCase):
+    """Test cases for PYTADO_VALIDATION_MODE."""
+
+    @unittest.skipUnless(DEBUG_VALIDATION, "tests run in production validation mode")
+    def test_debug_mode_logs_extra_keys(self) -> None:
+        with self.assertLogs(LOGGER, "WARNING") as logs:
+            DazzleMode.model_validate({"supported": True, "newKey": 1})
+
+        self.assertIn("has extra key: newKey", logs.output[0])
+
+    def test_production_mode_drops_the_wrap_validator(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            cwd=ROOT,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(ROOT),
+                "PYTADO_VALIDATION_MODE": "production",
+            },
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "ON")